@@ -0,0 +1,150 @@
+import time
+
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt6.QtGui import QColor, QGuiApplication
+
+RAINBOW_DEGREES_PER_SECOND = 40  # One full cycle every 9 seconds
+
+
+def rainbow_hue(phase=0, now=None):
+    """Hue in degrees for an animated rainbow, a pure function of time and phase.
+
+    Everything drawn in rainbow colours reads the same clock, so repainting
+    a cell at any moment gives the right colour with no per-frame state.
+    """
+    if now is None:
+        now = time.monotonic()
+    return (now * RAINBOW_DEGREES_PER_SECOND + phase) % 360
+
+
+def rainbow_color(phase=0, now=None):
+    """Bright, fully saturated colour at the current rainbow hue plus phase degrees."""
+    return QColor.fromHsvF(rainbow_hue(phase, now) / 360.0, 1.0, 1.0)
+
+
+class _Subscription:
+    def __init__(self, widget, callback, interval):
+        self.widget = widget
+        self.callback = callback
+        self.interval = interval  # None = every frame
+        self.next_due = 0.0
+
+    def visibility(self):
+        """'active', 'covered' (shown but not exposed) or 'hidden'."""
+        try:
+            if not self.widget.isVisible() or self.widget.window().isMinimized():
+                return "hidden"
+            handle = self.widget.window().windowHandle()
+        except RuntimeError:
+            return "hidden"  # Widget already deleted
+        if handle is not None and not handle.isExposed():
+            return "covered"
+        return "active"
+
+
+class AnimationClock(QObject):
+    """One app-wide tick that drives every animation and periodic refresh.
+
+    Callbacks are registered against a widget and only run while that
+    widget is visible in a window that is neither minimized nor covered.
+    With nothing to run the timer stops, and showing or restoring a window
+    wakes it up again. While the application is in the background the
+    frame rate drops to IDLE_FRAME_INTERVAL. Intervals longer than a frame
+    (e.g. a live game poll) are kept as they are.
+    """
+
+    FRAME_INTERVAL = 1 / 60
+    IDLE_FRAME_INTERVAL = 0.25
+    COVERED_CHECK_INTERVAL = 0.5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscriptions = []
+        self._watched = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(lambda state: self._schedule())
+
+    def subscribe(self, widget, callback, interval=None):
+        """Call callback(now) every frame, or every interval seconds, while widget is shown.
+
+        now is time.monotonic(). Returns a handle for unsubscribe().
+        """
+        subscription = _Subscription(widget, callback, interval)
+        self._subscriptions.append(subscription)
+        window = widget.window()
+        if window not in self._watched:
+            self._watched.add(window)
+            window.installEventFilter(self)
+            window.destroyed.connect(lambda obj=None, w=window: self._forget(w))
+        widget.destroyed.connect(lambda obj=None, s=subscription: self.unsubscribe(s))
+        self._schedule()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def is_idle(self):
+        """True while the application is in the background."""
+        app = QGuiApplication.instance()
+        return app is not None and app.applicationState() != Qt.ApplicationState.ApplicationActive
+
+    def frame_interval(self):
+        return self.IDLE_FRAME_INTERVAL if self.is_idle() else self.FRAME_INTERVAL
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange):
+            self._schedule()
+        return False
+
+    def _forget(self, window):
+        self._watched.discard(window)
+        self._subscriptions = [s for s in self._subscriptions if s.widget is not window]
+
+    def _tick(self):
+        now = time.monotonic()
+        frame = self.frame_interval()
+        for subscription in list(self._subscriptions):
+            if now < subscription.next_due or subscription.visibility() != "active":
+                continue
+            subscription.next_due = now + max(subscription.interval or 0, frame)
+            try:
+                subscription.callback(now)
+            except Exception as e:
+                print(f"Animation callback failed: {e}")
+        self._schedule(now)
+
+    def _schedule(self, now=None):
+        if now is None:
+            now = time.monotonic()
+        wake = None
+        for subscription in self._subscriptions:
+            state = subscription.visibility()
+            if state == "active":
+                due = subscription.next_due
+            elif state == "covered":
+                # No event tells us when a covered window is uncovered
+                due = now + self.COVERED_CHECK_INTERVAL
+            else:
+                continue  # Show/WindowStateChange events wake the clock
+            wake = due if wake is None else min(wake, due)
+        if wake is None:
+            self._timer.stop()
+        else:
+            self._timer.start(max(0, int((wake - now) * 1000)))
+
+
+_animation_clock = None
+
+
+def get_animation_clock():
+    """Return the shared AnimationClock, creating it on first use."""
+    global _animation_clock
+    if _animation_clock is None:
+        _animation_clock = AnimationClock()
+    return _animation_clock
@@ -1,36 +1,112 @@
-from PyQt6.QtWidgets import QStyledItemDelegate
-from PyQt6.QtGui import QColor, QPainter, QPen
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+from PyQt6.QtGui import QColor, QFont, QPainter, QPalette, QPen, QStaticText
+from models import FAVORITE_ROLE, HIGHLIGHT_ROLE, RANK_ROLE, TEAM_ROLE
 
 
 class HighlightDelegate(QStyledItemDelegate):
-    def __init__(self, highlight_rows, parent=None):
+    """Draws a white border around cells whose HIGHLIGHT_ROLE is set."""
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlight_rows = highlight_rows
-        self.parent_table = parent
+        self.pen = QPen(QColor("white"), 2)
 
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
-        if index.row() in self.highlight_rows:
+        if index.data(HIGHLIGHT_ROLE):
             painter.save()
-            pen = QPen(QColor("white"), 2)
-            painter.setPen(pen)
-            rect = option.rect
-            painter.drawRect(rect)
+            painter.setPen(self.pen)
+            painter.drawRect(option.rect)
             painter.restore()
 
 
-class FavoriteDelegate(QStyledItemDelegate):
-    def __init__(self, favorite_rows, parent=None):
+class StandingsDelegate(QStyledItemDelegate):
+    """Paints the standings table, including its decorations.
+
+    The logo is drawn from the shared LogoAtlas. The favorite star and rank
+    arrows are cached QStaticText, and favorite rows get a white border.
+    Pens, fonts and texts are made once and reused by every paint.
+    """
+
+    TEXT_MARGIN = 3
+
+    def __init__(self, logo_atlas, rank_col, logo_col, parent=None):
         super().__init__(parent)
-        self.favorite_rows = favorite_rows
+        self.logo_atlas = logo_atlas
+        self.rank_col = rank_col
+        self.logo_col = logo_col
+        self.border_pen = QPen(QColor("white"), 2)
+        self.error_font = QFont()
+        self.error_font.setPixelSize(8)
+        self._pens = {}
+        self._texts = {}
+
+    def pen(self, color):
+        key = color.rgba()
+        if key not in self._pens:
+            self._pens[key] = QPen(color)
+        return self._pens[key]
+
+    def static_text(self, text):
+        if text not in self._texts:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            self._texts[text] = static
+        return self._texts[text]
 
     def paint(self, painter, option, index):
-        super().paint(painter, option, index)
-        if index.row() in self.favorite_rows:
+        if index.column() == self.rank_col:
+            self.paint_rank(painter, option, index)
+        elif index.column() == self.logo_col:
+            self.paint_logo(painter, option, index)
+        else:
+            super().paint(painter, option, index)
+        if index.data(FAVORITE_ROLE):
             painter.save()
-            pen = QPen(QColor("white"), 2)
-            painter.setPen(pen)
-            rect = option.rect
-            painter.drawRect(rect)
+            painter.setPen(self.border_pen)
+            painter.drawRect(option.rect)
             painter.restore()
 
+    def paint_background(self, painter, option, index):
+        """Draw the cell's background/selection without text; returns the style option."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        return opt
+
+    def paint_rank(self, painter, option, index):
+        opt = self.paint_background(painter, option, index)
+        parts = index.data(RANK_ROLE)
+        if not parts:
+            return
+        color = index.data(Qt.ItemDataRole.ForegroundRole)
+        if color is None:
+            color = opt.palette.color(QPalette.ColorRole.Text)
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(self.pen(color))
+        x = option.rect.left() + self.TEXT_MARGIN
+        for part in parts:
+            if not part:
+                continue
+            static = self.static_text(part)
+            size = static.size()
+            y = option.rect.top() + (option.rect.height() - size.height()) / 2
+            painter.drawStaticText(QPointF(x, y), static)
+            x += size.width()
+        painter.restore()
+
+    def paint_logo(self, painter, option, index):
+        self.paint_background(painter, option, index)
+        abbrev = index.data(TEAM_ROLE)
+        if self.logo_atlas.draw(painter, option.rect, abbrev):
+            return
+        error = index.data(Qt.ItemDataRole.DisplayRole)
+        if error:
+            painter.save()
+            painter.setFont(self.error_font)
+            painter.setPen(self.pen(QColor("red")))
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, error)
+            painter.restore()
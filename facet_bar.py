@@ -0,0 +1,136 @@
+from PyQt6.QtCore import QDate, Qt, pyqtSignal
+from PyQt6.QtWidgets import QCheckBox, QComboBox, QDateEdit, QHBoxLayout, QLabel, QPushButton, QWidget
+
+
+class FacetBar(QWidget):
+    """Row of facet filters (team, opponent, venue, ...) for a games table.
+
+    Combo boxes list the values found in a GameFacets index; "Any" leaves
+    a facet unfiltered. filters_changed carries a dict of keyword
+    arguments for GameFacets.mask() / GamesProxy.set_facet_filters().
+    """
+
+    filters_changed = pyqtSignal(dict)
+
+    # facet -> (label, GameFacets bits table its values come from, or fixed values)
+    COMBOS = {
+        "team": ("Team", "team"),
+        "opponent": ("Opponent", "team"),
+        "side": ("Home/Away", [("Home", "home"), ("Away", "away")]),
+        "result": ("Result", [("Win", "win"), ("Loss", "loss")]),
+        "period": ("OT/SO", "period"),
+        "venue": ("Venue", "venue"),
+        "tv": ("TV", "tv"),
+    }
+
+    def __init__(self, facets=("team", "opponent", "side", "result", "period", "venue", "tv", "dates"), parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(4, 2, 4, 2)
+        self.combos = {}
+        for facet in facets:
+            if facet not in self.COMBOS:
+                continue
+            label, values = self.COMBOS[facet]
+            combo = QComboBox()
+            combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
+            combo.setToolTip(label)
+            combo.addItem(f"{label}: Any", None)
+            if not isinstance(values, str):
+                for text, value in values:
+                    combo.addItem(text, value)
+            combo.currentIndexChanged.connect(self.emit_filters)
+            layout.addWidget(combo)
+            self.combos[facet] = combo
+
+        self.update_team_facets()
+
+        self.date_check = None
+        if "dates" in facets:
+            self.date_check = QCheckBox("Dates")
+            self.date_from = QDateEdit()
+            self.date_to = QDateEdit()
+            for edit in (self.date_from, self.date_to):
+                edit.setCalendarPopup(True)
+                edit.setDisplayFormat("yyyy-MM-dd")
+                edit.setEnabled(False)
+                edit.dateChanged.connect(self.emit_filters)
+            self.date_check.toggled.connect(self.date_from.setEnabled)
+            self.date_check.toggled.connect(self.date_to.setEnabled)
+            self.date_check.toggled.connect(self.emit_filters)
+            layout.addWidget(self.date_check)
+            layout.addWidget(self.date_from)
+            layout.addWidget(QLabel("to"))
+            layout.addWidget(self.date_to)
+
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        layout.addWidget(clear_button)
+        layout.addStretch()
+
+    def set_facets(self, facets):
+        """Refresh the combo values from a GameFacets index, keeping the selections."""
+        for facet, combo in self.combos.items():
+            table = self.COMBOS[facet][1]
+            if not isinstance(table, str):
+                continue
+            values = facets.values(table)
+            if [combo.itemData(i) for i in range(1, combo.count())] == values:
+                continue
+            current = combo.currentData()
+            combo.blockSignals(True)
+            while combo.count() > 1:
+                combo.removeItem(1)
+            for value in values:
+                combo.addItem(value, value)
+            combo.setCurrentIndex(max(0, combo.findData(current)))
+            combo.blockSignals(False)
+
+        dates = facets.values("date")
+        if self.date_check is not None and dates:
+            # The allowed range always follows the loaded games; the chosen
+            # dates follow it too until the user turns the date filter on
+            first = QDate.fromString(dates[0], Qt.DateFormat.ISODate)
+            last = QDate.fromString(dates[-1], Qt.DateFormat.ISODate)
+            checked = self.date_check.isChecked()
+            before = (self.date_from.date(), self.date_to.date())
+            for edit, date in ((self.date_from, first), (self.date_to, last)):
+                edit.blockSignals(True)
+                edit.setDateRange(first, last)  # Clamps the current date
+                if not checked:
+                    edit.setDate(date)
+                edit.blockSignals(False)
+            if checked and (self.date_from.date(), self.date_to.date()) != before:
+                self.emit_filters()
+
+    def filters(self):
+        filters = {facet: combo.currentData() for facet, combo in self.combos.items() if combo.isEnabled()}
+        if self.date_check is not None and self.date_check.isChecked():
+            filters["date_from"] = self.date_from.date().toString(Qt.DateFormat.ISODate)
+            filters["date_to"] = self.date_to.date().toString(Qt.DateFormat.ISODate)
+        return filters
+
+    def update_team_facets(self):
+        """Home/away and result are relative to the selected team, so need one."""
+        has_team = "team" in self.combos and self.combos["team"].currentData() is not None
+        for facet in ("side", "result"):
+            if facet in self.combos:
+                self.combos[facet].setEnabled(has_team)
+
+    def emit_filters(self, *args):
+        self.update_team_facets()
+        self.filters_changed.emit(self.filters())
+
+    def clear(self):
+        for combo in self.combos.values():
+            combo.blockSignals(True)
+            combo.setCurrentIndex(0)
+            combo.blockSignals(False)
+        self.update_team_facets()
+        if self.date_check is not None:
+            self.date_check.blockSignals(True)
+            self.date_check.setChecked(False)
+            self.date_check.blockSignals(False)
+            self.date_from.setEnabled(False)
+            self.date_to.setEnabled(False)
+        self.emit_filters()
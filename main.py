@@ -1,11 +1,39 @@
+import argparse
 import sys
-from PyQt6.QtWidgets import QApplication
-from windows.main_window import MainWindow
+
+
+def run_sync():
+    """Headless: bring the local season cache up to date (e.g. from cron) and exit."""
+    from services import get_data_service
+
+    data_service = get_data_service()
+
+    def report(done, total, date):
+        print(f"\rSyncing schedule {done}/{total} ({date})", end="\n" if done == total else "", flush=True)
+
+    try:
+        # Progress only on a terminal, so cron logs stay one line per run
+        days, standings_days = data_service.sync_season(
+            progress_callback=report if sys.stdout.isatty() else None)
+    except Exception as e:
+        print(f"Sync failed: {e}")
+        return 1
+    print(f"Synced {days} schedule days; archived standings for {standings_days} new days")
+    return 0
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="NHL Stats")
+    parser.add_argument("--sync", action="store_true",
+                        help="update the local season cache without opening the GUI, then exit")
+    args, qt_args = parser.parse_known_args()
+    if args.sync:
+        sys.exit(run_sync())
+
+    from PyQt6.QtWidgets import QApplication
+    from windows.main_window import MainWindow
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
-
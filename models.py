@@ -0,0 +1,914 @@
+import datetime
+
+import numpy as np
+from PyQt6.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from animation import rainbow_color
+from services import PlayoffPicture, is_game_final
+from services.logos import INVALID_IMAGE
+
+TEAM_ROLE = Qt.ItemDataRole.UserRole           # Team abbreviation for the row
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1       # Value the column sorts by
+FAVORITE_ROLE = Qt.ItemDataRole.UserRole + 2   # True for favorite teams' rows
+RANK_ROLE = Qt.ItemDataRole.UserRole + 3       # (star, rank, arrow) strings for the Rank column
+GAME_ROLE = Qt.ItemDataRole.UserRole + 4       # Schedule game dict for a games table row
+HIGHLIGHT_ROLE = Qt.ItemDataRole.UserRole + 5  # True for games on the highlighted date
+
+BETTER_COLOR = QColor("green")
+WORSE_COLOR = QColor("red")
+
+
+def _number(value, default=0, cast=int):
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class StandingsColumns:
+    """One standings snapshot stored column-wise, with every sort order precomputed.
+
+    Each stat is read out of the API dicts once into its own list. From
+    those, every table column gets a list of sort values, and each column
+    is sorted once in both directions. The sorts are stable, so ties keep
+    the API order. A header click then just reuses a stored row order.
+    """
+
+    INT_STATS = {
+        "leagueSequence": 999, "gamesPlayed": 0, "wins": 0, "losses": 0, "otLosses": 0,
+        "points": 0, "regulationPlusOtWins": 0, "goalFor": 0, "goalAgainst": 0,
+        "goalDifferential": 0, "homeWins": 0, "homeLosses": 0, "homeOtLosses": 0,
+        "roadWins": 0, "roadLosses": 0, "roadOtLosses": 0, "l10Wins": 0, "l10Losses": 0,
+        "l10OtLosses": 0, "streakCount": 0, "regulationWins": 0, "shootoutWins": 0,
+        "shootoutLosses": 0, "conferenceSequence": 999, "divisionSequence": 999,
+        "wildcardSequence": 999,
+    }
+
+    def __init__(self, teams=()):
+        teams = list(teams)
+        self.size = len(teams)
+        self.abbrevs = [team.get("teamAbbrev", {}).get("default", "") for team in teams]
+        self.stats = {
+            key: [_number(team.get(key, default), default) for team in teams]
+            for key, default in self.INT_STATS.items()
+        }
+        self.stats["pointPctg"] = [_number(team.get("pointPctg", 0), 0.0, float) for team in teams]
+        self.streak_codes = [team.get("streakCode", "") for team in teams]
+        self.sort_columns = self._sort_columns()
+        self._orders = {}
+        for column in range(len(self.sort_columns)):
+            self._sort(column)
+
+    def _record(self, prefix):
+        stats = self.stats
+        return list(zip(stats[f"{prefix}Wins"],
+                        [-v for v in stats[f"{prefix}Losses"]],
+                        [-v for v in stats[f"{prefix}OtLosses"]]))
+
+    def _sort_columns(self):
+        """Sort values for every basic and advanced table column, in column order."""
+        stats = self.stats
+        names = [abbrev.lower() for abbrev in self.abbrevs]
+        streaks = [
+            (1 if code == "W" else (-1 if code == "L" else 0)) * count
+            for code, count in zip(self.streak_codes, stats["streakCount"])
+        ]
+        in_playoffs = [
+            div <= 3 or wild <= 2
+            for div, wild in zip(stats["divisionSequence"], stats["wildcardSequence"])
+        ]
+        return [
+            stats["leagueSequence"],
+            names,  # Logo column sorts by team abbrev
+            names,
+            stats["gamesPlayed"],
+            stats["wins"],
+            stats["losses"],
+            stats["otLosses"],
+            stats["points"],
+            stats["regulationPlusOtWins"],
+            stats["pointPctg"],
+            stats["goalFor"],
+            stats["goalAgainst"],
+            stats["goalDifferential"],
+            self._record("home"),
+            self._record("road"),
+            self._record("l10"),
+            streaks,
+            [0] * self.size,  # Last result, see set_sort_column
+            in_playoffs,
+            stats["regulationWins"],
+            stats["shootoutWins"],
+            stats["shootoutLosses"],
+            stats["conferenceSequence"],
+            stats["divisionSequence"],
+            stats["wildcardSequence"],
+        ]
+
+    def set_sort_column(self, column, values):
+        """Replace one column's sort values (for data not in the snapshot) and re-sort it."""
+        if list(values) != self.sort_columns[column]:
+            self.sort_columns[column] = list(values)
+            self._sort(column)
+
+    def order(self, column, descending=False):
+        return self._orders[(column, descending)]
+
+    def _sort(self, column):
+        key = self.sort_columns[column].__getitem__
+        rows = range(self.size)
+        self._orders[(column, False)] = sorted(rows, key=key)
+        self._orders[(column, True)] = sorted(rows, key=key, reverse=True)
+
+
+class StatDeltas:
+    """How each coloured stat moved since the comparison snapshot, for every team at once.
+
+    The teams x stats matrices are computed with NumPy whenever either
+    snapshot changes; a cell then only reads its trend (+1 better, -1 worse,
+    0 unchanged or no comparison) and its comparison value.
+    """
+
+    STATS = ["wins", "points", "pointPctg", "goalFor", "goalAgainst", "goalDifferential"]
+    LOWER_IS_BETTER = {"goalAgainst"}
+
+    def __init__(self, store, compare_stats):
+        self.columns = {key: col for col, key in enumerate(self.STATS)}
+        current = np.array([store.stats[key] for key in self.STATS], dtype=float).T
+        self.compare = np.zeros_like(current)
+        present = np.zeros(store.size, dtype=bool)
+        for row, abbrev in enumerate(store.abbrevs):
+            previous = (compare_stats or {}).get(abbrev)
+            if previous is not None:
+                present[row] = True
+                self.compare[row] = [_number(previous.get(key, 0), 0, float) for key in self.STATS]
+        direction = np.array([-1.0 if key in self.LOWER_IS_BETTER else 1.0 for key in self.STATS])
+        self.trend = (np.sign(current - self.compare) * direction).astype(int)
+        self.trend[~present] = 0
+
+    def get(self, row, key):
+        """Return (colour, comparison value) for one cell, or (None, None) if unchanged."""
+        col = self.columns[key]
+        trend = self.trend[row, col]
+        if trend == 0:
+            return None, None
+        return (BETTER_COLOR if trend > 0 else WORSE_COLOR), float(self.compare[row, col])
+
+
+class StandingsModel(QAbstractTableModel):
+    """League standings for the main window's table.
+
+    Rows stay in the API's order; sorting is done by StandingsSortProxy.
+    Every cell's text, colour, tooltip and sort value is computed once in
+    update(), so painting and sorting only read prepared values.
+    """
+
+    BASIC_COLUMNS = [
+        ("Rank", "League Rank"),
+        ("Logo", "Team Logo"),
+        ("Team", "Team Abbreviation"),
+        ("GP", "Games Played"),
+        ("W", "Wins"),
+        ("L", "Losses"),
+        ("OT", "Overtime Losses"),
+        ("Pts", "Points"),
+        ("ROW", "Regulation + OT Wins"),
+        ("P%", "Point Percentage"),
+        ("GF", "Goals For"),
+        ("GA", "Goals Against"),
+        ("DIFF", "Goal Differential"),
+        ("HOME", "Home Record (W-L-OT)"),
+        ("ROAD", "Road Record (W-L-OT)"),
+        ("L10", "Last 10 Games (W-L-OT)"),
+        ("STREAK", "Current Streak"),
+        ("Last", "Result of most recent game (click to open details)"),
+        ("Playoffs", "Playoff Status (if season ended today)"),
+    ]
+    ADVANCED_COLUMNS = [
+        ("RW", "Regulation Wins"),
+        ("SOW", "Shootout Wins"),
+        ("SOL", "Shootout Losses"),
+        ("Conf", "Conference Rank"),
+        ("Div", "Division Rank"),
+        ("Wild", "Wildcard Rank"),
+    ]
+    RANK_COL = 0
+    LOGO_COL = 1
+    TEAM_COL = 2
+    LAST_COL = 17
+    PLAYOFF_COL = 18
+
+    def __init__(self, logo_service, logo_size=25, parent=None):
+        super().__init__(parent)
+        self.logo_service = logo_service
+        self.logo_size = logo_size
+        self.teams = []
+        self.favorites = set()
+        self.compare_ranks = {}
+        self.compare_stats = {}
+        self.last_results = {}  # abbrev -> (result, game)
+        self.advanced_mode = False
+        self.store = StandingsColumns()
+        self.playoffs = PlayoffPicture([])
+        self.deltas = StatDeltas(self.store, {})
+        self._deltas_compare = None
+        self._rows = []           # per row: [(text, colour, tooltip), ...]
+        self._rank_parts = []
+        self._rainbow_cells = []  # (row, column) drawn with the rainbow effect
+        self._rainbow_phases = {}
+        self._logo_errors = {}
+        self.logo_service.logo_ready.connect(self.on_logo_ready)
+
+    def update(self, teams, favorites, compare_ranks, compare_stats, last_results, advanced_mode):
+        """Replace the standings and display state and recompute every cell."""
+        self.beginResetModel()
+        teams = list(teams)
+        new_snapshot = len(teams) != len(self.teams) or any(a is not b for a, b in zip(teams, self.teams))
+        if new_snapshot:
+            # A new snapshot: re-read it column-wise and sort every column once,
+            # and work out the playoff picture once
+            self.store = StandingsColumns(teams)
+            self.playoffs = PlayoffPicture(teams)
+            self.store.set_sort_column(self.PLAYOFF_COL, [
+                self.playoffs.status(abbrev).in_playoffs for abbrev in self.store.abbrevs
+            ])
+        if new_snapshot or compare_stats is not self._deltas_compare:
+            # Stat colours for the whole table, recomputed only when a snapshot changes
+            self.deltas = StatDeltas(self.store, compare_stats)
+            self._deltas_compare = compare_stats
+        self.teams = teams
+        self.favorites = favorites
+        self.compare_ranks = compare_ranks or {}
+        self.compare_stats = compare_stats or {}
+        self.last_results = last_results
+        self.advanced_mode = advanced_mode
+        last_results = [self.last_result_letter(team) for team in teams]
+        self.store.set_sort_column(self.LAST_COL, [1 if r == "W" else (-1 if r == "L" else 0) for r in last_results])
+        self._rebuild()
+        self.endResetModel()
+        self.load_logos()
+
+    def columns(self):
+        return self.BASIC_COLUMNS + self.ADVANCED_COLUMNS if self.advanced_mode else self.BASIC_COLUMNS
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and 0 <= section < len(self.columns()):
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.columns()[section][0]
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self.columns()[section][1]
+            return None
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        text, color, tooltip = self._rows[row][col]
+        abbrev = self.team_abbrev(self.teams[row])
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == self.LOGO_COL:
+                return self._logo_errors.get(abbrev, "")
+            return text
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if (row, col) in self._rainbow_phases:
+                # Read at paint time, so the hue follows the animation clock
+                return rainbow_color(self._rainbow_phases[(row, col)])
+            if col == self.LOGO_COL and abbrev in self._logo_errors:
+                return QColor("red")
+            return color
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return tooltip
+        if role == RANK_ROLE and col == self.RANK_COL:
+            return self._rank_parts[row]
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == self.LAST_COL:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == SORT_ROLE:
+            return self.store.sort_columns[col][row]
+        if role == TEAM_ROLE:
+            return abbrev
+        if role == FAVORITE_ROLE:
+            return abbrev in self.favorites
+        return None
+
+    def row_order(self, column, descending=False):
+        """Source rows in sorted order for a column (precomputed, no comparisons)."""
+        return self.store.order(column, descending)
+
+    def team_abbrev(self, team):
+        return team.get("teamAbbrev", {}).get("default", "")
+
+    def load_logos(self):
+        """Request every logo the atlas is missing; on_logo_ready repaints each cell."""
+        atlas = self.logo_service.atlas(self.logo_size)
+        for team in self.teams:
+            abbrev = self.team_abbrev(team)
+            if not atlas.has(abbrev) and abbrev not in self._logo_errors:
+                self.logo_service.request(abbrev, self.logo_size,
+                                          lambda pixmap, error, a=abbrev: self.on_logo_loaded(a, error))
+
+    def on_logo_loaded(self, abbrev, error):
+        if error:
+            self._logo_errors[abbrev] = "IMG ERR" if error == INVALID_IMAGE else "ERR"
+            self.on_logo_ready(abbrev, self.logo_size)
+
+    def on_logo_ready(self, abbrev, size):
+        if size != self.logo_size:
+            return
+        for row, team in enumerate(self.teams):
+            if self.team_abbrev(team) == abbrev:
+                index = self.index(row, self.LOGO_COL)
+                self.dataChanged.emit(index, index)
+
+    def rainbow_indexes(self):
+        """Indexes of the cells drawn in rainbow colours; only these need animating."""
+        return [self.index(row, col) for row, col in self._rainbow_cells]
+
+    def last_result_letter(self, team):
+        """Return the last game result letter for display/sorting."""
+        if not team:
+            return "-"
+        streak_code = team.get("streakCode", "")
+        if streak_code in ("W", "L"):
+            return streak_code
+        result, _ = self.last_results.get(self.team_abbrev(team), ("-", None))
+        return result if result in ("W", "L") else "-"
+
+    def playoff_tooltip(self, team, status):
+        """Playoff status text for the Playoffs column, from the snapshot's PlayoffPicture"""
+        div_rank = team.get("divisionSequence", 999)
+        wildcard_rank = team.get("wildcardSequence", 999)
+        conf_rank = team.get("conferenceSequence", 999)
+        points = team.get("points", 0)
+
+        if status.in_playoffs:
+            text = f"✔ IN PLAYOFFS ({status.seed})\nDivision rank: {div_rank}/8\n"
+            text += f"Conference rank: {conf_rank}/16\nPoints: {points}"
+            if status.cutoff_diff > 0:
+                text += f"\n+{status.cutoff_diff} points ahead of cutoff"
+        else:
+            text = f"✖ OUT OF PLAYOFFS\nDivision rank: {div_rank}/8\nWild card rank: {wildcard_rank}/8\n"
+            text += f"Conference rank: {conf_rank}/16\nPoints: {points}"
+            if status.cutoff_diff < 0:
+                text += f"\n{-status.cutoff_diff} points behind cutoff"
+
+        if status.clinched:
+            text += "\nClinched a playoff spot"
+        elif status.eliminated:
+            text += "\nEliminated from playoff contention"
+        else:
+            if status.clinch_magic is not None:
+                text += f"\nMagic number to clinch: {status.clinch_magic}"
+            if status.elimination_magic is not None:
+                text += f"\nElimination number: {status.elimination_magic}"
+        return text
+
+    def _stat_cell(self, row, team, key, fmt="{}"):
+        value = team.get(key, 0)
+        color, compare = self.deltas.get(row, key)
+        tooltip = None
+        if color is not None:
+            if isinstance(value, int):
+                compare = int(compare)
+            tooltip = f"{fmt.format(compare)} → {fmt.format(value)}"
+        return fmt.format(value), color, tooltip
+
+    def _rebuild(self):
+        self._rows = []
+        self._rank_parts = []
+        self._rainbow_cells = []
+
+        for row, team in enumerate(self.teams):
+            abbrev = self.team_abbrev(team)
+            is_favorite = abbrev in self.favorites
+            cells = []
+
+            current_rank = team.get("leagueSequence", "")
+            prev_rank = self.compare_ranks.get(abbrev, current_rank)
+            delta = prev_rank - current_rank if isinstance(current_rank, int) and isinstance(prev_rank, int) else 0
+            arrow = ""
+            color = None
+            if delta > 0:
+                arrow = " ↑"
+                color = QColor("green")
+            elif delta < 0:
+                arrow = " ↓"
+                color = QColor("red")
+            star = "★ " if is_favorite else ""
+            tooltip = None
+            if color:
+                if delta > 0 and is_favorite:
+                    self._rainbow_cells.append((row, self.RANK_COL))
+                if isinstance(current_rank, int) and isinstance(prev_rank, int) and prev_rank != current_rank:
+                    tooltip = f"{prev_rank} → {current_rank}"
+            cells.append((f"{star}{current_rank}{arrow}", color, tooltip))
+            self._rank_parts.append((star, str(current_rank), arrow))
+
+            cells.append(("", None, None))  # Logo, painted from the LogoAtlas
+            cells.append((abbrev, None, team.get("teamName", {}).get("default", "")))
+            cells.append((str(team.get("gamesPlayed", 0)), None, None))
+            cells.append(self._stat_cell(row, team, "wins"))
+            cells.append((str(team.get("losses", 0)), None, None))
+            cells.append((str(team.get("otLosses", 0)), None, None))
+            cells.append(self._stat_cell(row, team, "points"))
+            cells.append((str(team.get("regulationPlusOtWins", 0)), None, None))
+            cells.append(self._stat_cell(row, team, "pointPctg", fmt="{:.3f}"))
+            cells.append(self._stat_cell(row, team, "goalFor"))
+            cells.append(self._stat_cell(row, team, "goalAgainst"))
+            cells.append(self._stat_cell(row, team, "goalDifferential"))
+            cells.append((f"{team.get('homeWins',0)}-{team.get('homeLosses',0)}-{team.get('homeOtLosses',0)}", None, None))
+            cells.append((f"{team.get('roadWins',0)}-{team.get('roadLosses',0)}-{team.get('roadOtLosses',0)}", None, None))
+            cells.append((f"{team.get('l10Wins',0)}-{team.get('l10Losses',0)}-{team.get('l10OtLosses',0)}", None, None))
+            streak_count = team.get("streakCount", 0)
+            cells.append((f"{team.get('streakCode', '')}{streak_count}" if streak_count else "", None, None))
+
+            # Last game result column
+            last_result = self.last_result_letter(team)
+            display_result = last_result if last_result in ("W", "L") else "—"
+            color = None
+            if display_result == "W":
+                if is_favorite:
+                    self._rainbow_cells.append((row, self.LAST_COL))
+                else:
+                    color = QColor("green")
+            elif display_result == "L":
+                color = QColor("red")
+            cells.append((display_result, color, "Click to open the most recent completed game"))
+
+            # Playoff status column; rainbow when a favorite team is in
+            playoff_status = self.playoffs.status(abbrev)
+            in_playoffs = playoff_status is not None and playoff_status.in_playoffs
+            playoff_tooltip = self.playoff_tooltip(team, playoff_status) if playoff_status else None
+            if in_playoffs and is_favorite:
+                self._rainbow_cells.append((row, self.PLAYOFF_COL))
+            cells.append(("✔" if in_playoffs else "✖", None, playoff_tooltip))
+
+            if self.advanced_mode:
+                for key in ("regulationWins", "shootoutWins", "shootoutLosses",
+                            "conferenceSequence", "divisionSequence", "wildcardSequence"):
+                    cells.append((str(team.get(key, 0)), None, None))
+
+            self._rows.append(cells)
+
+        # Each rainbow cell is offset by 30 degrees for a flowing effect
+        self._rainbow_phases = {cell: (i * 30) % 360 for i, cell in enumerate(self._rainbow_cells)}
+
+
+class StandingsSortProxy(QAbstractProxyModel):
+    """Shows a StandingsModel's rows in a precomputed order.
+
+    sort() only looks up the column's stored row order from the model, so
+    a header click is an O(n) reorder; sort(-1) restores the API order.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._order = []    # proxy row -> source row
+        self._inverse = []  # source row -> proxy row
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self.on_source_reset)
+        model.dataChanged.connect(self.on_source_data_changed)
+        self._update_order()
+
+    def on_source_reset(self):
+        self._update_order()
+        self.endResetModel()
+
+    def on_source_data_changed(self, top_left, bottom_right, roles=()):
+        rows = [self._inverse[row] for row in range(top_left.row(), bottom_right.row() + 1)]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), top_left.column()),
+                                  self.index(max(rows), bottom_right.column()), roles)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in old_indexes]
+        self._update_order()
+        self.changePersistentIndexList(old_indexes, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    def _update_order(self):
+        model = self.sourceModel()
+        if model is None:
+            self._order = []
+        elif 0 <= self._sort_column < model.columnCount():
+            descending = self._sort_order == Qt.SortOrder.DescendingOrder
+            self._order = list(model.row_order(self._sort_column, descending))
+        else:
+            self._order = list(range(model.rowCount()))
+        self._inverse = [0] * len(self._order)
+        for proxy_row, source_row in enumerate(self._order):
+            self._inverse[source_row] = proxy_row
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._order)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self._order[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        return self.index(self._inverse[source_index.row()], source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        # Row numbers follow the displayed order, not the source rows
+        if orientation == Qt.Orientation.Vertical:
+            return section + 1 if role == Qt.ItemDataRole.DisplayRole else None
+        model = self.sourceModel()
+        return model.headerData(section, orientation, role) if model is not None else None
+
+
+def game_est_start(game):
+    """(date, time) strings for a game's start in EST, or ("", "") when unknown."""
+    start_time = game.get("startTimeUTC", "")
+    if not start_time:
+        return "", ""
+    utc_time = datetime.datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    est_time = utc_time - datetime.timedelta(hours=5)
+    return est_time.date().isoformat(), est_time.strftime("%I:%M %p")
+
+
+def mask_rows(mask):
+    """The set of row numbers whose bits are set in an int bitset."""
+    bits = format(mask, "b")[::-1]
+    return {row for row, bit in enumerate(bits) if bit == "1"}
+
+
+class GameFacets:
+    """Bitmap indexes over a games table's rows, one per facet value.
+
+    Each value (a team, a venue, a date, ...) maps to a Python int used as
+    a bitset, with bit r set when row r has that value. Combining filters
+    is then a bitwise AND of a few ints, which stays instant however many
+    rows there are. Home/away and win/loss are indexed per team, because
+    they only mean something relative to the selected team.
+    """
+
+    PERIODS = {"REG": "Regulation", "OT": "OT", "SO": "SO"}
+
+    def __init__(self):
+        self.size = 0
+        self.bits = {facet: {} for facet in ("team", "home", "away", "win", "loss", "venue", "tv", "period", "date")}
+
+    def add(self, game):
+        """Index the next row."""
+        bit = 1 << self.size
+        self.size += 1
+        for facet, value in self._values(game):
+            table = self.bits[facet]
+            table[value] = table.get(value, 0) | bit
+
+    def _values(self, game):
+        away = game.get("awayTeam", {})
+        home = game.get("homeTeam", {})
+        away_abbrev = away.get("abbrev", "")
+        home_abbrev = home.get("abbrev", "")
+        values = [("team", away_abbrev), ("team", home_abbrev), ("home", home_abbrev), ("away", away_abbrev),
+                  ("venue", game.get("venue", {}).get("default", "")), ("date", game_est_start(game)[0])]
+        values.extend(("tv", b.get("network", "")) for b in game.get("tvBroadcasts", []))
+        period = game.get("gameOutcome", {}).get("lastPeriodType", "")
+        if period in self.PERIODS:
+            values.append(("period", self.PERIODS[period]))
+        away_score = _number(away.get("score"), None)
+        home_score = _number(home.get("score"), None)
+        if is_game_final(game) and away_score is not None and home_score is not None and away_score != home_score:
+            winner, loser = (away_abbrev, home_abbrev) if away_score > home_score else (home_abbrev, away_abbrev)
+            values.extend([("win", winner), ("loss", loser)])
+        return [(facet, value) for facet, value in values if value]
+
+    def values(self, facet):
+        """The values seen for a facet, sorted."""
+        return sorted(self.bits[facet])
+
+    def all_rows(self):
+        return (1 << self.size) - 1
+
+    def mask(self, team=None, opponent=None, side=None, venue=None, tv=None, period=None,
+             result=None, date_from=None, date_to=None):
+        """Bitset of the rows matching every given filter; None filters are ignored.
+
+        side ("home"/"away") and result ("win"/"loss") apply to team and
+        are ignored without one. Dates are inclusive YYYY-MM-DD strings.
+        """
+        bits = self.bits
+        mask = self.all_rows()
+        if team:
+            mask &= bits["team"].get(team, 0)
+            if side:
+                mask &= bits[side].get(team, 0)
+            if result:
+                mask &= bits[result].get(team, 0)
+        if opponent and opponent != team:
+            mask &= bits["team"].get(opponent, 0)
+        for facet, value in (("venue", venue), ("tv", tv), ("period", period)):
+            if value:
+                mask &= bits[facet].get(value, 0)
+        if date_from or date_to:
+            in_range = 0
+            for date, date_bits in bits["date"].items():
+                if (not date_from or date >= date_from) and (not date_to or date <= date_to):
+                    in_range |= date_bits
+            mask &= in_range
+        return mask
+
+
+class GamesModel(QAbstractTableModel):
+    """Schedule games as table rows, for the past and upcoming games windows.
+
+    Each game's cell text, sort keys and lowercase search text are worked
+    out once when it is added, and sort keys are kept column-wise like
+    StandingsColumns. append_games() inserts rows at the end, so a window
+    can show a backfill batch by batch while the rest is still loading.
+    """
+
+    COLUMNS = {
+        "date": "Date",
+        "matchup": "Matchup",
+        "score": "Score",
+        "time": "Time (EST)",
+        "venue": "Venue",
+        "tv": "TV",
+    }
+    MATCHUP_KEY = "matchup"
+    # Joins a row's cells in its search text; typed text cannot contain it,
+    # so a match never spans two cells
+    SEARCH_SEPARATOR = "\n"
+
+    def __init__(self, columns=("date", "matchup", "time", "venue", "tv"), highlight_date=None, parent=None):
+        super().__init__(parent)
+        self.keys = list(columns)
+        self.highlight_date = highlight_date
+        self.games = []
+        self._rows = []         # per row: display text per column
+        self._dates = []        # per row: EST date string
+        self._search_text = []  # per row: lowercase cells joined by SEARCH_SEPARATOR
+        self._sort_columns = [[] for _ in self.keys]
+        self._orders = {}       # (column, descending) -> row order, until rows change
+        self.facets = GameFacets()
+
+    def clear(self):
+        self.beginResetModel()
+        self.games = []
+        self._rows = []
+        self._dates = []
+        self._search_text = []
+        self._sort_columns = [[] for _ in self.keys]
+        self._orders = {}
+        self.facets = GameFacets()
+        self.endResetModel()
+
+    def append_games(self, games):
+        """Add a batch of games after the existing rows."""
+        games = list(games)
+        if not games:
+            return
+        first = len(self.games)
+        self.beginInsertRows(QModelIndex(), first, first + len(games) - 1)
+        for game in games:
+            cells = self._cells(game)
+            texts = [cells[key][0] for key in self.keys]
+            self.games.append(game)
+            self._rows.append(texts)
+            self._dates.append(cells["date"][0])
+            self._search_text.append(self.SEARCH_SEPARATOR.join(texts).lower())
+            for column, key in enumerate(self.keys):
+                self._sort_columns[column].append(cells[key][1])
+            self.facets.add(game)
+        self._orders = {}
+        self.endInsertRows()
+
+    def _cells(self, game):
+        """(text, sort key) for every column this model knows about."""
+        away_team = game.get("awayTeam", {})
+        home_team = game.get("homeTeam", {})
+        matchup = f"{away_team.get('abbrev', '')} @ {home_team.get('abbrev', '')}"
+        score = f"{away_team.get('score', '')} - {home_team.get('score', '')}"
+        period_type = game.get("gameOutcome", {}).get("lastPeriodType", "")
+        if period_type in ("OT", "SO"):
+            score += f" ({period_type})"
+        # ISO UTC timestamps sort chronologically as strings
+        start = game.get("startTimeUTC", "")
+        game_date, time_str = game_est_start(game)
+        venue = game.get("venue", {}).get("default", "")
+        tv = ", ".join(b.get("network", "") for b in game.get("tvBroadcasts", []))
+        return {
+            "date": (game_date, start),
+            "matchup": (matchup, matchup),
+            "score": (score, (away_team.get("score", 0), home_team.get("score", 0))),
+            "time": (time_str, start),
+            "venue": (venue, venue),
+            "tv": (tv, tv),
+        }
+
+    def column_of(self, key):
+        return self.keys.index(key) if key in self.keys else -1
+
+    def row_order(self, column, descending=False):
+        """Rows sorted by a column; stable, and cached until rows are added."""
+        key = (column, descending)
+        if key not in self._orders:
+            values = self._sort_columns[column]
+            self._orders[key] = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+        return self._orders[key]
+
+    def search(self, text, rows=None):
+        """The rows (of rows, default all) with a cell containing the lowercase text."""
+        search_text = self._search_text
+        if rows is None:
+            rows = range(len(search_text))
+        return {row for row in rows if text in search_text[row]}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[self.keys[section]] if 0 <= section < len(self.keys) else None
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][index.column()]
+        if role == SORT_ROLE:
+            return self._sort_columns[index.column()][row]
+        if role == GAME_ROLE:
+            return self.games[row]
+        if role == HIGHLIGHT_ROLE:
+            return self.highlight_date is not None and self._dates[row] == self.highlight_date
+        return None
+
+
+class GamesProxy(QAbstractProxyModel):
+    """Sorted, searchable, faceted view of a GamesModel, including rows added later.
+
+    The visible rows are one list built from the model's cached row order,
+    the set of rows matching the search and the rows allowed by the facet
+    filters (from GameFacets.mask()), so neither sorting nor filtering
+    calls back into Python per comparison or per row. A search that
+    extends the previous one only re-checks the rows that matched it.
+    sort(-1) puts the rows back in the order they were added.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_text = ""
+        self._matches = None  # source rows matching search_text; None = no search
+        self.facet_filters = {}
+        self._facet_rows = None  # source rows allowed by facet_filters; None = no filters
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._order = []    # proxy row -> source row
+        self._inverse = {}  # source row -> proxy row, for visible rows
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self.on_source_reset)
+        model.rowsInserted.connect(self.on_source_rows_inserted)
+        model.dataChanged.connect(self.on_source_data_changed)
+        self._update_order()
+
+    def on_source_reset(self):
+        if self._matches is not None:
+            self._matches = set()
+        self._update_facet_rows()
+        self._update_order()
+        self.endResetModel()
+
+    def on_source_rows_inserted(self, parent, first, last):
+        if self._matches is not None:
+            self._matches |= self.sourceModel().search(self.search_text, range(first, last + 1))
+        self._update_facet_rows()
+        self._relayout()
+
+    def on_source_data_changed(self, top_left, bottom_right, roles=()):
+        rows = [self._inverse[row] for row in range(top_left.row(), bottom_right.row() + 1) if row in self._inverse]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), top_left.column()),
+                                  self.index(max(rows), bottom_right.column()), roles)
+
+    def set_search_text(self, text):
+        text = text.lower()
+        if text == self.search_text:
+            return
+        model = self.sourceModel()
+        if not text:
+            self._matches = None
+        elif self._matches is not None and text.startswith(self.search_text):
+            self._matches = model.search(text, self._matches)
+        else:
+            self._matches = model.search(text)
+        self.search_text = text
+        self._relayout()
+
+    def set_facet_filters(self, filters):
+        """Show only rows matching every filter (keyword arguments of GameFacets.mask())."""
+        self.facet_filters = {facet: value for facet, value in filters.items() if value}
+        self._update_facet_rows()
+        self._relayout()
+
+    def _update_facet_rows(self):
+        model = self.sourceModel()
+        if not self.facet_filters or model is None:
+            self._facet_rows = None
+        else:
+            self._facet_rows = mask_rows(model.facets.mask(**self.facet_filters))
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._relayout()
+
+    def _relayout(self):
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in old_indexes]
+        self._update_order()
+        self.changePersistentIndexList(old_indexes, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    def _update_order(self):
+        model = self.sourceModel()
+        if model is None:
+            order = []
+        elif 0 <= self._sort_column < model.columnCount():
+            order = model.row_order(self._sort_column, self._sort_order == Qt.SortOrder.DescendingOrder)
+        else:
+            order = range(model.rowCount())
+        matches = self._matches
+        facet_rows = self._facet_rows
+        if matches is not None and facet_rows is not None:
+            matches = matches & facet_rows
+        elif matches is None:
+            matches = facet_rows
+        self._order = list(order) if matches is None else [row for row in order if row in matches]
+        self._inverse = {source_row: proxy_row for proxy_row, source_row in enumerate(self._order)}
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._order)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or self.sourceModel() is None:
+            return QModelIndex()
+        return self.sourceModel().index(self._order[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid() or source_index.row() not in self._inverse:
+            return QModelIndex()
+        return self.index(self._inverse[source_index.row()], source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        # Row numbers follow the displayed order, not the source rows
+        if orientation == Qt.Orientation.Vertical:
+            return section + 1 if role == Qt.ItemDataRole.DisplayRole else None
+        model = self.sourceModel()
+        return model.headerData(section, orientation, role) if model is not None else None
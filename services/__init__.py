@@ -0,0 +1,40 @@
+from .backfill import BackfillEngine
+from .fixture_client import RecordingClient, ReplayClient, create_client
+from .logos import LogoAtlas, LogoService, get_logo_service
+from .nhl_data import NHLDataService, get_data_service
+from .playoff_picture import PlayoffPicture, PlayoffStatus
+from .resilience import CircuitBreaker, CircuitOpen, ResilientCaller, TokenBucket
+from .season_index import SeasonIndex, is_game_final
+from .standings_archive import StandingsArchive
+from .sync_state import SyncState, season_start
+from .task_graph import DependencyFailed, TaskGraph
+from .workers import Job, JobCancelled, JobContext, run_job
+
+__all__ = [
+    'BackfillEngine',
+    'RecordingClient',
+    'ReplayClient',
+    'create_client',
+    'LogoAtlas',
+    'LogoService',
+    'get_logo_service',
+    'NHLDataService',
+    'get_data_service',
+    'PlayoffPicture',
+    'PlayoffStatus',
+    'CircuitBreaker',
+    'CircuitOpen',
+    'ResilientCaller',
+    'TokenBucket',
+    'SeasonIndex',
+    'is_game_final',
+    'StandingsArchive',
+    'SyncState',
+    'season_start',
+    'DependencyFailed',
+    'TaskGraph',
+    'Job',
+    'JobCancelled',
+    'JobContext',
+    'run_job',
+]
@@ -0,0 +1,88 @@
+import concurrent.futures
+import datetime
+
+
+def date_range(start, end, newest_first=False):
+    """Return ISO date strings for every day from start up to (not including) end."""
+    days = [(start + datetime.timedelta(days=i)).isoformat() for i in range((end - start).days)]
+    if newest_first:
+        days.reverse()
+    return days
+
+
+class BackfillEngine:
+    """Fetch one result per day over a date range with a concurrency limit.
+
+    fetch_day(date_str) runs on a thread pool with at most max_concurrency
+    calls in flight. Days finish in any order, but results are always
+    handed back in range order: day_callback fires for a day only once
+    every earlier day has completed, and run() returns an ordered list.
+    Days whose fetch raised are skipped and listed in failed_days.
+    """
+
+    POLL_INTERVAL = 0.05  # seconds between progress/cancel checks
+
+    def __init__(self, fetch_day, max_concurrency=6):
+        self.fetch_day = fetch_day
+        self.max_concurrency = max(1, max_concurrency)
+        self.failed_days = []
+
+    def run(self, start, end, progress_callback=None, day_callback=None,
+            is_cancelled=None, newest_first=False):
+        """Fetch every day in [start, end) and return [(date_str, result), ...].
+
+        progress_callback(done, total, date_str) is called from the calling
+        thread after every poll, which also gives GUI callers a chance to
+        process events. When is_cancelled() returns True, days that have not
+        started are dropped and the days delivered so far are returned.
+        """
+        days = date_range(start, end, newest_first)
+        total = len(days)
+        self.failed_days = []
+        results = []
+        if not days:
+            return results
+
+        finished = {}  # index -> (ok, result)
+        next_index = 0  # next day to hand back in order
+        last_date = days[0]
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            futures = {executor.submit(self.fetch_day, day): index for index, day in enumerate(days)}
+            pending = set(futures)
+            while pending:
+                if is_cancelled and is_cancelled():
+                    for future in pending:
+                        future.cancel()
+                    break
+
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=self.POLL_INTERVAL,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = futures[future]
+                    try:
+                        finished[index] = (True, future.result())
+                    except Exception as e:
+                        print(f"Backfill failed for {days[index]}: {e}")
+                        finished[index] = (False, None)
+                        self.failed_days.append(days[index])
+
+                # Release the contiguous run of completed days, in order
+                while next_index in finished:
+                    ok, result = finished.pop(next_index)
+                    last_date = days[next_index]
+                    if ok:
+                        results.append((last_date, result))
+                        if day_callback:
+                            day_callback(last_date, result)
+                    next_index += 1
+
+                if progress_callback:
+                    progress_callback(total - len(pending), total, last_date)
+        finally:
+            executor.shutdown(wait=False)
+
+        return results
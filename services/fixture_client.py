@@ -0,0 +1,110 @@
+import json
+import os
+import re
+import time
+
+# NHL_CLIENT_MODE: "live" (default), "record" or "replay"
+MODE_ENV = "NHL_CLIENT_MODE"
+FIXTURES_DIR_ENV = "NHL_FIXTURES_DIR"
+REPLAY_LATENCY_ENV = "NHL_REPLAY_LATENCY_MS"
+
+
+class MissingFixture(KeyError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def fixture_path(root, group, method, args, kwargs):
+    """Return the fixture file for one API call, e.g. schedule/daily_schedule/date=2025-01-01.json."""
+    parts = [str(arg) for arg in args] + [f"{key}={kwargs[key]}" for key in sorted(kwargs)]
+    name = re.sub(r"[^A-Za-z0-9=,._-]", "_", ",".join(parts)) or "_"
+    return os.path.join(root, group, method, f"{name}.json")
+
+
+class _RecordingGroup:
+    def __init__(self, group, name, root):
+        self._group = group
+        self._name = name
+        self._root = root
+
+    def __getattr__(self, method):
+        real = getattr(self._group, method)
+
+        def call(*args, **kwargs):
+            payload = real(*args, **kwargs)
+            path = fixture_path(self._root, self._name, method, args, kwargs)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w") as f:
+                    json.dump(payload, f, indent=2)
+            except OSError as e:
+                print(f"Could not record fixture {path}: {e}")
+            return payload
+        return call
+
+
+class _ReplayGroup:
+    def __init__(self, name, root, latency):
+        self._name = name
+        self._root = root
+        self._latency = latency
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            if self._latency:
+                time.sleep(self._latency)
+            path = fixture_path(self._root, self._name, method, args, kwargs)
+            try:
+                with open(path, "r") as f:
+                    return json.load(f)
+            except FileNotFoundError:
+                raise MissingFixture(f"No recorded response at {path}")
+        return call
+
+
+class RecordingClient:
+    """Wrap an NHLClient and save every response it returns as a fixture."""
+
+    def __init__(self, fixtures_dir, client=None):
+        if client is None:
+            from nhlpy import NHLClient
+            client = NHLClient()
+        self._client = client
+        self.fixtures_dir = fixtures_dir
+
+    def __getattr__(self, group):
+        return _RecordingGroup(getattr(self._client, group), group, self.fixtures_dir)
+
+
+class ReplayClient:
+    """Drop-in NHLClient that answers from recorded fixtures, with no network.
+
+    latency_ms is slept before every call to mimic a real round trip.
+    """
+
+    def __init__(self, fixtures_dir, latency_ms=0):
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = latency_ms
+
+    def __getattr__(self, group):
+        return _ReplayGroup(group, self.fixtures_dir, self.latency_ms / 1000)
+
+
+def create_client():
+    """Return the NHL client selected by the NHL_CLIENT_MODE environment variable."""
+    mode = os.environ.get(MODE_ENV, "live").lower()
+    fixtures_dir = os.environ.get(FIXTURES_DIR_ENV) or os.path.join(os.path.expanduser("~"), ".nhl_fixtures")
+    if mode == "record":
+        print(f"Recording NHL API responses to {fixtures_dir}")
+        return RecordingClient(fixtures_dir)
+    if mode == "replay":
+        try:
+            latency_ms = float(os.environ.get(REPLAY_LATENCY_ENV, 0))
+        except ValueError:
+            latency_ms = 0
+        print(f"Replaying NHL API responses from {fixtures_dir}")
+        return ReplayClient(fixtures_dir, latency_ms)
+    if mode != "live":
+        print(f"Unknown {MODE_ENV} '{mode}', using the live API")
+    # Imported here so replay runs and tests do not need nhlpy installed
+    from nhlpy import NHLClient
+    return NHLClient()
@@ -0,0 +1,253 @@
+import math
+import os
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRect, QRectF, Qt, QUrl, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImageReader, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from .workers import run_job
+
+# Map NHL API abbreviations (Keys) to ESPN URL codes (Values)
+ESPN_CODES = {
+    "LAK": "la",    # Los Angeles Kings
+    "TBL": "tb",    # Tampa Bay Lightning
+    "NJD": "nj",    # New Jersey Devils
+    "SJS": "sj",    # San Jose Sharks
+    "UTA": "utah",  # Utah Hockey Club
+    "VEG": "vgk"    # Vegas sometimes varies
+}
+
+INVALID_IMAGE = "Data downloaded but not a valid image."
+
+
+def logo_url(abbrev):
+    code = ESPN_CODES.get(abbrev, abbrev)
+    return f"https://assets.espn.go.com/i/teamlogos/nhl/500/{code}.png"
+
+
+def decode_logo(data, pixel_size):
+    """Worker thread: decode PNG bytes straight to at most pixel_size square."""
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+    reader = QImageReader(buffer)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(pixel_size, pixel_size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        raise ValueError(INVALID_IMAGE)
+    return image
+
+
+def read_logo_file(path, pixel_size):
+    """Worker thread: load and decode a cached logo file."""
+    with open(path, "rb") as f:
+        return decode_logo(f.read(), pixel_size)
+
+
+class LogoAtlas:
+    """Every team logo at one size, packed into a single sprite sheet.
+
+    Drawing a logo is one drawPixmap from the shared sheet, so a view
+    painting a whole column of logos blits from one texture.
+    """
+
+    COLUMNS = 8
+
+    def __init__(self, size, pixel_ratio):
+        self.size = size
+        self.cell = math.ceil(size * pixel_ratio)
+        self.sheet = QPixmap()
+        self._slots = {}  # abbrev -> (slot index, width, height) in sheet pixels
+
+    def has(self, abbrev):
+        return abbrev in self._slots
+
+    def add(self, abbrev, pixmap):
+        index = self._slots[abbrev][0] if abbrev in self._slots else len(self._slots)
+        rows = index // self.COLUMNS + 1
+        if self.sheet.isNull() or self.sheet.height() < rows * self.cell:
+            self._grow(rows)
+        x = (index % self.COLUMNS) * self.cell
+        y = (index // self.COLUMNS) * self.cell
+        painter = QPainter(self.sheet)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(x, y, self.cell, self.cell, Qt.GlobalColor.transparent)
+        painter.drawPixmap(QRect(x, y, pixmap.width(), pixmap.height()), pixmap)
+        painter.end()
+        self._slots[abbrev] = (index, pixmap.width(), pixmap.height())
+
+    def _grow(self, rows):
+        sheet = QPixmap(self.COLUMNS * self.cell, rows * self.cell)
+        sheet.fill(Qt.GlobalColor.transparent)
+        if not self.sheet.isNull():
+            painter = QPainter(sheet)
+            painter.drawPixmap(0, 0, self.sheet)
+            painter.end()
+        self.sheet = sheet
+
+    def draw(self, painter, rect, abbrev):
+        """Draw the logo centred in rect; returns False if it is not loaded yet."""
+        slot = self._slots.get(abbrev)
+        if slot is None:
+            return False
+        index, width, height = slot
+        scale = self.size / self.cell
+        target = QRectF(0, 0, width * scale, height * scale)
+        target.moveCenter(QRectF(rect).center())
+        source = QRectF((index % self.COLUMNS) * self.cell, (index // self.COLUMNS) * self.cell, width, height)
+        painter.drawPixmap(target, self.sheet, source)
+        return True
+
+
+class LogoService(QObject):
+    """Team logos at display size from memory, then disk, then the network.
+
+    Logos are decoded on the thread pool with QImageReader straight to the
+    requested size times the device pixel ratio, so nothing is scaled while
+    painting. Scaled pixmaps live in QPixmapCache and in one LogoAtlas per
+    size; the downloaded PNGs are kept under ~/.nhl_cache/logos so later
+    sessions never download them again. All downloads share one
+    QNetworkAccessManager, and a logo already loading is never requested
+    twice. Must be used from the UI thread.
+    """
+
+    logo_ready = pyqtSignal(str, int)  # abbrev, logical size
+
+    def __init__(self, cache_dir=None, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".nhl_cache", "logos")
+        self.network_manager = QNetworkAccessManager(self)
+        self._waiting = {}  # (abbrev, size) -> [callback, ...] while loading
+        self._downloads = set()
+        self._atlases = {}  # size -> LogoAtlas
+
+    def pixel_ratio(self):
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app else 1.0
+
+    def cache_key(self, abbrev, size):
+        return f"logo:{abbrev}:{size}@{self.pixel_ratio()}"
+
+    def path_for(self, abbrev):
+        return os.path.join(self.cache_dir, f"{abbrev}.png")
+
+    def atlas(self, size):
+        """The LogoAtlas for a logical size; it fills in as logos are loaded."""
+        if size not in self._atlases:
+            self._atlases[size] = LogoAtlas(size, self.pixel_ratio())
+        return self._atlases[size]
+
+    def pixmap(self, abbrev, size):
+        """Return the scaled logo if it is already in memory, else None."""
+        pixmap = QPixmapCache.find(self.cache_key(abbrev, size))
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        return None
+
+    def request(self, abbrev, size, callback=None):
+        """Load a logo at a logical size and call callback(pixmap, error).
+
+        Runs immediately when the logo is in memory; otherwise once it has
+        been decoded (and downloaded, if needed). pixmap is None and error
+        a message on failure. logo_ready is emitted for every loaded logo.
+        """
+        pixmap = self.pixmap(abbrev, size)
+        if pixmap is not None:
+            if callback:
+                self._deliver(callback, pixmap, None)
+            return
+
+        key = (abbrev, size)
+        if key in self._waiting:
+            if callback:
+                self._waiting[key].append(callback)
+            return
+        self._waiting[key] = [callback] if callback else []
+
+        path = self.path_for(abbrev)
+        if os.path.exists(path):
+            self._decode(abbrev, size, read_logo_file, path)
+        elif abbrev not in self._downloads:
+            self._downloads.add(abbrev)
+            reply = self.network_manager.get(QNetworkRequest(QUrl(logo_url(abbrev))))
+            reply.finished.connect(lambda r=reply, a=abbrev: self.on_reply_finished(a, r))
+
+    def on_reply_finished(self, abbrev, reply):
+        self._downloads.discard(abbrev)
+        error = None
+        data = None
+        if reply.error() == reply.NetworkError.NoError:
+            data = bytes(reply.readAll())
+        else:
+            error = f"Failed to fetch image.\nError: {reply.errorString()}"
+        reply.deleteLater()
+
+        for (waiting_abbrev, size) in list(self._waiting):
+            if waiting_abbrev != abbrev:
+                continue
+            if data is None:
+                self._finish(abbrev, size, None, error)
+            else:
+                self._decode(abbrev, size, decode_logo, data)
+
+    def _decode(self, abbrev, size, decode, source):
+        ratio = self.pixel_ratio()
+        run_job(
+            decode, source, math.ceil(size * ratio),
+            on_result=lambda image: self.on_logo_decoded(abbrev, size, ratio, image, source),
+            on_error=lambda e: self.on_decode_failed(abbrev, size, source, e),
+        )
+
+    def on_logo_decoded(self, abbrev, size, ratio, image, source):
+        # Downloads are only kept once they are known to decode
+        if isinstance(source, bytes) and not os.path.exists(self.path_for(abbrev)):
+            self.save_to_disk(abbrev, source)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        QPixmapCache.insert(self.cache_key(abbrev, size), pixmap)
+        self.atlas(size).add(abbrev, pixmap)
+        self._finish(abbrev, size, pixmap, None)
+        self.logo_ready.emit(abbrev, size)
+
+    def on_decode_failed(self, abbrev, size, source, error):
+        if isinstance(error, ValueError) and source == self.path_for(abbrev):
+            # A bad cached file is dropped so the next request downloads it again
+            try:
+                os.remove(source)
+            except OSError:
+                pass
+        self._finish(abbrev, size, None, str(error))
+
+    def _finish(self, abbrev, size, pixmap, error):
+        for callback in self._waiting.pop((abbrev, size), []):
+            self._deliver(callback, pixmap, error)
+
+    def save_to_disk(self, abbrev, data):
+        path = self.path_for(abbrev)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _deliver(self, callback, pixmap, error):
+        try:
+            callback(pixmap, error)
+        except RuntimeError:
+            # The widget waiting for this logo was deleted (e.g. table refreshed)
+            pass
+
+
+_logo_service = None
+
+
+def get_logo_service():
+    """Return the shared LogoService, creating it on first use."""
+    global _logo_service
+    if _logo_service is None:
+        _logo_service = LogoService()
+    return _logo_service
@@ -0,0 +1,359 @@
+import concurrent.futures
+import datetime
+import os
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from .backfill import BackfillEngine, date_range
+from .fixture_client import RecordingClient, ReplayClient, create_client
+from .resilience import Counters, ResilientCaller, TokenBucket
+from .season_index import SeasonIndex
+from .response_cache import ResponseCache
+from .standings_archive import StandingsArchive
+from .sync_state import SyncState, season_start
+
+# Game states that mean a game's result will not change any more
+FINAL_STATES = ("FINAL", "OFFICIAL", "OFF")
+
+
+class NHLDataService(QObject):
+    """Single app-wide entry point for NHL API data.
+
+    Every window queries through the shared instance returned by
+    get_data_service(), so the whole app uses one NHLClient (and one
+    connection pool); see create_client() for the offline record/replay
+    clients, which run against a temporary disk cache. Responses are cached
+    in memory and the *_updated signals fire whenever a fetch returns data
+    that differs from what was cached before. Identical requests made while
+    one is already in flight wait for that fetch instead of starting their
+    own. Every API call goes through one ResilientCaller (rate limit,
+    retries, circuit breaker); when a fetch still fails, the last cached
+    payload is served if there is one. Every schedule payload that arrives
+    is also added to season_index, so windows can look games up without
+    rescanning schedules. Daily schedules are also kept on disk: finished
+    days forever, today and later for LIVE_TTL seconds. Standings for past
+    days are captured into a StandingsArchive the first time they are
+    fetched, so later comparisons against them never touch the network. A
+    per-season sync watermark (see sync_schedule()) records how far the
+    season is settled, so season loads only fetch the days after it.
+    """
+
+    schedule_updated = pyqtSignal(str, dict)             # date, payload
+    standings_updated = pyqtSignal(str, dict)            # date, payload
+    team_schedule_updated = pyqtSignal(str, str, dict)   # team, season, payload
+
+    # How long (seconds) cached data for today or later stays fresh.
+    # Past dates never change, so they are kept for the whole session.
+    LIVE_TTL = 60
+    TEAM_SCHEDULE_TTL = 600
+
+    # Maximum number of days fetched at once by schedule_range()
+    BACKFILL_CONCURRENCY = 6
+
+    def __init__(self, client=None, disk_cache=None, standings_archive=None, caller=None,
+                 sync_state=None, parent=None):
+        super().__init__(parent)
+        self.client = client or create_client()
+        if caller is None:
+            # Recorded responses cost nothing upstream, so replays run unthrottled
+            limiter = TokenBucket(rate=None) if isinstance(self.client, ReplayClient) else None
+            caller = ResilientCaller(limiter=limiter)
+        self.caller = caller
+        if disk_cache is None and isinstance(self.client, (RecordingClient, ReplayClient)):
+            # Record/replay runs get a throwaway cache, archive and sync state:
+            # every request then reaches the client (so it gets recorded), and
+            # a replay depends only on the fixtures, never on ~/.nhl_cache
+            disk_cache = ResponseCache.temporary()
+        self.disk_cache = disk_cache or ResponseCache()
+        self.standings_archive = standings_archive or StandingsArchive(
+            os.path.join(self.disk_cache.root, "standings.json.gz"))
+        self.sync_state = sync_state or SyncState(os.path.join(self.disk_cache.root, "sync_state.json"))
+        self._cache = {}  # (endpoint, *args) -> (fetched_at, payload)
+        self._in_flight = {}  # (endpoint, *args) -> (Future, forced)
+        self._lock = threading.Lock()
+        self.counters = Counters()
+        self.season_index = SeasonIndex()
+
+    def daily_schedule(self, date, force=False):
+        """Return the schedule payload for a YYYY-MM-DD date."""
+        def fetch():
+            if not force:
+                cached = self.disk_cache.get("daily_schedule", date, max_age=self.LIVE_TTL)
+                if cached is not None:
+                    return cached
+            payload = self.caller.call(self.client.schedule.daily_schedule, date=date)
+            self.disk_cache.put("daily_schedule", date, payload,
+                                permanent=self.is_day_settled(date, payload))
+            return payload
+
+        payload, changed = self._get(
+            ("daily_schedule", date), fetch, self.ttl_for_date(date), force,
+            stale=lambda: self.disk_cache.get("daily_schedule", date),
+        )
+        if changed:
+            self.season_index.add_games(payload.get("games", []))
+            self.schedule_updated.emit(date, payload)
+        return payload
+
+    def schedule_range(self, start, end, progress_callback=None, day_callback=None,
+                       is_cancelled=None, newest_first=False):
+        """Fetch daily schedules for [start, end) concurrently.
+
+        Returns [(date_str, payload), ...] in date order; the callbacks are
+        those of BackfillEngine.run().
+        """
+        engine = BackfillEngine(self.daily_schedule, self.BACKFILL_CONCURRENCY)
+        return engine.run(start, end, progress_callback=progress_callback,
+                          day_callback=day_callback, is_cancelled=is_cancelled,
+                          newest_first=newest_first)
+
+    def sync_schedule(self, start, end, progress_callback=None, day_callback=None,
+                      is_cancelled=None, newest_first=False):
+        """schedule_range() for a season, fetching only the days after its watermark.
+
+        start is the season's first day and keys its watermark. Days up to
+        the watermark are read one by one from the permanent disk cache in
+        the calling thread; only later days go through schedule_range().
+        The watermark then moves up to the last day of the unbroken run of
+        settled days. Takes the same callbacks and returns the same list.
+        """
+        season = start.isoformat()
+        watermark = self.sync_state.watermark(season)
+        split = start
+        if watermark:
+            split = min(end, datetime.date.fromisoformat(watermark) + datetime.timedelta(days=1))
+        stored_days = date_range(start, split, newest_first)
+        total = (end - start).days
+        state = {"cancelled": False}
+
+        def load_stored(offset):
+            results = []
+            for done, date in enumerate(stored_days, 1):
+                if is_cancelled and is_cancelled():
+                    state["cancelled"] = True
+                    break
+                try:
+                    payload = self.daily_schedule(date)
+                except Exception as e:
+                    print(f"Could not load stored schedule for {date}: {e}")
+                    continue
+                results.append((date, payload))
+                if day_callback:
+                    day_callback(date, payload)
+                if progress_callback:
+                    progress_callback(offset + done, total, date)
+            return results
+
+        def fetch_new(offset):
+            def progress(done, new_total, date):
+                if progress_callback:
+                    progress_callback(offset + done, total, date)
+            results = self.schedule_range(split, end, progress_callback=progress,
+                                          day_callback=day_callback, is_cancelled=is_cancelled,
+                                          newest_first=newest_first)
+            if is_cancelled and is_cancelled():
+                state["cancelled"] = True
+            return results
+
+        if newest_first:
+            fetched = fetch_new(0)
+            stored = [] if state["cancelled"] else load_stored((end - split).days)
+            results = fetched + stored
+        else:
+            stored = load_stored(0)
+            fetched = [] if state["cancelled"] else fetch_new(len(stored_days))
+            results = stored + fetched
+
+        if not state["cancelled"]:
+            self._advance_watermark(season, split, fetched)
+        return results
+
+    def _advance_watermark(self, season, first_day, fetched):
+        """Move the watermark over the settled days at the start of a fetched range."""
+        payloads = dict(fetched)
+        watermark = None
+        for date in date_range(first_day, datetime.date.today()):
+            payload = payloads.get(date)
+            if payload is None or not self.is_day_settled(date, payload):
+                break
+            watermark = date
+        if watermark:
+            self.sync_state.set_watermark(season, watermark)
+
+    def sync_season(self, today=None, progress_callback=None):
+        """Bring the local cache for the current season up to date, with no UI.
+
+        Syncs the schedule up to the watermark and archives every missing
+        settled day's standings. Returns (schedule days loaded, standings days added).
+        """
+        today = today or datetime.date.today()
+        start = season_start(today)
+        days = self.sync_schedule(start, today, progress_callback=progress_callback)
+        added = self.backfill_standings(start, today)
+        return len(days), len(added)
+
+    def league_standings(self, date, force=False):
+        """Return the league standings payload as of a YYYY-MM-DD date."""
+        def fetch():
+            if not force:
+                archived = self.standings_archive.get(date)
+                if archived is not None:
+                    return archived
+            payload = self.caller.call(self.client.standings.league_standings, date=date)
+            if self.is_standings_settled(date):
+                self.standings_archive.put(date, payload)
+            return payload
+
+        payload, changed = self._get(("league_standings", date), fetch, self.ttl_for_date(date), force)
+        if changed:
+            self.standings_updated.emit(date, payload)
+        return payload
+
+    def backfill_standings(self, start, end, progress_callback=None, is_cancelled=None):
+        """Archive standings for every missing settled day in [start, end).
+
+        Returns the dates that were added. The archive is written to disk
+        once at the end rather than after every day.
+        """
+        end = min(end, datetime.date.today())
+
+        def fetch_day(date):
+            if self.standings_archive.has(date) or not self.is_standings_settled(date):
+                return False
+            payload = self.caller.call(self.client.standings.league_standings, date=date)
+            self.standings_archive.put(date, payload, save=False)
+            return True
+
+        engine = BackfillEngine(fetch_day, self.BACKFILL_CONCURRENCY)
+        try:
+            results = engine.run(start, end, progress_callback=progress_callback,
+                                 is_cancelled=is_cancelled)
+        finally:
+            self.standings_archive.save()
+        return [date for date, added in results if added]
+
+    def team_season_schedule(self, team_abbr, season, force=False):
+        """Return a team's full season schedule payload."""
+        payload, changed = self._get(
+            ("team_season_schedule", team_abbr, season),
+            lambda: self.caller.call(self.client.schedule.team_season_schedule,
+                                     team_abbr=team_abbr, season=season),
+            self.TEAM_SCHEDULE_TTL,
+            force,
+        )
+        if changed:
+            self.season_index.add_games(payload.get("games", []), complete_team=team_abbr)
+            self.team_schedule_updated.emit(team_abbr, season, payload)
+        return payload
+
+    def is_day_settled(self, date, payload):
+        """A past day whose games are all final can be cached forever.
+
+        Postponed or cancelled entries (gameScheduleState other than "OK")
+        never become final; they are moved to a new date, so they count as
+        settled too. Otherwise one postponement would hold back the sync
+        watermark for the rest of the season.
+        """
+        if date >= datetime.date.today().isoformat():
+            return False
+        return all(
+            game.get("gameState") in FINAL_STATES or game.get("gameScheduleState", "OK") != "OK"
+            for game in payload.get("games", [])
+        )
+
+    def is_standings_settled(self, date):
+        """Standings as of a date are final once that day's schedule is settled.
+
+        Archived days are never replaced, so a day is only archived when
+        every game on it is final; right after midnight late games may
+        still be live.
+        """
+        if date >= datetime.date.today().isoformat():
+            return False
+        try:
+            schedule = self.daily_schedule(date)
+        except Exception:
+            return False
+        return self.is_day_settled(date, schedule)
+
+    def ttl_for_date(self, date):
+        """Past dates are immutable (None = no expiry); today and later expire."""
+        if date < datetime.date.today().isoformat():
+            return None
+        return self.LIVE_TTL
+
+    def metrics(self):
+        """Counters for monitoring: API calls, retries, rate limiting, breaker and cache."""
+        counts = self.caller.metrics()
+        counts.update(self.counters.snapshot())
+        with self._lock:
+            counts["cached_responses"] = len(self._cache)
+            counts["in_flight"] = len(self._in_flight)
+        return counts
+
+    def _get(self, key, fetch, ttl, force, stale=None):
+        """Return (payload, changed) for a cache key, fetching when needed.
+
+        Only one fetch per key runs at a time: concurrent callers share its
+        result (or its exception). A forced request does not join a
+        non-forced one, since that may be answered from the disk cache.
+        If the fetch fails, the previous payload (from memory, or from
+        stale() when given) is returned instead of raising.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and not force:
+                fetched_at, payload = entry
+                if ttl is None or now - fetched_at < ttl:
+                    self.counters.add("cache_hits")
+                    return payload, False
+
+            in_flight = self._in_flight.get(key)
+            if in_flight and (in_flight[1] or not force):
+                future = in_flight[0]
+                owner = False
+            else:
+                future = concurrent.futures.Future()
+                self._in_flight[key] = (future, force)
+                owner = True
+
+        if not owner:
+            self.counters.add("coalesced")
+            return future.result(), False
+
+        try:
+            payload = fetch()
+        except Exception as e:
+            fallback = entry[1] if entry else (stale() if stale else None)
+            with self._lock:
+                if self._in_flight.get(key, (None,))[0] is future:
+                    del self._in_flight[key]
+            if fallback is None:
+                future.set_exception(e)
+                raise
+            print(f"Serving cached data for {key[0]} {' '.join(map(str, key[1:]))}: {e}")
+            self.counters.add("stale_served")
+            future.set_result(fallback)
+            return fallback, False
+
+        with self._lock:
+            previous = self._cache.get(key)
+            self._cache[key] = (time.monotonic(), payload)
+            if self._in_flight.get(key, (None,))[0] is future:
+                del self._in_flight[key]
+        future.set_result(payload)
+        changed = previous is None or previous[1] != payload
+        return payload, changed
+
+
+_service = None
+
+
+def get_data_service():
+    """Return the shared NHLDataService, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = NHLDataService()
+    return _service
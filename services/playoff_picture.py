@@ -0,0 +1,168 @@
+GAMES_PER_SEASON = 82
+DIVISION_SPOTS = 3
+WILD_CARD_SPOTS = 2
+
+
+class PlayoffStatus:
+    """Where one team stands in its conference's playoff picture."""
+
+    def __init__(self, abbrev, conference, division, points, max_points):
+        self.abbrev = abbrev
+        self.conference = conference
+        self.division = division
+        self.points = points
+        self.max_points = max_points
+        self.seed = None              # e.g. "Atlantic 1" or "WC2"; None when out
+        self.in_playoffs = False
+        self.cutoff_diff = 0          # points ahead of (+) or behind (-) the cutoff line
+        self.clinch_magic = None      # points to clinch; 0 = clinched
+        self.elimination_magic = None  # points until eliminated; 0 = eliminated
+
+    @property
+    def clinched(self):
+        return self.clinch_magic == 0
+
+    @property
+    def eliminated(self):
+        return self.elimination_magic == 0
+
+
+def _name(team, key, fallback_key):
+    """Conference/division name; the API sends either a string or a {"default": ...} dict."""
+    value = team.get(key) or team.get(fallback_key, "")
+    return value.get("default", "") if isinstance(value, dict) else value
+
+
+def _team_key(team):
+    """Fallback ranking when the API sequence is missing: points, then fewer games, RW, ROW, W."""
+    return (
+        -team.get("points", 0),
+        team.get("gamesPlayed", 0),
+        -team.get("regulationWins", 0),
+        -team.get("regulationPlusOtWins", 0),
+        -team.get("wins", 0),
+        -team.get("goalDifferential", 0),
+    )
+
+
+def _ranked(teams, sequence_key):
+    """Order teams by the API's own sequence (which applies tiebreakers) when present."""
+    return sorted(teams, key=lambda t: (t.get(sequence_key) or 999, _team_key(t)))
+
+
+def _makes_it(same_division_ahead, other_division_ahead):
+    """Would a team with this many conference rivals ahead of it hold a playoff spot?
+
+    It is in if at most two division rivals are ahead (top three). Otherwise
+    at most one team can be ahead that is not one of its division's or the
+    other division's top three (a wild card).
+    """
+    if same_division_ahead < DIVISION_SPOTS:
+        return True
+    spill = (same_division_ahead - DIVISION_SPOTS) + max(0, other_division_ahead - DIVISION_SPOTS)
+    return spill < WILD_CARD_SPOTS
+
+
+class PlayoffPicture:
+    """The playoff picture for one standings snapshot, computed once.
+
+    Each conference's top three per division plus two wild cards are in.
+    For every team it records the seed, the margin to the cutoff line and
+    the clinch and elimination magic numbers. A magic number counts points
+    the team gains plus points its rivals fail to get. Tiebreakers cannot be
+    known in advance, so a tie neither clinches a spot nor eliminates a
+    team: both magic numbers stop only once a tie can no longer matter.
+    """
+
+    def __init__(self, standings, games_per_season=GAMES_PER_SEASON):
+        self.games_per_season = games_per_season
+        self.teams = {}        # abbrev -> PlayoffStatus
+        self.conferences = {}  # conference -> {"divisions", "wild_cards", "cutoff_points", "first_out"}
+
+        by_conference = {}
+        for team in standings:
+            conference = _name(team, "conferenceName", "conferenceAbbrev")
+            by_conference.setdefault(conference, []).append(team)
+        for conference, teams in by_conference.items():
+            self._build_conference(conference, teams)
+
+    def status(self, abbrev):
+        return self.teams.get(abbrev)
+
+    def _build_conference(self, conference, teams):
+        divisions = {}
+        for team in teams:
+            divisions.setdefault(_name(team, "divisionName", "divisionAbbrev"), []).append(team)
+
+        statuses = []
+        qualifiers = set()
+        division_seeds = {}
+        for division, members in divisions.items():
+            ranked = _ranked(members, "divisionSequence")
+            division_seeds[division] = [t["teamAbbrev"]["default"] for t in ranked[:DIVISION_SPOTS]]
+            qualifiers.update(division_seeds[division])
+
+        race = _ranked([t for t in teams if t["teamAbbrev"]["default"] not in qualifiers], "wildcardSequence")
+        wild_cards = [t["teamAbbrev"]["default"] for t in race[:WILD_CARD_SPOTS]]
+        last_in = race[WILD_CARD_SPOTS - 1] if len(race) >= WILD_CARD_SPOTS else None
+        first_out = race[WILD_CARD_SPOTS] if len(race) > WILD_CARD_SPOTS else None
+
+        for team in teams:
+            abbrev = team["teamAbbrev"]["default"]
+            points = team.get("points", 0)
+            remaining = max(0, self.games_per_season - team.get("gamesPlayed", 0))
+            division = _name(team, "divisionName", "divisionAbbrev")
+            status = PlayoffStatus(abbrev, conference, division, points, points + 2 * remaining)
+            for division, seeds in division_seeds.items():
+                if abbrev in seeds:
+                    status.seed = f"{division} {seeds.index(abbrev) + 1}"
+            if abbrev in wild_cards:
+                status.seed = f"WC{wild_cards.index(abbrev) + 1}"
+            status.in_playoffs = status.seed is not None
+            if status.in_playoffs:
+                status.cutoff_diff = points - first_out.get("points", 0) if first_out else 0
+            elif last_in is not None:
+                status.cutoff_diff = points - last_in.get("points", 0)
+            self.teams[abbrev] = status
+            statuses.append(status)
+
+        for status in statuses:
+            rivals = [s for s in statuses if s is not status]
+            status.clinch_magic = self._clinch_magic(status, rivals)
+            status.elimination_magic = self._elimination_magic(status, rivals)
+
+        self.conferences[conference] = {
+            "divisions": division_seeds,
+            "wild_cards": wild_cards,
+            "cutoff_points": last_in.get("points", 0) if last_in else None,
+            "first_out": first_out["teamAbbrev"]["default"] if first_out else None,
+        }
+
+    def _clinch_magic(self, status, rivals):
+        """Smallest swing that leaves too few rivals able to catch the team.
+
+        A rival that can still tie the team counts as able to catch it.
+        """
+        # Candidate targets: just above each rival's best possible finish
+        for target in sorted({status.points} | {r.max_points + 1 for r in rivals}):
+            if target < status.points:
+                continue
+            same = sum(1 for r in rivals if r.max_points >= target and r.division == status.division)
+            other = sum(1 for r in rivals if r.max_points >= target and r.division != status.division)
+            if _makes_it(same, other):
+                return target - status.points
+        return None
+
+    def _elimination_magic(self, status, rivals):
+        """Smallest swing after which enough rivals are sure to finish ahead.
+
+        A rival the team can still tie does not count as ahead of it.
+        """
+        for ceiling in sorted({status.max_points} | {r.points - 1 for r in rivals}, reverse=True):
+            if ceiling > status.max_points:
+                continue
+            same = sum(1 for r in rivals if r.points > ceiling and r.division == status.division)
+            other = sum(1 for r in rivals if r.points > ceiling and r.division != status.division)
+            if not _makes_it(same, other):
+                return status.max_points - ceiling
+        return None
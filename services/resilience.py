@@ -0,0 +1,174 @@
+import collections
+import random
+import threading
+import time
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
+
+
+class Counters:
+    """Thread-safe named counters for monitoring."""
+
+    def __init__(self):
+        self._counts = collections.Counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, amount=1):
+        with self._lock:
+            self._counts[name] += amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+class TokenBucket:
+    """Allow on average `rate` calls per second, with bursts up to `capacity`.
+
+    rate=None disables limiting (used when replaying recorded responses).
+    """
+
+    def __init__(self, rate=5.0, capacity=10):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available; return the seconds spent waiting."""
+        if self.rate is None:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """Stop calling an upstream that keeps failing.
+
+    After failure_threshold failures in a row the circuit opens and calls
+    are refused for reset_timeout seconds. Then a single trial call is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self.state == self.HALF_OPEN:
+                if self._trial_running:
+                    return False
+                self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        """Count a failure; return True if this opened the circuit."""
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                was_open = self.state == self.OPEN
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return not was_open
+            return False
+
+
+def is_transient(error):
+    """Timeouts, connection errors, 429 and 5xx responses are worth retrying."""
+    if isinstance(error, (ValueError, TypeError, KeyError, CircuitOpen)):
+        return False  # Bad parameters or an unparseable body won't fix themselves
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is None:
+        return True  # No HTTP status: network-level failure
+    return status == 429 or status >= 500
+
+
+class ResilientCaller:
+    """Call the NHL API through a shared rate limiter, retries and a breaker.
+
+    Transient failures are retried with exponential backoff and full
+    jitter. Only failures that survive every retry count towards opening
+    the circuit; while it is open, calls fail fast with CircuitOpen so
+    callers can fall back to cached data.
+    """
+
+    def __init__(self, limiter=None, breaker=None, max_retries=3, base_delay=0.5, max_delay=8.0):
+        self.limiter = limiter or TokenBucket()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.counters = Counters()
+
+    def call(self, fn, *args, **kwargs):
+        if not self.breaker.allow_request():
+            self.counters.add("circuit_rejected")
+            raise CircuitOpen("NHL API circuit is open")
+
+        attempt = 0
+        while True:
+            waited = self.limiter.acquire()
+            if waited:
+                self.counters.add("rate_limited")
+                self.counters.add("rate_limit_wait_seconds", waited)
+            self.counters.add("requests")
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                self.counters.add("failures")
+                transient = is_transient(e)
+                if transient and attempt < self.max_retries:
+                    attempt += 1
+                    self.counters.add("retries")
+                    time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+                    continue
+                if not transient:
+                    self.breaker.record_success()  # The API answered; the request was bad
+                elif self.breaker.record_failure():
+                    self.counters.add("circuit_opened")
+                    print(f"NHL API failing ({e}); serving cached data for {self.breaker.reset_timeout:.0f}s")
+                raise
+            self.breaker.record_success()
+            return result
+
+    def metrics(self):
+        counts = self.counters.snapshot()
+        counts["circuit_state"] = self.breaker.state
+        return counts
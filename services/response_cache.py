@@ -0,0 +1,54 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import time
+
+
+class ResponseCache:
+    """Disk-backed store of API responses keyed by endpoint and key (a date).
+
+    Entries written with permanent=True never expire; everything else is
+    only returned while younger than the max_age the caller asks for.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or os.path.join(os.path.expanduser("~"), ".nhl_cache")
+
+    @classmethod
+    def temporary(cls):
+        """A cache in a fresh directory that is removed when the process exits."""
+        root = tempfile.mkdtemp(prefix="nhl_cache_")
+        atexit.register(shutil.rmtree, root, ignore_errors=True)
+        return cls(root)
+
+    def path_for(self, endpoint, key):
+        return os.path.join(self.root, endpoint, f"{key}.json")
+
+    def get(self, endpoint, key, max_age=None):
+        """Return the cached payload, or None if missing or expired."""
+        try:
+            with open(self.path_for(endpoint, key), "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not entry.get("permanent"):
+            age = time.time() - entry.get("stored_at", 0)
+            if max_age is not None and age >= max_age:
+                return None
+        return entry.get("payload")
+
+    def put(self, endpoint, key, payload, permanent=False):
+        """Write a payload to disk; failures just leave the cache cold."""
+        path = self.path_for(endpoint, key)
+        entry = {"stored_at": time.time(), "permanent": permanent, "payload": payload}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
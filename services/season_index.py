@@ -0,0 +1,138 @@
+import bisect
+import datetime
+import threading
+
+
+def game_sort_key(game):
+    """Chronological sort key for a schedule entry (ISO UTC strings sort correctly)."""
+    return (game.get("startTimeUTC") or game.get("gameDate") or "", game.get("id") or 0)
+
+
+def game_est_date(game):
+    """The game's date (YYYY-MM-DD) in EST, like the game tables show it.
+
+    Daily schedule entries carry no gameDate of their own, so the date is
+    taken from startTimeUTC; gameDate is only the fallback.
+    """
+    start_time = game.get("startTimeUTC")
+    if not start_time:
+        return game.get("gameDate", "")
+    utc_time = datetime.datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    return (utc_time - datetime.timedelta(hours=5)).date().isoformat()
+
+
+def is_game_final(game):
+    """Determine whether a schedule entry represents a completed game."""
+    game_state = game.get("gameState", "")
+    game_outcome = game.get("gameOutcome", {})
+    away_score = game.get("awayTeam", {}).get("score")
+    home_score = game.get("homeTeam", {}).get("score")
+    has_scores = (
+        (away_score is not None and away_score != "" and away_score != 0) or
+        (home_score is not None and home_score != "" and home_score != 0)
+    )
+    has_outcome = bool(game_outcome)
+    return game_state in ("FINAL", "OFFICIAL") or has_outcome or (has_scores and game_state == "OFF")
+
+
+class SeasonIndex:
+    """In-memory index of schedule entries, keyed every way the windows look games up.
+
+    Games are stored once by id; the team, date and team-pair indexes hold
+    (sort key, id) pairs kept in chronological order with bisect, and each
+    team's latest final game is tracked as games are added. Adding a game
+    that is already indexed replaces it, so live score updates flow in.
+    """
+
+    def __init__(self, games=()):
+        self._lock = threading.Lock()
+        self._by_id = {}
+        self._by_team = {}
+        self._by_date = {}
+        self._by_pair = {}
+        self._last_final = {}  # abbrev -> (sort key, id)
+        self._complete_teams = set()
+        self.add_games(games)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def add_games(self, games, complete_team=None):
+        """Index schedule entries; pass complete_team for a team's full season schedule."""
+        with self._lock:
+            for game in games:
+                game_id = game.get("id")
+                if game_id is None:
+                    continue
+                old = self._by_id.get(game_id)
+                if old is not None:
+                    if old == game:
+                        continue
+                    self._remove(old)
+                self._insert(game)
+            if complete_team:
+                self._complete_teams.add(complete_team)
+
+    def has_team_schedule(self, abbrev):
+        """True once the team's full season schedule has been indexed."""
+        return abbrev in self._complete_teams
+
+    def game(self, game_id):
+        return self._by_id.get(game_id)
+
+    def games_for_team(self, abbrev):
+        return self._resolve(self._by_team.get(abbrev))
+
+    def games_on(self, date):
+        """Games on an EST date (see game_est_date)."""
+        return self._resolve(self._by_date.get(date))
+
+    def games_between(self, team1, team2):
+        return self._resolve(self._by_pair.get(frozenset((team1, team2))))
+
+    def last_final_game(self, abbrev):
+        with self._lock:
+            entry = self._last_final.get(abbrev)
+            return self._by_id[entry[1]] if entry else None
+
+    def _resolve(self, entries):
+        with self._lock:
+            return [self._by_id[game_id] for _, game_id in entries or ()]
+
+    def _index_keys(self, game):
+        home = game.get("homeTeam", {}).get("abbrev", "")
+        away = game.get("awayTeam", {}).get("abbrev", "")
+        return [
+            (self._by_team, home),
+            (self._by_team, away),
+            (self._by_date, game_est_date(game)),
+            (self._by_pair, frozenset((home, away))),
+        ], (home, away)
+
+    def _insert(self, game):
+        entry = (game_sort_key(game), game["id"])
+        self._by_id[game["id"]] = game
+        keys, teams = self._index_keys(game)
+        for table, key in keys:
+            bisect.insort(table.setdefault(key, []), entry)
+        if is_game_final(game):
+            for team in teams:
+                if team and (team not in self._last_final or self._last_final[team] < entry):
+                    self._last_final[team] = entry
+
+    def _remove(self, game):
+        entry = (game_sort_key(game), game["id"])
+        keys, teams = self._index_keys(game)
+        for table, key in keys:
+            entries = table.get(key, [])
+            index = bisect.bisect_left(entries, entry)
+            if index < len(entries) and entries[index] == entry:
+                del entries[index]
+        del self._by_id[game["id"]]
+        for team in teams:
+            if self._last_final.get(team) == entry:
+                del self._last_final[team]
+                for candidate in reversed(self._by_team.get(team, [])):
+                    if is_game_final(self._by_id[candidate[1]]):
+                        self._last_final[team] = candidate
+                        break
@@ -0,0 +1,269 @@
+import bisect
+import copy
+import gzip
+import json
+import os
+import threading
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _team_abbrev(team):
+    abbrev = team.get("teamAbbrev")
+    return abbrev.get("default") if isinstance(abbrev, dict) else abbrev
+
+
+class StandingsArchive:
+    """One league standings snapshot per day, stored compactly on disk.
+
+    Each snapshot is split into what rarely changes and what moves daily:
+      - teams: an interned table of each team's non-numeric fields (names,
+        conference, logo, ...); a day refers to rows by index
+      - schemas: the numeric field names shared by every team that day
+      - days[date]: one row of integers per team, either absolute (a
+        keyframe) or the difference from the previous archived day, plus
+        the non-numeric values that change from day to day: fields with
+        the same value on every row (such as the snapshot's date) once in
+        "shared", and ROW_FIELDS (the streak code, ...) once per row
+    Floats are kept as fixed-point integers at the six decimals the API
+    reports (FLOAT_SCALE). Every KEYFRAME_INTERVAL-th day is a keyframe, so
+    a lookup replays at most that many deltas. The whole archive is one
+    gzipped JSON file.
+
+    Only past days belong here: standings for a finished day never change,
+    so a day is written once and never replaced.
+    """
+
+    VERSION = 2
+    KEYFRAME_INTERVAL = 14
+    # Per-team strings that change from day to day, kept out of the team table
+    ROW_FIELDS = ("streakCode", "clinchIndicator")
+    FLOAT_SCALE = 1000000
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(os.path.expanduser("~"), ".nhl_cache", "standings.json.gz")
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+
+    def has(self, date):
+        with self._lock:
+            self._load()
+            return date in self._days
+
+    def dates(self):
+        """Archived dates, oldest first."""
+        with self._lock:
+            self._load()
+            return list(self._dates)
+
+    def get(self, date):
+        """Return the standings payload archived for a date, or None."""
+        with self._lock:
+            self._load()
+            entry = self._days.get(date)
+            if entry is None:
+                return None
+            rows = self._absolute_rows(self._dates.index(date))
+            schema = self._schemas[entry["schema"]]
+            shared = entry.get("shared", {})
+            row_fields = entry.get("row_fields", [])
+            row_values = entry.get("row_values") or [[] for _ in rows]
+            standings = []
+            for team_index, row, strings in zip(entry["teams"], rows, row_values):
+                team = copy.deepcopy(self._teams[team_index])
+                team.update(copy.deepcopy(shared))
+                for name, value in zip(row_fields, strings):
+                    if value is not None:
+                        team[name] = value
+                for (name, is_float), value in zip(schema, row):
+                    team[name] = value / self.FLOAT_SCALE if is_float else value
+                standings.append(team)
+            payload = copy.deepcopy(entry["meta"])
+            payload["standings"] = standings
+            return payload
+
+    def put(self, date, payload, save=True):
+        """Archive a day's standings payload; existing days are kept as they are.
+
+        Pass save=False when adding many days and call save() once at the end.
+        """
+        standings = payload.get("standings") or []
+        if not standings:
+            return
+        with self._lock:
+            self._load()
+            if date in self._days:
+                return
+            schema, teams, rows, shared, row_fields, row_values = self._split(standings)
+            meta = {key: value for key, value in payload.items() if key != "standings"}
+
+            # The day after this one may be a delta against the day before;
+            # store it as a keyframe so it stays readable until save() re-encodes.
+            position = bisect.bisect_left(self._dates, date)
+            if position < len(self._dates):
+                following = self._days[self._dates[position]]
+                if not following["keyframe"]:
+                    following["values"] = self._absolute_rows(position)
+                    following["keyframe"] = True
+
+            self._dates.insert(position, date)
+            self._days[date] = {"keyframe": True, "schema": schema, "teams": teams,
+                                "values": rows, "meta": meta, "shared": shared,
+                                "row_fields": row_fields, "row_values": row_values}
+            self._dirty = True
+            if save:
+                self.save()
+
+    def save(self):
+        """Re-encode the archive as keyframes plus deltas and write it to disk."""
+        with self._lock:
+            if not self._loaded or not self._dirty:
+                return
+            self._encode_deltas()
+            data = {"version": self.VERSION, "teams": self._teams, "schemas": self._schemas,
+                    "days": self._days}
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp_path = f"{self.path}.tmp"
+                with gzip.open(tmp_path, "wt") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Could not save standings archive: {e}")
+
+    def _load(self):
+        if self._loaded:
+            return
+        try:
+            with gzip.open(self.path, "rt") as f:
+                data = json.load(f)
+        except (OSError, ValueError, EOFError):
+            data = {}
+        migrate = data.get("version") == 1
+        if data.get("version") != self.VERSION and not migrate:
+            data = {}
+        self._teams = data.get("teams", [])
+        self._schemas = data.get("schemas", [])
+        self._days = data.get("days", {})
+        self._dates = sorted(self._days)
+        self._team_ids = {json.dumps(team, sort_keys=True): i for i, team in enumerate(self._teams)}
+        self._schema_ids = {json.dumps(schema): i for i, schema in enumerate(self._schemas)}
+        self._loaded = True
+        if migrate:
+            self._migrate()
+
+    def _migrate(self):
+        """Re-split a version 1 archive, whose team table also held the per-day strings."""
+        payloads = {date: self.get(date) for date in self._dates}
+        self._teams, self._schemas, self._days, self._dates = [], [], {}, []
+        self._team_ids, self._schema_ids = {}, {}
+        for date, payload in payloads.items():
+            self.put(date, payload, save=False)
+
+    def _intern(self, table, ids, value, key):
+        if key not in ids:
+            ids[key] = len(table)
+            table.append(value)
+        return ids[key]
+
+    def _split(self, standings):
+        """Split a standings list into its stored parts.
+
+        Returns (schema id, team ids, absolute value rows, shared fields,
+        row field names, per-row values of those fields).
+        """
+        numeric = set.intersection(*(
+            {name for name, value in team.items() if _is_number(value)} for team in standings
+        ))
+        schema = [[name, any(isinstance(team[name], float) for team in standings)]
+                  for name in sorted(numeric)]
+        # Non-numeric fields equal on every row (the snapshot date, ...) are stored
+        # once per day; teamAbbrev stays with the team, it identifies the rows
+        first = standings[0]
+        shared = {
+            name: value for name, value in first.items()
+            if name not in numeric and name != "teamAbbrev" and name not in self.ROW_FIELDS
+            and all(name in team and team[name] == value for team in standings[1:])
+        } if len(standings) > 1 else {}
+        row_fields = [name for name in self.ROW_FIELDS if any(name in team for team in standings)]
+        teams = []
+        rows = []
+        row_values = []
+        for team in standings:
+            static = {name: value for name, value in team.items()
+                      if name not in numeric and name not in shared and name not in row_fields}
+            teams.append(self._intern(self._teams, self._team_ids, static,
+                                      json.dumps(static, sort_keys=True)))
+            rows.append([round(team[name] * self.FLOAT_SCALE) if is_float else team[name]
+                         for name, is_float in schema])
+            row_values.append([team.get(name) for name in row_fields])
+        schema_id = self._intern(self._schemas, self._schema_ids, schema, json.dumps(schema))
+        return schema_id, teams, rows, shared, row_fields, row_values
+
+    def _abbrevs(self, entry):
+        return [_team_abbrev(self._teams[team_index]) for team_index in entry["teams"]]
+
+    def _absolute_rows(self, index):
+        """Replay deltas from the nearest keyframe up to the day at index."""
+        start = index
+        while not self._days[self._dates[start]]["keyframe"]:
+            start -= 1
+        rows = None
+        previous_abbrevs = None
+        for i in range(start, index + 1):
+            entry = self._days[self._dates[i]]
+            abbrevs = self._abbrevs(entry)
+            if entry["keyframe"]:
+                rows = [list(row) for row in entry["values"]]
+            else:
+                previous = dict(zip(previous_abbrevs, rows))
+                rows = [[base + delta for base, delta in zip(previous[abbrev], row)]
+                        for abbrev, row in zip(abbrevs, entry["values"])]
+            previous_abbrevs = abbrevs
+        return rows
+
+    def _encode_deltas(self):
+        """Rewrite every day as a keyframe or a delta against the previous day."""
+        # Decode every day first, in one pass, so this stays linear in the
+        # number of days rather than replaying from a keyframe for each one.
+        absolute = []
+        previous = None  # (abbrevs, rows)
+        for date in self._dates:
+            entry = self._days[date]
+            abbrevs = self._abbrevs(entry)
+            if entry["keyframe"]:
+                rows = entry["values"]
+            else:
+                base = dict(zip(*previous))
+                rows = [[value + delta for value, delta in zip(base[abbrev], row)]
+                        for abbrev, row in zip(abbrevs, entry["values"])]
+            absolute.append(rows)
+            previous = (abbrevs, rows)
+
+        since_keyframe = 0
+        previous = None  # (schema, abbrevs, rows)
+        for date, rows in zip(self._dates, absolute):
+            entry = self._days[date]
+            abbrevs = self._abbrevs(entry)
+            can_delta = (
+                previous is not None
+                and since_keyframe < self.KEYFRAME_INTERVAL - 1
+                and previous[0] == entry["schema"]
+                and len(set(abbrevs)) == len(abbrevs)
+                and sorted(previous[1]) == sorted(abbrevs)
+            )
+            if can_delta:
+                base = dict(zip(previous[1], previous[2]))
+                entry["values"] = [[value - prior for value, prior in zip(row, base[abbrev])]
+                                   for abbrev, row in zip(abbrevs, rows)]
+                entry["keyframe"] = False
+                since_keyframe += 1
+            else:
+                entry["values"] = rows
+                entry["keyframe"] = True
+                since_keyframe = 0
+            previous = (entry["schema"], abbrevs, rows)
@@ -0,0 +1,68 @@
+import datetime
+import json
+import os
+import threading
+
+
+def season_start(today=None):
+    """October 1st of the season in progress (the regular season never starts earlier)."""
+    today = today or datetime.date.today()
+    return datetime.date(today.year if today.month >= 10 else today.year - 1, 10, 1)
+
+
+class SyncState:
+    """Per-season sync watermarks, kept in ~/.nhl_cache/sync_state.json.
+
+    A season's watermark is the last date for which that day and every
+    earlier day of the season were settled (all games final) and are held
+    permanently in the response cache. Nothing up to the watermark can
+    change any more, so a sync only fetches the days after it.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(os.path.expanduser("~"), ".nhl_cache", "sync_state.json")
+        self._lock = threading.Lock()
+        self._seasons = None
+
+    def watermark(self, season):
+        """Last settled date (YYYY-MM-DD) for a season key, or None."""
+        with self._lock:
+            self._load()
+            return self._seasons.get(season, {}).get("watermark")
+
+    def set_watermark(self, season, date):
+        with self._lock:
+            self._load()
+            self._seasons[season] = {
+                "watermark": date,
+                "synced_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save()
+
+    def clear(self, season):
+        with self._lock:
+            self._load()
+            if self._seasons.pop(season, None) is not None:
+                self._save()
+
+    def _load(self):
+        if self._seasons is not None:
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self._seasons = data.get("seasons", {}) if data.get("version") == self.VERSION else {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"version": self.VERSION, "seasons": self._seasons}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save sync state: {e}")
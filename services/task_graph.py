@@ -0,0 +1,118 @@
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .workers import JobCancelled, run_job
+
+
+class DependencyFailed(Exception):
+    """Recorded for a task that was skipped because a dependency failed."""
+
+
+class TaskGraph(QObject):
+    """Run named tasks on the thread pool as soon as their dependencies finish.
+
+    Each task function receives the results of its dependencies as
+    positional arguments, in the order they were listed. Independent tasks
+    run concurrently. A cancelled task counts as failed, so the graph still
+    finishes. task_finished / task_failed arrive on the thread that
+    started the graph; timings holds (start, end) seconds relative to
+    start() for every task that ran.
+    """
+
+    task_finished = pyqtSignal(str, object)      # name, result
+    task_failed = pyqtSignal(str, Exception)     # name, error
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = {}  # name -> (fn, dependencies)
+        self._running = set()
+        self.results = {}
+        self.errors = {}
+        self.timings = {}
+        self.started_at = None
+        self._finished = False
+
+    def add_task(self, name, fn, depends_on=()):
+        if name in self._tasks:
+            raise ValueError(f"Duplicate task: {name}")
+        self._tasks[name] = (fn, tuple(depends_on))
+        return self
+
+    def start(self):
+        self._validate()
+        self.started_at = time.perf_counter()
+        self._advance()
+
+    def elapsed(self):
+        """Seconds since start()."""
+        return time.perf_counter() - self.started_at
+
+    def _validate(self):
+        for name, (_, deps) in self._tasks.items():
+            for dep in deps:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task {name} depends on unknown task {dep}")
+
+        # Depth-first search for cycles
+        state = {}  # name -> "visiting" | "done"
+
+        def visit(name):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Dependency cycle through task {name}")
+            state[name] = "visiting"
+            for dep in self._tasks[name][1]:
+                visit(dep)
+            state[name] = "done"
+
+        for name in self._tasks:
+            visit(name)
+
+    def _is_settled(self, name):
+        return name in self.results or name in self.errors
+
+    def _start_ready_tasks(self):
+        for name, (fn, deps) in self._tasks.items():
+            if self._is_settled(name) or name in self._running:
+                continue
+            if not all(self._is_settled(dep) for dep in deps):
+                continue
+            failed = [dep for dep in deps if dep in self.errors]
+            if failed:
+                self._on_task_error(name, DependencyFailed(f"{name} skipped: {', '.join(failed)} failed"))
+                continue
+
+            self._running.add(name)
+            self.timings[name] = (self.elapsed(), None)
+            run_job(
+                fn, *(self.results[dep] for dep in deps),
+                on_result=lambda result, n=name: self._on_task_result(n, result),
+                on_error=lambda error, n=name: self._on_task_error(n, error),
+                on_cancelled=lambda n=name: self._on_task_error(n, JobCancelled(f"{n} cancelled")),
+            )
+
+    def _on_task_result(self, name, result):
+        self._running.discard(name)
+        self.results[name] = result
+        self.timings[name] = (self.timings[name][0], self.elapsed())
+        self.task_finished.emit(name, result)
+        self._advance()
+
+    def _on_task_error(self, name, error):
+        self._running.discard(name)
+        self.errors[name] = error
+        if name in self.timings:
+            self.timings[name] = (self.timings[name][0], self.elapsed())
+        self.task_failed.emit(name, error)
+        self._advance()
+
+    def _advance(self):
+        self._start_ready_tasks()
+        if self._finished or self._running:
+            return
+        if all(self._is_settled(name) for name in self._tasks):
+            self._finished = True
+            self.finished.emit()
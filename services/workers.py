@@ -0,0 +1,133 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class JobCancelled(Exception):
+    """Raised from inside a job function to stop early once cancelled."""
+
+
+class JobContext:
+    """Passed to job functions started with with_context=True.
+
+    Lets long-running work check for cancellation and report progress,
+    or partial results, back to the UI thread.
+    """
+
+    def __init__(self, signals):
+        self._signals = signals
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def check_cancelled(self):
+        if self._cancelled.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, done, total, message=""):
+        self._signals.progress.emit(done, total, message)
+
+    def report_partial(self, data):
+        """Hand a chunk of results to the UI thread before the job finishes."""
+        self._signals.partial.emit(data)
+
+
+_signal_classes = {}
+
+
+def job_signals_class(result_type=object):
+    """Return a JobSignals class whose result signal carries result_type."""
+    if result_type not in _signal_classes:
+        _signal_classes[result_type] = type(
+            f"JobSignals[{result_type.__name__}]",
+            (QObject,),
+            {
+                "result": pyqtSignal(result_type),
+                "error": pyqtSignal(Exception),
+                "progress": pyqtSignal(int, int, str),  # done, total, message
+                "partial": pyqtSignal(object),          # results streamed while running
+                "cancelled": pyqtSignal(),
+                "finished": pyqtSignal(),               # always emitted last
+            },
+        )
+    return _signal_classes[result_type]
+
+
+# Jobs stay referenced here until they finish so the signal objects are
+# not garbage collected while a worker thread is still using them.
+_active_jobs = set()
+
+
+class Job(QRunnable):
+    """Run fn(*args, **kwargs) on a QThreadPool worker thread.
+
+    Exactly one of result / error / cancelled is emitted, followed by
+    finished. Signals are queued back to the thread that created the job,
+    so slots can touch widgets directly. A cancelled job's return value is
+    dropped, except for with_context jobs: those decide for themselves
+    whether to return partial results or raise JobCancelled.
+    """
+
+    def __init__(self, fn, *args, result_type=object, with_context=False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.with_context = with_context
+        self.signals = job_signals_class(result_type)()
+        self.context = JobContext(self.signals)
+        self.signals.finished.connect(lambda: _active_jobs.discard(self))
+
+    @property
+    def cancelled(self):
+        return self.context.cancelled
+
+    def start(self, pool=None):
+        _active_jobs.add(self)
+        (pool or QThreadPool.globalInstance()).start(self)
+        return self
+
+    def cancel(self):
+        """Request cancellation; a job that has not started yet never runs."""
+        self.context._cancelled.set()
+
+    def run(self):
+        try:
+            if self.context.cancelled:
+                raise JobCancelled()
+            if self.with_context:
+                result = self.fn(self.context, *self.args, **self.kwargs)
+            else:
+                result = self.fn(*self.args, **self.kwargs)
+            if self.context.cancelled and not self.with_context:
+                raise JobCancelled()
+        except JobCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+def run_job(fn, *args, on_result=None, on_error=None, on_progress=None,
+            on_partial=None, on_cancelled=None, on_finished=None, result_type=object,
+            with_context=False, **kwargs):
+    """Start fn on the global thread pool and wire up the given callbacks."""
+    job = Job(fn, *args, result_type=result_type, with_context=with_context, **kwargs)
+    if on_result:
+        job.signals.result.connect(on_result)
+    if on_error:
+        job.signals.error.connect(on_error)
+    if on_progress:
+        job.signals.progress.connect(on_progress)
+    if on_partial:
+        job.signals.partial.connect(on_partial)
+    if on_cancelled:
+        job.signals.cancelled.connect(on_cancelled)
+    if on_finished:
+        job.signals.finished.connect(on_finished)
+    return job.start()
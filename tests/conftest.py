@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Let the tests import the app's top-level packages (services, models, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,99 @@
+from services.playoff_picture import PlayoffPicture
+
+DIVISIONS = {"Atlantic": "ABCDEFGH", "Metropolitan": "IJKLMNOP"}
+
+
+def conference(points, games_played=82):
+    """One 16-team conference; points maps a team letter to its points (default 80)."""
+    teams = []
+    for division, letters in DIVISIONS.items():
+        for letter in letters:
+            teams.append({
+                "teamAbbrev": {"default": letter * 3},
+                "conferenceName": "Eastern",
+                "divisionName": division,
+                "points": points.get(letter, 80),
+                "gamesPlayed": games_played,
+            })
+    return teams
+
+
+def ranked_points():
+    """Distinct points: the Atlantic from 100 down, the Metropolitan from 90 down."""
+    return {letter: top - i for top, letters in zip((100, 90), DIVISIONS.values())
+            for i, letter in enumerate(letters)}
+
+
+def test_final_standings_seed_division_leaders_and_wild_cards():
+    # The Atlantic's fourth and fifth teams outscore the Metropolitan's fourth
+    picture = PlayoffPicture(conference(ranked_points()))
+
+    assert picture.status("AAA").seed == "Atlantic 1"
+    assert picture.status("KKK").seed == "Metropolitan 3"
+    assert picture.status("DDD").seed == "WC1"
+    assert picture.status("EEE").seed == "WC2"
+    assert picture.status("LLL").seed is None
+    assert picture.conferences["Eastern"]["wild_cards"] == ["DDD", "EEE"]
+    assert picture.conferences["Eastern"]["first_out"] == "FFF"
+
+    in_teams = {abbrev for abbrev, status in picture.teams.items() if status.in_playoffs}
+    assert len(in_teams) == 8
+    # With no games left every playoff team has clinched and every other team is out
+    for status in picture.teams.values():
+        assert status.clinched == status.in_playoffs
+        assert status.eliminated == (not status.in_playoffs)
+
+
+def test_nothing_is_decided_before_the_season():
+    picture = PlayoffPicture(conference({}, games_played=0))
+    for status in picture.teams.values():
+        assert not status.clinched
+        assert not status.eliminated
+        assert status.clinch_magic > 0
+        assert status.elimination_magic > 0
+
+
+def test_clinch_and_elimination_magic_numbers():
+    # Two games left (max +4); everyone else is on 80 points
+    points = {"A": 90, "B": 84, "P": 70}
+    picture = PlayoffPicture(conference(points, games_played=80))
+
+    # Nobody else can reach 85, so A is in
+    assert picture.status("AAA").clinched
+    # B needs one point more than the 84 every rival can reach; a tie does not clinch
+    assert picture.status("BBB").clinch_magic == 1
+    # P's best is 74, below the 80 that many rivals already have
+    assert picture.status("PPP").eliminated
+    assert not picture.status("CCC").eliminated
+
+
+def test_a_possible_tie_is_not_elimination():
+    # Two games left; everyone else on 80 can still finish on exactly 80
+    picture = PlayoffPicture(conference({"P": 76}, games_played=80))
+    assert not picture.status("PPP").eliminated
+    assert picture.status("PPP").elimination_magic == 1
+
+    # One point fewer and P can no longer even tie
+    picture = PlayoffPicture(conference({"P": 75}, games_played=80))
+    assert picture.status("PPP").eliminated
+
+
+def test_a_tie_at_the_cutoff_decides_nothing():
+    # E and F finish level for the last wild card; only tiebreakers separate them
+    points = ranked_points()
+    points["F"] = points["E"]
+    picture = PlayoffPicture(conference(points))
+    for abbrev in ("EEE", "FFF"):
+        assert not picture.status(abbrev).clinched
+        assert not picture.status(abbrev).eliminated
+    assert picture.status("DDD").clinched
+    assert picture.status("GGG").eliminated
+
+
+def test_cutoff_margin():
+    picture = PlayoffPicture(conference(ranked_points()))
+    wild_cards = picture.conferences["Eastern"]["wild_cards"]
+    first_out = picture.status(picture.conferences["Eastern"]["first_out"])
+    last_in = picture.status(wild_cards[-1])
+    assert last_in.cutoff_diff == last_in.points - first_out.points
+    assert first_out.cutoff_diff == first_out.points - last_in.points
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from services.resilience import CircuitBreaker, CircuitOpen, ResilientCaller, TokenBucket
+
+
+class TransientError(Exception):
+    status_code = 503
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.allow_request()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_breaker_half_open_trial_success_closes():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()  # Only one trial call at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_breaker_half_open_trial_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.05)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    assert breaker.record_failure()  # A single failure in half-open is enough
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def caller(**kwargs):
+    return ResilientCaller(limiter=TokenBucket(rate=None), base_delay=0, **kwargs)
+
+
+def test_transient_failures_are_retried():
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise TransientError()
+        return "ok"
+
+    resilient = caller()
+    assert resilient.call(flaky) == "ok"
+    assert len(attempts) == 3
+    assert resilient.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_bad_requests_are_not_retried_or_counted():
+    attempts = []
+
+    def bad():
+        attempts.append(1)
+        raise ValueError("bad date")
+
+    resilient = caller(breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(ValueError):
+        resilient.call(bad)
+    assert len(attempts) == 1
+    assert resilient.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_circuit_fails_fast():
+    def down():
+        raise TransientError()
+
+    resilient = caller(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60), max_retries=1)
+    with pytest.raises(TransientError):
+        resilient.call(down)
+    with pytest.raises(CircuitOpen):
+        resilient.call(lambda: "never called")
+    assert resilient.metrics()["circuit_state"] == CircuitBreaker.OPEN
+
+
+def test_token_bucket_allows_a_burst_then_waits():
+    bucket = TokenBucket(rate=100, capacity=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() > 0
@@ -0,0 +1,83 @@
+import gzip
+import json
+import random
+
+from services.standings_archive import StandingsArchive
+
+TEAMS = ["TOR", "MTL", "BOS", "OTT", "VAN", "EDM"]
+
+
+def snapshot(date, day):
+    """A league standings payload with the fields that change every day."""
+    rng = random.Random(day)
+    standings = []
+    for index, abbrev in enumerate(TEAMS):
+        standings.append({
+            "date": date,
+            "teamAbbrev": {"default": abbrev},
+            "teamName": {"default": f"Team {abbrev}"},
+            "conferenceName": "Eastern" if index < 4 else "Western",
+            "streakCode": rng.choice("WLO"),
+            "gamesPlayed": day,
+            "points": day + index,
+            "pointPctg": round(rng.random(), 6),
+        })
+    if day > 5:
+        standings[0]["clinchIndicator"] = "x"
+    return {"wildCardIndicator": True, "standings": standings}
+
+
+def dates(count):
+    return [f"2025-10-{day:02d}" for day in range(1, count + 1)]
+
+
+def test_round_trip_with_out_of_order_inserts(tmp_path):
+    path = str(tmp_path / "standings.json.gz")
+    days = {date: snapshot(date, n) for n, date in enumerate(dates(20))}
+    order = list(days)
+    random.Random(1).shuffle(order)
+
+    archive = StandingsArchive(path)
+    for date in order[:10]:
+        archive.put(date, days[date], save=False)
+    archive.save()  # Delta-encodes what is there
+    # Later days now land in front of delta-encoded days
+    for date in order[10:]:
+        archive.put(date, days[date], save=False)
+        for stored in archive.dates():
+            assert archive.get(stored) == days[stored]
+    archive.save()
+
+    reloaded = StandingsArchive(path)
+    assert reloaded.dates() == sorted(days)
+    for date, payload in days.items():
+        assert reloaded.get(date) == payload
+
+
+def test_days_are_delta_encoded_between_keyframes(tmp_path):
+    path = str(tmp_path / "standings.json.gz")
+    archive = StandingsArchive(path)
+    for n, date in enumerate(dates(20)):
+        archive.put(date, snapshot(date, n), save=False)
+    archive.save()
+
+    with gzip.open(path, "rt") as f:
+        stored = json.load(f)
+    keyframes = [date for date in sorted(stored["days"]) if stored["days"][date]["keyframe"]]
+    assert keyframes == ["2025-10-01", "2025-10-15"]
+
+
+def test_team_table_does_not_grow_with_daily_fields(tmp_path):
+    archive = StandingsArchive(str(tmp_path / "standings.json.gz"))
+    for n, date in enumerate(dates(20)):
+        archive.put(date, snapshot(date, n), save=False)
+    assert len(archive._teams) == len(TEAMS)
+
+
+def test_existing_day_is_not_replaced(tmp_path):
+    archive = StandingsArchive(str(tmp_path / "standings.json.gz"))
+    first = snapshot("2025-10-01", 1)
+    archive.put("2025-10-01", first)
+    archive.put("2025-10-01", snapshot("2025-10-01", 2))
+    assert archive.get("2025-10-01") == first
+    assert archive.get("2025-10-02") is None
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+from services.task_graph import DependencyFailed, TaskGraph
+from services.workers import JobCancelled
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def run(app, graph, timeout=5):
+    done = []
+    graph.finished.connect(lambda: done.append(True))
+    graph.start()
+    deadline = time.monotonic() + timeout
+    while not done and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return bool(done)
+
+
+def test_results_flow_to_dependents(app):
+    graph = TaskGraph()
+    graph.add_task("a", lambda: 2)
+    graph.add_task("b", lambda: 3)
+    graph.add_task("sum", lambda a, b: a + b, depends_on=("a", "b"))
+    assert run(app, graph)
+    assert graph.results["sum"] == 5
+
+
+def test_cancelled_task_fails_its_dependents_and_the_graph_finishes(app):
+    def cancelled():
+        raise JobCancelled()
+
+    graph = TaskGraph()
+    graph.add_task("a", cancelled)
+    graph.add_task("b", lambda a: a, depends_on=("a",))
+    graph.add_task("c", lambda: "ok")
+    assert run(app, graph)
+    assert isinstance(graph.errors["a"], JobCancelled)
+    assert isinstance(graph.errors["b"], DependencyFailed)
+    assert graph.results["c"] == "ok"
+
+
+def test_cycles_are_rejected(app):
+    graph = TaskGraph()
+    graph.add_task("a", lambda b: b, depends_on=("b",))
+    graph.add_task("b", lambda a: a, depends_on=("a",))
+    with pytest.raises(ValueError):
+        graph.start()
@@ -0,0 +1,145 @@
+import bisect
+import math
+import time
+
+from PyQt6.QtCore import QPointF, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPixmap, QStaticText
+from PyQt6.QtWidgets import QWidget
+
+from animation import rainbow_color
+
+
+class TickerEntry:
+    """One item on the ticker: its text, how it is drawn and the game it opens."""
+
+    def __init__(self, text, color="#fff", bold=False, game=None, rainbow=False):
+        self.text = text
+        self.color = color
+        self.bold = bold
+        self.game = game
+        self.rainbow = rainbow
+
+
+class TickerWidget(QWidget):
+    """Scrolling ticker painted from one cached pixmap strip.
+
+    The entries are rendered once into a strip that is tiled across the
+    widget and blitted at a sub-pixel offset derived from the time, so a
+    frame costs a couple of drawPixmap calls however many games there are.
+    Rainbow entries are left out of the strip and drawn on top each frame.
+    Call advance() from an animation tick to scroll.
+    """
+
+    game_clicked = pyqtSignal(object)
+
+    SPACING = 40
+    MARGIN = 10
+    FONT_PIXEL_SIZE = 12
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pixels_per_second = 33.0  # The old banner moved 1px every 30 ms
+        self.entries = []
+        self.offset = 0.0
+        self._strip = None
+        self._strip_width = 0.0
+        self._starts = []   # x of each entry in the strip, for mapping clicks
+        self._ends = []
+        self._rainbow = []  # (x, QStaticText, font, phase) drawn over the strip
+        self._started = time.monotonic()
+        self.setFixedHeight(20)
+
+    def set_entries(self, entries):
+        """Replace the ticker contents; the strip is rebuilt on the next paint."""
+        self.entries = list(entries)
+        self._strip = None
+        self.update()
+
+    def advance(self, now=None):
+        """Move to the scroll position for the current time and repaint."""
+        if not self.entries:
+            return
+        if now is None:
+            now = time.monotonic()
+        self.offset = (now - self._started) * self.pixels_per_second
+        self.update()
+
+    def font_for(self, entry):
+        font = QFont(self.font())
+        font.setPixelSize(self.FONT_PIXEL_SIZE)
+        font.setBold(entry.bold)
+        return font
+
+    def _build_strip(self):
+        fonts = [self.font_for(entry) for entry in self.entries]
+        widths = [QFontMetricsF(font).horizontalAdvance(entry.text) for entry, font in zip(self.entries, fonts)]
+        self._starts = []
+        self._ends = []
+        x = self.MARGIN
+        for width in widths:
+            self._starts.append(x)
+            self._ends.append(x + width)
+            x += width + self.SPACING
+        self._strip_width = max(x - self.SPACING + self.MARGIN, 1.0)
+
+        ratio = self.devicePixelRatioF()
+        height = self.height()
+        strip = QPixmap(math.ceil(self._strip_width * ratio), math.ceil(height * ratio))
+        strip.setDevicePixelRatio(ratio)
+        strip.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(strip)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        self._rainbow = []
+        for index, (entry, font, width) in enumerate(zip(self.entries, fonts, widths)):
+            x = self._starts[index]
+            rect = QRectF(x, 0, width, height)
+            if entry.rainbow:
+                static = QStaticText(entry.text)
+                static.setTextFormat(Qt.TextFormat.PlainText)
+                static.prepare(font=font)
+                y = (height - QFontMetricsF(font).height()) / 2
+                # Each rainbow entry offset by 20 degrees for a flowing effect
+                self._rainbow.append((QPointF(x, y), static, font, (len(self._rainbow) * 20) % 360))
+                continue
+            painter.setFont(font)
+            painter.setPen(QColor(entry.color))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, entry.text)
+        painter.end()
+        self._strip = strip
+
+    def paintEvent(self, event):
+        if not self.entries:
+            return
+        if self._strip is None or self._strip.devicePixelRatio() != self.devicePixelRatioF():
+            self._build_strip()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        x = -(self.offset % self._strip_width)
+        while x < self.width():
+            painter.drawPixmap(QPointF(x, 0), self._strip)
+            for point, static, font, phase in self._rainbow:
+                left = x + point.x()
+                if left < self.width() and left + static.size().width() > 0:
+                    painter.setFont(font)
+                    painter.setPen(rainbow_color(phase))
+                    painter.drawStaticText(point + QPointF(x, 0), static)
+            x += self._strip_width
+        painter.end()
+
+    def entry_at(self, x):
+        """Return the entry under widget x coordinate, or None between entries."""
+        if not self.entries or self._strip is None:
+            return None
+        strip_x = (x + self.offset) % self._strip_width
+        index = bisect.bisect_right(self._starts, strip_x) - 1
+        if index < 0:
+            return None
+        return self.entries[index] if strip_x <= self._ends[index] else None
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            entry = self.entry_at(event.position().x())
+            if entry is not None and entry.game:
+                self.game_clicked.emit(entry.game)
+        super().mousePressEvent(event)
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QSpinBox, QHBoxLayout,
     QPushButton, QCalendarWidget
 )
-from nhlpy import NHLClient
+from services import get_data_service, run_job
 
 
 class ComparisonWindow(QDialog):
@@ -12,7 +12,7 @@ class ComparisonWindow(QDialog):
         self.setWindowTitle("Compare Standings")
         self.resize(400, 300)
         self.parent_window = parent
-        self.client = NHLClient()
+        self.data_service = get_data_service()
 
         self.init_ui()
 
@@ -47,9 +47,9 @@ class ComparisonWindow(QDialog):
         # Button layout
         button_layout = QHBoxLayout()
 
-        compare_button = QPushButton("Compare")
-        compare_button.clicked.connect(self.compare)
-        button_layout.addWidget(compare_button)
+        self.compare_button = QPushButton("Compare")
+        self.compare_button.clicked.connect(self.compare)
+        button_layout.addWidget(self.compare_button)
 
         reset_button = QPushButton("Reset")
         reset_button.clicked.connect(self.reset)
@@ -81,14 +81,25 @@ class ComparisonWindow(QDialog):
     def compare(self):
         # Use the spinbox value (days ago)
         selected_date = (datetime.date.today() - datetime.timedelta(days=self.days_spinbox.value())).isoformat()
-        try:
-            comparison_data = self.client.standings.league_standings(date=selected_date)["standings"]
-            comparison_ranks = {team["teamAbbrev"]["default"]: team["leagueSequence"] for team in comparison_data}
-            comparison_stats = {team["teamAbbrev"]["default"]: team for team in comparison_data}
-            self.parent_window.set_comparison_date(comparison_ranks, comparison_stats)
-            self.close()
-        except Exception as e:
-            print(f"Error fetching data for {selected_date}: {e}")
+        self.compare_button.setEnabled(False)
+        self.compare_button.setText("Loading...")
+        run_job(
+            self.data_service.league_standings, selected_date,
+            on_result=self.on_comparison_loaded,
+            on_error=lambda e: self.on_comparison_error(selected_date, e),
+        )
+
+    def on_comparison_loaded(self, payload):
+        comparison_data = payload.get("standings", [])
+        comparison_ranks = {team["teamAbbrev"]["default"]: team["leagueSequence"] for team in comparison_data}
+        comparison_stats = {team["teamAbbrev"]["default"]: team for team in comparison_data}
+        self.parent_window.set_comparison_date(comparison_ranks, comparison_stats)
+        self.close()
+
+    def on_comparison_error(self, selected_date, error):
+        print(f"Error fetching data for {selected_date}: {error}")
+        self.compare_button.setEnabled(True)
+        self.compare_button.setText("Compare")
 
     def reset(self):
         self.parent_window.reset_comparison()
@@ -4,16 +4,18 @@ from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QLabel, QScrollArea, QGridLayout,
     QFrame, QHBoxLayout, QPushButton
 )
-from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtGui import QFont, QColor, QPalette
 from PyQt6.QtWebEngineWidgets import QWebEngineView
+from animation import get_animation_clock
+from services import run_job
 
 
 class GameDetailsWindow(QMainWindow):
-    def __init__(self, game, client):
+    def __init__(self, game, data_service):
         super().__init__()
         self.game = game
-        self.client = client
+        self.data_service = data_service
         self.game_id = game.get("id", "")
         
         # Set window title with improved team detection
@@ -47,19 +49,23 @@ class GameDetailsWindow(QMainWindow):
         self.setWindowTitle(f"{away} @ {home} - Game Details")
         self.resize(900, 700)
         
-        # Timer for live updates
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_game_data)
+        # Live updates run on the shared animation clock, so polling pauses
+        # while this window is hidden or minimized
+        self.update_subscription = None
         self.is_live = False
+        self.update_job = None
         
         self.init_ui()
+        # Show what we already have, then refresh it in the background
+        self.refresh_display()
         self.update_game_data()
         
         # Start timer if game is live
         game_state = game.get("gameState", "")
         if game_state == "LIVE":
             self.is_live = True
-            self.update_timer.start(5000)  # Update every 5 seconds
+            self.update_subscription = get_animation_clock().subscribe(
+                self, lambda now: self.update_game_data(), interval=5.0)  # Update every 5 seconds
     
     def init_ui(self):
         central = QWidget()
@@ -188,23 +194,33 @@ class GameDetailsWindow(QMainWindow):
         self.detail_labels = {}
     
     def update_game_data(self):
-        """Fetch and update game data"""
+        """Fetch fresh game data on a worker thread, then redraw"""
+        if self.update_job is not None:
+            return  # Previous poll still in flight
+
+        # Try to get fresh game data from today's schedule (might have updated data).
+        # Live games bypass the cache so every poll sees new scores.
+        day_str = datetime.date.today().isoformat()
+        self.update_job = run_job(
+            self.data_service.daily_schedule, day_str, force=self.is_live,
+            on_result=self.on_schedule_loaded,
+            on_finished=self.on_update_finished,
+        )
+
+    def on_schedule_loaded(self, sched):
+        # Find our game; if the fetch failed we keep the existing game data
+        for g in sched.get("games", []):
+            if g.get("id") == self.game_id:
+                self.game = g
+                break
+
+    def on_update_finished(self):
+        self.update_job = None
+        self.refresh_display()
+
+    def refresh_display(self):
+        """Update the score, status and details from self.game"""
         try:
-            # Try to get fresh game data
-            # First, try to get from schedule (might have updated data)
-            today = datetime.date.today()
-            day_str = today.isoformat()
-            try:
-                sched = self.client.schedule.daily_schedule(date=day_str)
-                games = sched.get("games", [])
-                # Find our game
-                for g in games:
-                    if g.get("id") == self.game_id:
-                        self.game = g
-                        break
-            except Exception:
-                pass  # Use existing game data if fetch fails
-            
             # Get teams - use venue to determine home/away if needed
             away_team = self.game.get("awayTeam", {})
             home_team = self.game.get("homeTeam", {})
@@ -326,7 +342,7 @@ class GameDetailsWindow(QMainWindow):
             # Stop timer if game is finished
             if game_state in ["FINAL", "OFFICIAL"]:
                 self.is_live = False
-                self.update_timer.stop()
+                self.stop_live_updates()
                 
         except Exception as e:
             print(f"Error updating game data: {e}")
@@ -626,9 +642,15 @@ class GameDetailsWindow(QMainWindow):
         
         return window
     
+    def stop_live_updates(self):
+        if self.update_subscription is not None:
+            get_animation_clock().unsubscribe(self.update_subscription)
+            self.update_subscription = None
+
     def closeEvent(self, event):
-        """Stop timer when window closes"""
-        if self.update_timer.isActive():
-            self.update_timer.stop()
+        """Stop live updates when window closes"""
+        self.stop_live_updates()
+        if self.update_job is not None:
+            self.update_job.cancel()
         event.accept()
 
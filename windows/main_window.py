@@ -2,15 +2,17 @@ import datetime
 import json
 import os
 import math
+import time
 from PyQt6.QtWidgets import (
-    QLabel, QMainWindow, QScrollArea, QTableWidget, QTableWidgetItem,
+    QMainWindow, QTableView,
     QVBoxLayout, QWidget, QAbstractItemView, QHeaderView, QPushButton, QHBoxLayout
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QUrl
-from PyQt6.QtGui import QColor, QPixmap
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
-from nhlpy import NHLClient
-from delegates import FavoriteDelegate
+from PyQt6.QtCore import Qt
+from animation import get_animation_clock
+from delegates import StandingsDelegate
+from models import TEAM_ROLE, StandingsModel, StandingsSortProxy
+from services import TaskGraph, get_data_service, get_logo_service, is_game_final, run_job
+from ticker import TickerEntry, TickerWidget
 from .web_windows import TeamLinesWindow, PlayoffWindow
 from .games_windows import UpcomingWindow, TodaysGamesWindow
 from .comparison_window import ComparisonWindow
@@ -19,46 +21,28 @@ from .game_details_window import GameDetailsWindow
 from .prediction_window import PredictionWindow
 
 
-class ClickableBannerLabel(QLabel):
-    """Clickable label used in the top scrolling banner."""
-    clicked = pyqtSignal()
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
 class MainWindow(QMainWindow):
+    # The Last column is filled from recent league schedules, fetched in
+    # batches of LAST_RESULT_BATCH_DAYS until every team has a final game
+    LAST_RESULT_BATCH_DAYS = 7
+    LAST_RESULT_MAX_DAYS = 28
+    TABLE_LOGO_SIZE = 25
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("NHL Stats")
         self.resize(1000, 700)
 
-        self.client = NHLClient()
-        self.network_manager = QNetworkAccessManager()
-        
-        current_date = datetime.date.today().isoformat()
-        self.standings = self.client.standings.league_standings(date=current_date)["standings"]
-        self.original_standings = list(self.standings)
-
-        yesterday = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
-        try:
-            yesterday_data = self.client.standings.league_standings(date=yesterday)["standings"]
-            self.prev_ranks = {team["teamAbbrev"]["default"]: team["leagueSequence"] for team in yesterday_data}
-        except Exception:
-            self.prev_ranks = {}  # If fetch fails, no arrows
+        self.data_service = get_data_service()
+        self.logo_service = get_logo_service()
 
-        # Get ranks and stats from 2 days ago for comparison (default)
-        two_days_ago = (datetime.date.today() - datetime.timedelta(days=2)).isoformat()
-        try:
-            two_days_data = self.client.standings.league_standings(date=two_days_ago)["standings"]
-            self.two_days_ago_ranks = {team["teamAbbrev"]["default"]: team["leagueSequence"] for team in two_days_data}
-            # Store full 2 days ago data for stat comparisons
-            self.two_days_ago_stats = {team["teamAbbrev"]["default"]: team for team in two_days_data}
-        except Exception:
-            self.two_days_ago_ranks = {}  # If fetch fails, no comparison
-            self.two_days_ago_stats = {}  # If fetch fails, no stat comparisons
+        # Startup data is fetched on worker threads (see start_startup_tasks),
+        # so the window shows immediately and each section fills in as it arrives.
+        self.startup_started = time.perf_counter()
+        self.standings = []
+        self.original_standings = []
+        self.two_days_ago_ranks = {}  # Ranks from 2 days ago for comparison (default)
+        self.two_days_ago_stats = {}  # Full 2 days ago data for stat comparisons
 
         self.current_sort_col = -1      # -1 = original order
         self.current_sort_order = 0     # 0=original, 1=asc, 2=desc
@@ -68,27 +52,24 @@ class MainWindow(QMainWindow):
         self.load_favorites()
         self.comparison_date = None  # For custom date comparison (ranks dict)
         self.comparison_stats = None  # For custom date comparison (full stats dict)
-        self.team_schedule_cache = {}
         self.team_last_game_cache = {}
-        self.last_game_col = -1
-        self.playoff_col = -1
-        self.basic_column_count = 0
 
         self.banner_games_data = []
-        self.banner_scroll_timer = QTimer()
-        self.banner_scroll_timer.timeout.connect(self.advance_banner)
-        self.scroll_speed = 1
-        
-        # Rainbow animation for favorite teams
-        self.rainbow_items = []  # List of (item, row, col) tuples for rainbow animation
-        self.rainbow_banner_labels = []  # List of banner labels that should have rainbow effect
-        self.rainbow_offset = 0  # Current offset in rainbow cycle
-        self.rainbow_timer = QTimer()
-        self.rainbow_timer.timeout.connect(self.update_rainbow_colors)
-        self.rainbow_timer.start(50)  # Update every 50ms for smooth animation
+        self.banner_loading = False
 
         self.init_ui()
-        self.banner_scroll_timer.start(30)
+
+        # The ticker scrolls every frame and the rainbow cells repaint every
+        # 50 ms, both from the shared clock, which pauses while the window is
+        # hidden or minimized and slows down while the app is in the background.
+        self.animation_clock = get_animation_clock()
+        self.animation_clock.subscribe(self.ticker, self.ticker.advance)
+        self.animation_clock.subscribe(self.table, self.update_rainbow_colors, interval=0.05)
+
+        self.start_startup_tasks()
+
+        # Other windows fetching today's schedule keep the ticker current
+        self.data_service.schedule_updated.connect(self.on_schedule_updated)
 
     def init_ui(self):
         central = QWidget()
@@ -96,25 +77,22 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.banner_scroll = QScrollArea()
-        self.banner_scroll.setFixedHeight(20)
-        self.banner_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.banner_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.banner_scroll.setWidgetResizable(False)
-        self.banner_content = QWidget()
-        self.banner_layout = QHBoxLayout(self.banner_content)
-        self.banner_layout.setContentsMargins(10, 0, 10, 0)
-        self.banner_layout.setSpacing(40)
-        self.banner_scroll.setWidget(self.banner_content)
-        self.banner_scroll.setStyleSheet("background: transparent; border: none;")
-        self.banner_content.setStyleSheet("background: transparent;")
-        layout.addWidget(self.banner_scroll)
-
-        self.refresh_banner(force_fetch=False)
+        self.ticker = TickerWidget()
+        self.ticker.game_clicked.connect(self.open_banner_game_details)
+        layout.addWidget(self.ticker)
 
         # === Table setup ===
-        self.table = QTableWidget()
+        # The model holds the standings in API order; sorting only reorders the proxy
+        self.standings_model = StandingsModel(self.logo_service, self.TABLE_LOGO_SIZE, self)
+        self.standings_proxy = StandingsSortProxy(self)
+        self.standings_proxy.setSourceModel(self.standings_model)
+
+        self.table = QTableView()
+        self.table.setModel(self.standings_proxy)
         self.table.setShowGrid(False)
+        self.table.setItemDelegate(StandingsDelegate(
+            self.logo_service.atlas(self.TABLE_LOGO_SIZE),
+            StandingsModel.RANK_COL, StandingsModel.LOGO_COL, self.table))
 
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
@@ -122,11 +100,11 @@ class MainWindow(QMainWindow):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         header.sectionClicked.connect(self.handle_header_click)
 
-        # Connect item clicked signal
-        self.table.itemClicked.connect(self.handle_item_click)
+        # Connect cell clicked signal
+        self.table.clicked.connect(self.handle_item_click)
 
+        self.populate_table(refresh_banner=False)  # The startup graph loads the banner
         self.update_table_columns()
-        self.populate_table()
         self.update_sort_indicator()
 
         layout.addWidget(self.table)
@@ -151,6 +129,7 @@ class MainWindow(QMainWindow):
 
         self.matchup_button = QPushButton("Team Matchup")
         self.matchup_button.clicked.connect(self.open_team_matchup)
+        self.matchup_button.setEnabled(False)  # Needs standings; enabled once loaded
         button_layout.addWidget(self.matchup_button)
 
         self.prediction_button = QPushButton("Daily Picks")
@@ -185,10 +164,10 @@ class MainWindow(QMainWindow):
     def toggle_advanced_mode(self):
         self.advanced_mode = not self.advanced_mode
         self.advanced_button.setText("Disable Advanced Mode" if self.advanced_mode else "Enable Advanced Mode")
-        self.update_table_columns()
         # Don't refresh the top game banner when just toggling column view,
         # so the scroller stays visible and keeps its current content.
         self.populate_table(refresh_banner=False)
+        self.update_table_columns()
         self.update_sort_indicator()
 
     def load_favorites(self):
@@ -213,35 +192,124 @@ class MainWindow(QMainWindow):
         self.save_favorites()
         event.accept()
 
+    def start_startup_tasks(self):
+        """Load everything the window shows as one concurrent task graph.
+
+        Today's standings, the comparison standings and the ticker schedule
+        do not depend on each other and are fetched in parallel; the Last
+        column needs the standings first. Each section renders as soon as
+        its own task finishes instead of waiting for the slowest one.
+        """
+        today = datetime.date.today()
+        two_days_ago = today - datetime.timedelta(days=2)
+
+        self.startup_graph = TaskGraph(self)
+        self.startup_graph.add_task("standings", lambda: self.fetch_standings(today.isoformat()))
+        self.startup_graph.add_task("comparison", lambda: self.fetch_standings(two_days_ago.isoformat()))
+        self.startup_graph.add_task("banner", self.fetch_today_games)
+        self.startup_graph.add_task("last_results", self.fetch_recent_results, depends_on=("standings",))
+        self.startup_graph.task_finished.connect(self.on_startup_task_finished)
+        self.startup_graph.task_failed.connect(self.on_startup_task_failed)
+        self.startup_graph.finished.connect(self.on_startup_finished)
+
+        self.banner_loading = True
+        self.render_banner()
+        self.startup_graph.start()
+
+    def fetch_standings(self, date):
+        """Worker thread: return the standings list as of a YYYY-MM-DD date."""
+        return self.data_service.league_standings(date)["standings"]
+
+    def fetch_recent_results(self, standings):
+        """Worker thread: load recent league schedules until every team has a final game.
+
+        One pass over a few days of daily schedules covers the whole league,
+        instead of a season schedule request per team. The games land in the
+        shared season index, which refresh_last_results() reads.
+        """
+        season_index = self.data_service.season_index
+        teams = [team.get("teamAbbrev", {}).get("default", "") for team in standings]
+        end = datetime.date.today() + datetime.timedelta(days=1)
+        for _ in range(self.LAST_RESULT_MAX_DAYS // self.LAST_RESULT_BATCH_DAYS):
+            start = end - datetime.timedelta(days=self.LAST_RESULT_BATCH_DAYS)
+            self.data_service.schedule_range(start, end, newest_first=True)
+            if all(season_index.last_final_game(abbrev) for abbrev in teams if abbrev):
+                break
+            end = start
+
+    def on_startup_task_finished(self, name, result):
+        if name == "standings":
+            self.on_standings_loaded(result)
+            self.time_to_interactive = time.perf_counter() - self.startup_started
+            print(f"Startup: standings interactive after {self.time_to_interactive * 1000:.0f} ms")
+        elif name == "comparison":
+            self.two_days_ago_ranks = {team["teamAbbrev"]["default"]: team["leagueSequence"] for team in result}
+            self.two_days_ago_stats = {team["teamAbbrev"]["default"]: team for team in result}
+            if self.original_standings:
+                self.populate_table(refresh_banner=False)
+        elif name == "banner":
+            self.on_banner_games_loaded(result)
+        elif name == "last_results":
+            self.refresh_last_results()
+
+    def on_startup_task_failed(self, name, error):
+        print(f"Error loading {name}: {error}")
+        if name == "banner":
+            self.on_banner_games_loaded([])
+
+    def on_startup_finished(self):
+        timings = ", ".join(
+            f"{name} {(end - start) * 1000:.0f} ms"
+            for name, (start, end) in self.startup_graph.timings.items()
+            if end is not None
+        )
+        print(f"Startup: all data loaded after {self.startup_graph.elapsed() * 1000:.0f} ms ({timings})")
+
+    def on_standings_loaded(self, standings):
+        self.original_standings = list(standings)
+        self.standings = list(standings)
+        self.refresh_table()
+        self.matchup_button.setEnabled(True)
+
+    def refresh_table(self):
+        """Re-sort and redraw the table without touching the ticker."""
+        self.populate_table(refresh_banner=False)
+        self.apply_sort()
+        self.update_sort_indicator()
+
     def refresh_banner(self, force_fetch=False):
         """Refresh the rolling ticker with today's matchups."""
-        if force_fetch or not self.banner_games_data:
-            self.banner_games_data = self.fetch_today_games()
+        if (force_fetch or not self.banner_games_data) and not self.banner_loading:
+            self.banner_loading = True
+            run_job(self.fetch_today_games, on_result=self.on_banner_games_loaded)
+        self.render_banner()
+
+    def on_banner_games_loaded(self, games):
+        self.banner_loading = False
+        self.banner_games_data = games
+        self.render_banner()
+
+    def on_schedule_updated(self, date, payload):
+        """Keep the Last column and the ticker current as schedules arrive."""
+        if any(is_game_final(game) for game in payload.get("games", [])):
+            self.refresh_last_results()
+        if date != datetime.date.today().isoformat():
+            return
+        self.banner_games_data = payload.get("games", [])
         self.render_banner()
 
     def fetch_today_games(self):
         today = datetime.date.today().isoformat()
         try:
-            sched = self.client.schedule.daily_schedule(date=today)
+            sched = self.data_service.daily_schedule(today)
             return sched.get("games", [])
         except Exception:
             return []
 
     def render_banner(self):
-        if not hasattr(self, "banner_layout"):
+        if not hasattr(self, "ticker"):
             return
 
-        while self.banner_layout.count():
-            item = self.banner_layout.takeAt(0)
-            if not item:
-                continue
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        # Clear rainbow banner labels list when re-rendering
-        self.rainbow_banner_labels = []
-
         entries = []
         for game in self.banner_games_data:
             away = game.get("awayTeam", {}).get("abbrev", "")
@@ -298,38 +366,22 @@ class MainWindow(QMainWindow):
             entries.append((text, is_favorite, is_live, game, favorite_won))
 
         if not entries:
-            # Show a scrolling message when no games are scheduled today
-            message = "No games scheduled today"
+            # Show a scrolling message while loading or when no games are scheduled today
+            message = "Loading today's games..." if self.banner_loading else "No games scheduled today"
             entries = [(message, False, False, None, False)]
 
-        repeat = 10
-        for _ in range(repeat):
-            for text, is_favorite, is_live, game, favorite_won in entries:
-                label = ClickableBannerLabel(text)
-                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Live games: green text, favorites bold; others: white text, favorites bold
-                # If favorite won, don't set color here - let rainbow animation handle it
-                if favorite_won:
-                    # Will be handled by rainbow animation
-                    style = "font-size: 12px; font-weight: bold;"
-                elif is_live:
-                    style = "color: #0f0; font-size: 12px;"
-                else:
-                    style = "color: #fff; font-size: 12px;"
-                if is_favorite and not favorite_won:
-                    style += " font-weight: bold;"
-                label.setStyleSheet(style)
-                # Store game data on the label and connect click to open details
-                if game:
-                    label.game = game
-                    label.clicked.connect(lambda g=game: self.open_banner_game_details(g))
-                self.banner_layout.addWidget(label)
-                
-                # Add to rainbow list if favorite team won
-                if favorite_won:
-                    self.rainbow_banner_labels.append(label)
-
-        self.banner_content.adjustSize()
+        # Live games: green text, favorites bold; others: white text, favorites bold.
+        # A favorite's win is drawn in rainbow colours by the ticker.
+        self.ticker.set_entries([
+            TickerEntry(
+                text,
+                color="#0f0" if is_live else "#fff",
+                bold=is_favorite,
+                game=game,
+                rainbow=favorite_won,
+            )
+            for text, is_favorite, is_live, game, favorite_won in entries
+        ])
 
     def format_time_for_banner(self, start_time):
         if not start_time:
@@ -344,126 +396,44 @@ class MainWindow(QMainWindow):
     def open_banner_game_details(self, game):
         """Open the detailed game window when a banner entry is clicked."""
         try:
-            self.banner_game_details_window = GameDetailsWindow(game, self.client)
+            self.banner_game_details_window = GameDetailsWindow(game, self.data_service)
             self.banner_game_details_window.show()
         except Exception as e:
             print(f"Failed to open game details from banner: {e}")
 
-    def advance_banner(self):
-        if not hasattr(self, "banner_scroll"):
-            return
-        bar = self.banner_scroll.horizontalScrollBar()
-        if bar.maximum() <= 0:
-            return
-        next_value = bar.value() + self.scroll_speed
-        if next_value >= bar.maximum():
-            next_value = 0
-        bar.setValue(next_value)
-
     def update_table_columns(self):
-        basic_headers = ["Rank", "Logo", "Team", "GP", "W", "L", "OT", "Pts", "ROW", "P%", "GF", "GA", "DIFF", "HOME", "ROAD", "L10", "STREAK", "Last", "Playoffs"]
-        advanced_headers = ["RW", "SOW", "SOL", "Conf", "Div", "Wild"]
-        headers = basic_headers + advanced_headers if self.advanced_mode else basic_headers
-
-        basic_tooltips = [
-            "League Rank", "Team Logo", "Team Abbreviation", "Games Played", "Wins", "Losses",
-            "Overtime Losses", "Points", "Regulation + OT Wins", "Point Percentage",
-            "Goals For", "Goals Against", "Goal Differential",
-            "Home Record (W-L-OT)", "Road Record (W-L-OT)", "Last 10 Games (W-L-OT)", "Current Streak",
-            "Result of most recent game (click to open details)",
-            "Playoff Status (if season ended today)"
-        ]
-        advanced_tooltips = [
-            "Regulation Wins", "Shootout Wins", "Shootout Losses",
-            "Conference Rank", "Division Rank", "Wildcard Rank"
-        ]
-        tooltips = basic_tooltips + advanced_tooltips if self.advanced_mode else basic_tooltips
-
-        self.basic_column_count = len(basic_headers)
-        self.last_game_col = basic_headers.index("Last") if "Last" in basic_headers else -1
-        self.playoff_col = basic_headers.index("Playoffs") if "Playoffs" in basic_headers else -1
-
-        self.table.setColumnCount(len(headers))
-        for col, (text, tip) in enumerate(zip(headers, tooltips)):
-            item = QTableWidgetItem(text)
-            item.setToolTip(tip)
-            self.table.setHorizontalHeaderItem(col, item)
+        # Headers and their tooltips come from StandingsModel.headerData
+        if self.current_sort_col >= self.standings_model.columnCount():
+            # Sorted by an advanced column that is now hidden
+            self.current_sort_col = -1
+            self.current_sort_order = 0
+            self.apply_sort()
 
-        # Enable tooltips for header
-        self.table.horizontalHeader().setToolTip("")
-        
         # Adjust column widths: make Rank and Logo small
-        self.table.setColumnWidth(0, 40)  # Rank
-        self.table.setColumnWidth(1, 40)  # Logo
+        self.table.setColumnWidth(StandingsModel.RANK_COL, 40)
+        self.table.setColumnWidth(StandingsModel.LOGO_COL, 40)
 
-    def handle_item_click(self, item):
-        if item.column() == 0:  # Rank column - toggle favorite
-            # Need to get team abbrev from column 2 now
-            abbrev = self.table.item(item.row(), 2).text()
+    def handle_item_click(self, index):
+        abbrev = index.data(TEAM_ROLE)
+        if index.column() == StandingsModel.RANK_COL:  # Rank column - toggle favorite
             if abbrev in self.favorite_teams:
                 self.favorite_teams.remove(abbrev)
             else:
                 self.favorite_teams.add(abbrev)
             self.populate_table(refresh_banner=False)
             self.update_sort_indicator()
-        elif item.column() == 2:  # Team column - view players
-            full_name = item.toolTip().lower()
+        elif index.column() == StandingsModel.TEAM_COL:  # Team column - view players
+            full_name = (index.data(Qt.ItemDataRole.ToolTipRole) or "").lower()
             full_name = full_name.replace("é", "e").replace(".", "")
             full_name = full_name.replace(" ", "-")
             url = f"https://www.dailyfaceoff.com/teams/{full_name}/line-combinations"
             print(f"Opening URL: {url}")
             self.team_lines_window = TeamLinesWindow(url)
             self.team_lines_window.show()
-        elif self.last_game_col != -1 and item.column() == self.last_game_col:
-            team_item = self.table.item(item.row(), 2)
-            if team_item:
-                abbrev = team_item.text()
+        elif index.column() == StandingsModel.LAST_COL:
+            if abbrev:
                 self.open_team_last_game(abbrev)
 
-    def load_logo(self, abbrev, label_widget):
-        # Map NHL API abbreviations (Keys) to ESPN URL codes (Values)
-        espn_mapping = {
-            "LAK": "la",    # Los Angeles Kings
-            "TBL": "tb",    # Tampa Bay Lightning
-            "NJD": "nj",    # New Jersey Devils
-            "SJS": "sj",    # San Jose Sharks
-            "UTA": "utah",  # Utah Hockey Club
-            "VEG": "vgk"    # Vegas sometimes varies
-        }
-
-        if abbrev in espn_mapping:
-            abbrev = espn_mapping[abbrev]
-        
-        url = f"https://assets.espn.go.com/i/teamlogos/nhl/500/{abbrev}.png"
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        # Use lambda to pass both the reply and the widget to the callback
-        # Explicitly capturing variables (r=reply, w=label_widget) is safer
-        reply.finished.connect(lambda r=reply, w=label_widget: self.on_logo_loaded(r, w))
-
-    def on_logo_loaded(self, reply, label_widget):
-        try:
-            # Check if reply and widget are still valid and no error occurred
-            if reply.error() == reply.NetworkError.NoError:
-                data = reply.readAll()
-                pixmap = QPixmap()
-                pixmap.loadFromData(data)
-                if not pixmap.isNull():
-                    # Ensure label_widget is still valid before setting pixmap
-                    label_widget.setPixmap(pixmap)
-                else:
-                    label_widget.setText("IMG ERR")
-                    label_widget.setStyleSheet("font-size: 8px; color: red;")
-            else:
-                label_widget.setText("ERR")
-                label_widget.setStyleSheet("font-size: 8px; color: red;")
-            
-            reply.deleteLater()
-        except RuntimeError:
-            # This catches "wrapped C/C++ object has been deleted"
-            # If the widget or reply was destroyed (e.g., table refreshed), just ignore.
-            pass
-
     def open_todays_games(self):
         self.todays_window = TodaysGamesWindow()
         self.todays_window.show()
@@ -497,63 +467,76 @@ class MainWindow(QMainWindow):
             print(f"Error opening discussion window: {e}")
 
     def open_team_last_game(self, team_abbrev):
-        """Open the most recent completed game for the provided team."""
+        """Open the most recent completed game for the provided team.
+
+        If the team's season schedule is not indexed yet it is fetched in
+        the background and the game opens once it arrives.
+        """
         if not team_abbrev:
             return
-        result, game = self.get_team_last_game_data(team_abbrev)
+        if team_abbrev in self.team_last_game_cache:
+            self.show_team_last_game(team_abbrev, self.team_last_game_cache[team_abbrev])
+            return
+        run_job(
+            self.find_team_last_game, team_abbrev,
+            on_result=lambda entry: self.on_team_last_game_found(team_abbrev, entry),
+            on_error=lambda e: print(f"Failed to find last game for {team_abbrev}: {e}"),
+        )
+
+    def on_team_last_game_found(self, team_abbrev, entry):
+        self.team_last_game_cache[team_abbrev] = entry
+        self.show_team_last_game(team_abbrev, entry)
+
+    def show_team_last_game(self, team_abbrev, entry):
+        result, game = entry
         if not game:
             print(f"No completed games found for {team_abbrev}")
             return
         try:
-            self.last_game_details_window = GameDetailsWindow(game, self.client)
+            self.last_game_details_window = GameDetailsWindow(game, self.data_service)
             self.last_game_details_window.show()
         except Exception as e:
             print(f"Failed to open last game for {team_abbrev}: {e}")
 
-    def get_last_result_letter(self, team):
-        """Return the last game result letter for display/sorting."""
-        if not team:
-            return "-"
-        streak_code = team.get("streakCode", "")
-        if streak_code in ("W", "L"):
-            return streak_code
-        abbrev = team.get("teamAbbrev", {}).get("default", "")
-        if not abbrev:
-            return "-"
-        result, _ = self.get_team_last_game_data(abbrev)
-        return result if result in ("W", "L") else "-"
+    def refresh_last_results(self):
+        """Recompute every team's last result from the season index (no requests).
 
-    def get_team_last_game_data(self, team_abbrev):
-        """Return the most recent completed game (and result) for a team."""
-        if team_abbrev in self.team_last_game_cache:
-            return self.team_last_game_cache[team_abbrev]
-
-        games = self.get_team_schedule(team_abbrev)
-        last_game = None
-        for game in sorted(games, key=self.get_game_start_time, reverse=True):
-            if self.is_game_final(game):
-                last_game = game
-                break
+        The table is only redrawn when a result actually changed.
+        """
+        season_index = self.data_service.season_index
+        last_games = {}
+        for team in self.original_standings:
+            abbrev = team.get("teamAbbrev", {}).get("default", "")
+            game = season_index.last_final_game(abbrev)
+            if game:
+                last_games[abbrev] = (self.get_game_result_for_team(game, abbrev), game)
+        if any(self.team_last_game_cache.get(abbrev) != entry for abbrev, entry in last_games.items()):
+            self.team_last_game_cache.update(last_games)
+            self.refresh_table()
+
+    def find_team_last_game(self, team_abbrev):
+        """Return (result, game) for the team's most recent completed game.
+
+        May fetch the team's season schedule, so call it from a worker thread.
+        """
+        season_index = self.data_service.season_index
+        if not season_index.has_team_schedule(team_abbrev):
+            self.get_team_schedule(team_abbrev)  # Indexes the whole season
+        last_game = season_index.last_final_game(team_abbrev)
 
         result = "-"
         if last_game:
             result = self.get_game_result_for_team(last_game, team_abbrev)
-
-        self.team_last_game_cache[team_abbrev] = (result, last_game)
-        return self.team_last_game_cache[team_abbrev]
+        return result, last_game
 
     def get_team_schedule(self, team_abbrev):
-        """Fetch (and cache) the team's season schedule."""
-        if team_abbrev in self.team_schedule_cache:
-            return self.team_schedule_cache[team_abbrev]
+        """Fetch the team's season schedule (cached by the data service)."""
         season = self.get_current_season()
         try:
-            schedule = self.client.schedule.team_season_schedule(team_abbr=team_abbrev, season=season)
-            games = schedule.get("games", [])
+            schedule = self.data_service.team_season_schedule(team_abbrev, season)
+            return schedule.get("games", [])
         except Exception:
-            games = []
-        self.team_schedule_cache[team_abbrev] = games
-        return games
+            return []
 
     def get_current_season(self):
         """Return current NHL season string, e.g., 20242025."""
@@ -561,29 +544,6 @@ class MainWindow(QMainWindow):
         start_year = today.year if today.month >= 10 else today.year - 1
         return f"{start_year}{start_year + 1}"
 
-    def get_game_start_time(self, game):
-        """Return datetime for sorting games chronologically."""
-        start_time = game.get("startTimeUTC") or game.get("gameDate")
-        if not start_time:
-            return datetime.datetime.min
-        try:
-            return datetime.datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-        except Exception:
-            return datetime.datetime.min
-
-    def is_game_final(self, game):
-        """Determine whether a schedule entry represents a completed game."""
-        game_state = game.get("gameState", "")
-        game_outcome = game.get("gameOutcome", {})
-        away_score = game.get("awayTeam", {}).get("score")
-        home_score = game.get("homeTeam", {}).get("score")
-        has_scores = (
-            (away_score is not None and away_score != "" and away_score != 0) or
-            (home_score is not None and home_score != "" and home_score != 0)
-        )
-        has_outcome = bool(game_outcome)
-        return game_state in ("FINAL", "OFFICIAL") or has_outcome or (has_scores and game_state == "OFF")
-
     def get_game_result_for_team(self, game, team_abbrev):
         """Return 'W' or 'L' for the provided team based on the game data."""
         away = game.get("awayTeam", {}).get("abbrev", "")
@@ -626,352 +586,37 @@ class MainWindow(QMainWindow):
         self.populate_table(refresh_banner=False)
         self.update_sort_indicator()
 
-    def get_rainbow_color(self, offset):
-        """Generate a rainbow color based on offset (0-360 degrees)"""
-        # Cycle through hue from 0 to 360
-        hue = (offset % 360) / 360.0
-        # Convert HSV to RGB
-        # Using a bright, saturated color
-        saturation = 1.0
-        value = 1.0
-        
-        c = value * saturation
-        x = c * (1 - abs((hue * 6) % 2 - 1))
-        m = value - c
-        
-        if hue < 1/6:
-            r, g, b = c, x, 0
-        elif hue < 2/6:
-            r, g, b = x, c, 0
-        elif hue < 3/6:
-            r, g, b = 0, c, x
-        elif hue < 4/6:
-            r, g, b = 0, x, c
-        elif hue < 5/6:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
-        
-        return QColor(int((r + m) * 255), int((g + m) * 255), int((b + m) * 255))
-    
-    def update_rainbow_colors(self):
-        """Update rainbow colors for all items in rainbow_items and rainbow_banner_labels"""
-        self.rainbow_offset = (self.rainbow_offset + 2) % 360  # Increment by 2 degrees
-        for idx, (item, row, col) in enumerate(self.rainbow_items):
-            if item and self.table.item(row, col) == item:
-                # Add a phase offset based on item index for flowing effect
-                phase_offset = (idx * 30) % 360  # Each item offset by 30 degrees
-                color = self.get_rainbow_color(self.rainbow_offset + phase_offset)
-                item.setForeground(color)
-        
-        # Update rainbow colors for banner labels (scrolling rainbow effect)
-        for idx, label in enumerate(self.rainbow_banner_labels):
-            if label and label.isVisible():
-                # Add a phase offset based on label index for flowing effect
-                # Use a larger offset for banner to create scrolling rainbow effect
-                phase_offset = (idx * 20) % 360  # Each label offset by 20 degrees
-                color = self.get_rainbow_color(self.rainbow_offset + phase_offset)
-                # Update the style sheet with the new color
-                style = f"color: rgb({color.red()}, {color.green()}, {color.blue()}); font-size: 12px; font-weight: bold;"
-                label.setStyleSheet(style)
-    
-    def calculate_playoff_status(self, team):
-        """Calculate if team would make playoffs if season ended today"""
-        div_rank = team.get("divisionSequence", 999)
-        wildcard_rank = team.get("wildcardSequence", 999)
-        conf_rank = team.get("conferenceSequence", 999)
-        points = team.get("points", 0)
-        team_abbrev = team.get("teamAbbrev", {}).get("default", "")
-        
-        # Top 3 in division = in playoffs
-        # Top 2 wild cards = in playoffs
-        in_playoffs = (div_rank <= 3) or (wildcard_rank <= 2)
-        
-        # Find all teams that would make playoffs and get the cutoff points
-        playoff_teams = []
-        for t in self.standings:
-            t_div_rank = t.get("divisionSequence", 999)
-            t_wildcard_rank = t.get("wildcardSequence", 999)
-            if (t_div_rank <= 3) or (t_wildcard_rank <= 2):
-                playoff_teams.append(t)
-        
-        # Sort playoff teams by points (descending) to find the cutoff
-        playoff_teams_sorted = sorted(playoff_teams, key=lambda t: t.get("points", 0), reverse=True)
-        if len(playoff_teams_sorted) >= 8:
-            cutoff_team = playoff_teams_sorted[7]  # 8th team (0-indexed)
-            cutoff_points = cutoff_team.get("points", 0)
-            points_diff = points - cutoff_points
-        else:
-            cutoff_points = points if in_playoffs else 0
-            points_diff = 0
-        
-        # Build status message
-        if in_playoffs:
-            if div_rank <= 3:
-                status = f"✔ IN PLAYOFFS\nDivision rank: {div_rank}/8\n"
-            else:
-                status = f"✔ IN PLAYOFFS\nWild card rank: {wildcard_rank}/8\n"
-            status += f"Conference rank: {conf_rank}/16\nPoints: {points}"
-            if len(playoff_teams_sorted) >= 8 and points_diff > 0:
-                status += f"\n+{points_diff} points ahead of cutoff"
-        else:
-            status = f"✖ OUT OF PLAYOFFS\nDivision rank: {div_rank}/8\nWild card rank: {wildcard_rank}/8\n"
-            status += f"Conference rank: {conf_rank}/16\nPoints: {points}"
-            if len(playoff_teams_sorted) >= 8 and cutoff_points > 0:
-                status += f"\n{abs(points_diff)} points behind cutoff"
-        
-        return in_playoffs, status
-    
-    def get_stat_color(self, abbrev, stat_key, current_value, higher_is_better=True):
-        """Get green/red color based on stat comparison with comparison date (default 2 days ago)"""
-        # Use custom comparison stats or default to 2 days ago
-        if self.comparison_stats:
-            compare_stats = self.comparison_stats
-        else:
-            compare_stats = self.two_days_ago_stats
-        
-        if not compare_stats or abbrev not in compare_stats:
-            return None, None
-        
-        compare_value = compare_stats[abbrev].get(stat_key, 0)
-        
-        # Handle float comparison for pointPctg
-        if isinstance(current_value, float) or isinstance(compare_value, float):
-            current_value = float(current_value)
-            compare_value = float(compare_value)
-        
-        if higher_is_better:
-            if current_value > compare_value:
-                return QColor("green"), compare_value
-            elif current_value < compare_value:
-                return QColor("red"), compare_value
-        else:
-            if current_value < compare_value:
-                return QColor("green"), compare_value
-            elif current_value > compare_value:
-                return QColor("red"), compare_value
-        
-        return None, None
+    def update_rainbow_colors(self, now=None):
+        """Repaint the visible rainbow table cells (the ticker repaints as it scrolls)"""
+        viewport = self.table.viewport()
+        for index in self.standings_model.rainbow_indexes():
+            rect = self.table.visualRect(self.standings_proxy.mapFromSource(index))
+            if rect.intersects(viewport.rect()):
+                viewport.update(rect)
 
     def open_playoff_window(self):
         self.playoff_window = PlayoffWindow()
         self.playoff_window.show()
 
     def populate_table(self, refresh_banner=True):
-        # Clear previous rainbow items
-        self.rainbow_items = []
-        
-        self.table.setRowCount(len(self.standings))
-        favorite_rows = set()
-        
-        for row, team in enumerate(self.standings):
-            abbrev = team.get("teamAbbrev", {}).get("default", "")
-            full_name = team.get('teamName', {}).get('default', '')
-            current_rank = team.get("leagueSequence", "")
-            
-            # Use custom comparison date or 2 days ago
-            if self.comparison_date:
-                compare_ranks = self.comparison_date
-            else:
-                compare_ranks = self.two_days_ago_ranks
-            
-            prev_rank = compare_ranks.get(abbrev, current_rank)
-            delta = prev_rank - current_rank if isinstance(current_rank, int) and isinstance(prev_rank, int) else 0
-            
-            arrow = ""
-            color = None
-            if delta > 0:
-                arrow = " ↑"
-                color = QColor("green")
-            elif delta < 0:
-                arrow = " ↓"
-                color = QColor("red")
-            
-            # Add star if favorited
-            star = "★ " if abbrev in self.favorite_teams else ""
-            rank_item = QTableWidgetItem(f"{star}{current_rank}{arrow}")
-            if color:
-                if color.name() == "#008000" and abbrev in self.favorite_teams:  # Green and favorite
-                    # Add to rainbow items instead of setting green
-                    self.rainbow_items.append((rank_item, row, 0))
-                else:
-                    rank_item.setForeground(color)
-                # Add tooltip showing the rank change
-                if isinstance(current_rank, int) and isinstance(prev_rank, int) and prev_rank != current_rank:
-                    rank_item.setToolTip(f"{prev_rank} → {current_rank}")
-            self.table.setItem(row, 0, rank_item)
-            
-            # --- New Logo Column (Index 1) ---
-            logo_label = QLabel()
-            logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            logo_label.setScaledContents(True)
-            logo_label.setFixedSize(25, 25) # Small fixed size for table row
-            
-            # Create a container widget to center the label in the cell
-            container_widget = QWidget()
-            container_layout = QHBoxLayout(container_widget)
-            container_layout.setContentsMargins(0, 0, 0, 0)
-            container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            container_layout.addWidget(logo_label)
-            
-            self.load_logo(abbrev, logo_label)
-            self.table.setCellWidget(row, 1, container_widget)
-            
-            if abbrev in self.favorite_teams:
-                favorite_rows.add(row)
-
-            team_item = QTableWidgetItem(abbrev)
-            team_item.setToolTip(full_name)
-            self.table.setItem(row, 2, team_item)
-
-            self.table.setItem(row, 3, QTableWidgetItem(str(team.get("gamesPlayed", 0))))
-            
-            # Wins (column 4) - higher is better
-            wins_item = QTableWidgetItem(str(team.get("wins", 0)))
-            wins_color, wins_compare = self.get_stat_color(abbrev, "wins", team.get("wins", 0), higher_is_better=True)
-            if wins_color and wins_compare is not None:
-                wins_item.setForeground(wins_color)
-                wins_item.setToolTip(f"{wins_compare} → {team.get('wins', 0)}")
-            self.table.setItem(row, 4, wins_item)
-            
-            self.table.setItem(row, 5, QTableWidgetItem(str(team.get("losses", 0))))
-            self.table.setItem(row, 6, QTableWidgetItem(str(team.get("otLosses", 0))))
-            
-            # Points (column 7) - higher is better
-            points_item = QTableWidgetItem(str(team.get("points", 0)))
-            points_color, points_compare = self.get_stat_color(abbrev, "points", team.get("points", 0), higher_is_better=True)
-            if points_color and points_compare is not None:
-                points_item.setForeground(points_color)
-                points_item.setToolTip(f"{points_compare} → {team.get('points', 0)}")
-            self.table.setItem(row, 7, points_item)
-            
-            self.table.setItem(row, 8, QTableWidgetItem(str(team.get("regulationPlusOtWins", 0))))
-            
-            # Point Percentage (column 9) - higher is better
-            pctg_value = team.get('pointPctg', 0.0)
-            pctg_item = QTableWidgetItem(f"{pctg_value:.3f}")
-            pctg_color, pctg_compare = self.get_stat_color(abbrev, "pointPctg", pctg_value, higher_is_better=True)
-            if pctg_color and pctg_compare is not None:
-                pctg_item.setForeground(pctg_color)
-                pctg_item.setToolTip(f"{pctg_compare:.3f} → {pctg_value:.3f}")
-            self.table.setItem(row, 9, pctg_item)
-            
-            # Goals For (column 10) - higher is better
-            gf_item = QTableWidgetItem(str(team.get("goalFor", 0)))
-            gf_color, gf_compare = self.get_stat_color(abbrev, "goalFor", team.get("goalFor", 0), higher_is_better=True)
-            if gf_color and gf_compare is not None:
-                gf_item.setForeground(gf_color)
-                gf_item.setToolTip(f"{gf_compare} → {team.get('goalFor', 0)}")
-            self.table.setItem(row, 10, gf_item)
-            
-            # Goals Against (column 11) - lower is better
-            ga_item = QTableWidgetItem(str(team.get("goalAgainst", 0)))
-            ga_color, ga_compare = self.get_stat_color(abbrev, "goalAgainst", team.get("goalAgainst", 0), higher_is_better=False)
-            if ga_color and ga_compare is not None:
-                ga_item.setForeground(ga_color)
-                ga_item.setToolTip(f"{ga_compare} → {team.get('goalAgainst', 0)}")
-            self.table.setItem(row, 11, ga_item)
-            
-            # Goal Differential (column 12) - higher is better
-            diff_item = QTableWidgetItem(str(team.get("goalDifferential", 0)))
-            diff_color, diff_compare = self.get_stat_color(abbrev, "goalDifferential", team.get("goalDifferential", 0), higher_is_better=True)
-            if diff_color and diff_compare is not None:
-                diff_item.setForeground(diff_color)
-                diff_item.setToolTip(f"{diff_compare} → {team.get('goalDifferential', 0)}")
-            self.table.setItem(row, 12, diff_item)
-            home_record = f"{team.get('homeWins',0)}-{team.get('homeLosses',0)}-{team.get('homeOtLosses',0)}"
-            self.table.setItem(row, 13, QTableWidgetItem(home_record))
-            road_record = f"{team.get('roadWins',0)}-{team.get('roadLosses',0)}-{team.get('roadOtLosses',0)}"
-            self.table.setItem(row, 14, QTableWidgetItem(road_record))
-            l10_record = f"{team.get('l10Wins',0)}-{team.get('l10Losses',0)}-{team.get('l10OtLosses',0)}"
-            self.table.setItem(row, 15, QTableWidgetItem(l10_record))
-            streak_code = team.get("streakCode", "")
-            streak_count = team.get("streakCount", 0)
-            streak = f"{streak_code}{streak_count}" if streak_count else ""
-            self.table.setItem(row, 16, QTableWidgetItem(streak))
-
-            # Last game result column
-            if self.last_game_col != -1:
-                last_result = self.get_last_result_letter(team)
-                display_result = last_result if last_result in ("W", "L") else "—"
-                last_item = QTableWidgetItem(display_result)
-                last_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                if display_result == "W":
-                    if abbrev in self.favorite_teams:
-                        self.rainbow_items.append((last_item, row, self.last_game_col))
-                    else:
-                        last_item.setForeground(QColor("green"))
-                elif display_result == "L":
-                    last_item.setForeground(QColor("red"))
-                last_item.setToolTip("Click to open the most recent completed game")
-                self.table.setItem(row, self.last_game_col, last_item)
-            
-            # Playoff status column
-            in_playoffs, playoff_tooltip = self.calculate_playoff_status(team)
-            playoff_symbol = "✔" if in_playoffs else "✖"
-            playoff_item = QTableWidgetItem(playoff_symbol)
-            playoff_item.setToolTip(playoff_tooltip)
-            
-            # Make rainbow colored if it has a check (could go to playoffs) AND it's a favorite team
-            if in_playoffs and abbrev in self.favorite_teams and self.playoff_col != -1:
-                self.rainbow_items.append((playoff_item, row, self.playoff_col))
-            
-            if self.playoff_col != -1:
-                self.table.setItem(row, self.playoff_col, playoff_item)
-
-            if self.advanced_mode:
-                advanced_start = self.basic_column_count
-                advanced_values = [
-                    str(team.get("regulationWins", 0)),
-                    str(team.get("shootoutWins", 0)),
-                    str(team.get("shootoutLosses", 0)),
-                    str(team.get("conferenceSequence", 0)),
-                    str(team.get("divisionSequence", 0)),
-                    str(team.get("wildcardSequence", 0)),
-                ]
-                for offset, value in enumerate(advanced_values):
-                    self.table.setItem(row, advanced_start + offset, QTableWidgetItem(value))
-
-        # Apply favorite highlight delegate
-        delegate = FavoriteDelegate(favorite_rows, self.table)
-        self.table.setItemDelegate(delegate)
+        """Push the standings and display state into the table model.
+
+        Every cell is recomputed once here; the sort proxy keeps the current
+        order, so the view only repaints.
+        """
+        # Use custom comparison date or 2 days ago
+        self.standings_model.update(
+            self.original_standings,
+            self.favorite_teams,
+            self.comparison_date or self.two_days_ago_ranks,
+            self.comparison_stats or self.two_days_ago_stats,
+            self.team_last_game_cache,
+            self.advanced_mode,
+        )
 
         if refresh_banner:
             self.refresh_banner()
 
-    def get_sort_key(self, col):
-        basic_keys = [
-            lambda t: int(t.get("leagueSequence", 999)),
-            lambda t: t.get("teamAbbrev", {}).get("default", "").lower(), # Sort by team abbrev for Logo column
-            lambda t: t.get("teamAbbrev", {}).get("default", "").lower(),
-            lambda t: int(t.get("gamesPlayed", 0)),
-            lambda t: int(t.get("wins", 0)),
-            lambda t: int(t.get("losses", 0)),
-            lambda t: int(t.get("otLosses", 0)),
-            lambda t: int(t.get("points", 0)),
-            lambda t: int(t.get("regulationPlusOtWins", 0)),
-            lambda t: float(t.get("pointPctg", 0)),
-            lambda t: int(t.get("goalFor", 0)),
-            lambda t: int(t.get("goalAgainst", 0)),
-            lambda t: int(t.get("goalDifferential", 0)),
-            lambda t: (t.get("homeWins",0), -t.get("homeLosses",0), -t.get("homeOtLosses",0)),
-            lambda t: (t.get("roadWins",0), -t.get("roadLosses",0), -t.get("roadOtLosses",0)),
-            lambda t: (t.get("l10Wins",0), -t.get("l10Losses",0), -t.get("l10OtLosses",0)),
-            lambda t: (1 if t.get("streakCode", "") == "W" else (-1 if t.get("streakCode", "") == "L" else 0)) * t.get("streakCount", 0),
-            lambda t, self=self: 1 if self.get_last_result_letter(t) == "W" else (-1 if self.get_last_result_letter(t) == "L" else 0),
-            lambda t: (t.get("divisionSequence", 999) <= 3) or (t.get("wildcardSequence", 999) <= 2),  # Playoffs (True = in, False = out)
-        ]
-        advanced_keys = [
-            lambda t: int(t.get("regulationWins", 0)),
-            lambda t: int(t.get("shootoutWins", 0)),
-            lambda t: int(t.get("shootoutLosses", 0)),
-            lambda t: int(t.get("conferenceSequence", 999)),
-            lambda t: int(t.get("divisionSequence", 999)),
-            lambda t: int(t.get("wildcardSequence", 999)),
-        ]
-        keys = basic_keys + advanced_keys if self.advanced_mode else basic_keys
-        return keys[col]
-
     def handle_header_click(self, col):
         if self.current_sort_col == col:
             self.current_sort_order = (self.current_sort_order + 1) % 3
@@ -979,16 +624,21 @@ class MainWindow(QMainWindow):
             self.current_sort_col = col
             self.current_sort_order = 1  # start ascending
 
-        # Actually sort the data
+        self.apply_sort()
+        self.update_sort_indicator()
+
+    def apply_sort(self):
+        """Sort the proxy by the current column and direction; rows are not rebuilt."""
         if self.current_sort_order == 0:
-            self.standings = list(self.original_standings)
+            self.standings_proxy.sort(-1)
         else:
-            key = self.get_sort_key(col)
-            reverse = (self.current_sort_order == 2)
-            self.standings = sorted(self.original_standings, key=key, reverse=reverse)
-
-        self.populate_table(refresh_banner=False)
-        self.update_sort_indicator()
+            order = Qt.SortOrder.AscendingOrder if self.current_sort_order == 1 else Qt.SortOrder.DescendingOrder
+            self.standings_proxy.sort(self.current_sort_col, order)
+        # Keep self.standings in display order (TeamMatchupWindow lists teams this way)
+        self.standings = [
+            self.original_standings[self.standings_proxy.mapToSource(self.standings_proxy.index(row, 0)).row()]
+            for row in range(self.standings_proxy.rowCount())
+        ]
 
     def update_sort_indicator(self):
         header = self.table.horizontalHeader()
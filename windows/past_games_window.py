@@ -1,78 +1,121 @@
 import datetime
+import time
 from PyQt6.QtWidgets import (
-    QMainWindow, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
-    QAbstractItemView, QHeaderView, QLineEdit, QProgressDialog, QApplication
+    QMainWindow, QTableView, QVBoxLayout, QWidget, QAbstractItemView,
+    QHeaderView, QLineEdit, QProgressBar
 )
-from PyQt6.QtCore import Qt
-from nhlpy import NHLClient
+from PyQt6.QtCore import Qt, QTimer
+from facet_bar import FacetBar
+from models import GAME_ROLE, GamesModel, GamesProxy
+from services import get_data_service, run_job, season_start
 from .game_details_window import GameDetailsWindow
 
 
 class PastGamesWindow(QMainWindow):
+    BATCH_INTERVAL = 0.25  # seconds between row batches sent to the table
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Past NHL Games")
         self.resize(800, 600)
 
-        self.client = NHLClient()
-        self.games = []
-
-        # Show a small loading dialog while we fetch a full season of games,
-        # so the user knows the window is working and not frozen.
-        self.fetch_past_games_with_progress()
-        self.original_games = list(self.games)
+        self.data_service = get_data_service()
+        self.load_job = None
 
         self.current_sort_col = -1
         self.current_sort_order = 0
 
         self.init_ui()
 
+        # Rows are streamed into the table as each day arrives, newest first,
+        # so the window is usable (search, sort) while the season loads.
+        self.fetch_past_games_with_progress()
+
     def fetch_past_games_with_progress(self):
         today = datetime.date.today()
-        # Assume season starts on October 1st of the current or previous year
-        if today.month >= 10:
-            start_date = datetime.date(today.year, 10, 1)
-        else:
-            start_date = datetime.date(today.year - 1, 10, 1)
+        start_date = season_start(today)
 
         total_days = (today - start_date).days
 
-        progress = QProgressDialog("Loading past games...", "Cancel", 0, total_days, self)
-        progress.setWindowTitle("Please wait")
-        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
-        progress.setAutoClose(True)
-        progress.setAutoReset(True)
+        # A non-modal progress bar, so the table stays usable while loading
+        self.progress = QProgressBar()
+        self.progress.setRange(0, total_days)
+        self.progress.setMaximumWidth(200)
+        self.statusBar().addPermanentWidget(self.progress)
         # Give it a subtle "terminal" look by using a monospace font
-        progress.setStyleSheet("QLabel { font-family: Consolas, 'Courier New', monospace; }")
-
-        current_date = start_date
-        day_index = 0
+        self.statusBar().setStyleSheet("QStatusBar { font-family: Consolas, 'Courier New', monospace; }")
+        self.spinner_index = 0
+
+        self.load_job = run_job(
+            self.fetch_season_games, start_date, today,
+            with_context=True,
+            on_progress=self.on_load_progress,
+            on_partial=self.model.append_games,
+            on_result=self.on_games_loaded,
+            on_error=self.on_load_error,
+        )
+
+    def fetch_season_games(self, context, start_date, end_date):
+        """Worker thread: stream every game from start_date up to end_date.
+
+        Days after the season's sync watermark are fetched several at a
+        time, then the settled days are read from disk, all newest first;
+        failed days are skipped. Games are sent to the UI thread in batches
+        at most every BATCH_INTERVAL seconds rather than one signal per day.
+        Returns the number of games loaded.
+        """
+        batch = []
+        state = {"count": 0, "last_flush": time.monotonic()}
+
+        def flush():
+            if batch:
+                context.report_partial(list(batch))
+                state["count"] += len(batch)
+                batch.clear()
+            state["last_flush"] = time.monotonic()
+
+        def on_day(day_str, sched):
+            batch.extend(sched.get("games", []))
+
+        def on_progress(done, total, day_str):
+            if time.monotonic() - state["last_flush"] >= self.BATCH_INTERVAL:
+                flush()
+            context.report_progress(done, total, day_str)
+
+        self.data_service.sync_schedule(
+            start_date, end_date,
+            progress_callback=on_progress,
+            day_callback=on_day,
+            is_cancelled=lambda: context.cancelled,
+            newest_first=True,
+        )
+        flush()
+        return state["count"]
+
+    def on_load_progress(self, done, total, day_str):
         spinner = "|/-\\"
-        spinner_index = 0
-
-        while current_date < today:
-            if progress.wasCanceled():
-                break
-
-            day_str = current_date.isoformat()
-            spin_char = spinner[spinner_index % len(spinner)]
-            progress.setLabelText(f"{spin_char} Loading games for {day_str}...")
-            progress.setValue(day_index)
-            spinner_index += 1
+        spin_char = spinner[self.spinner_index % len(spinner)]
+        self.statusBar().showMessage(f"{spin_char} Loading games for {day_str}...")
+        self.progress.setValue(done)
+        self.spinner_index += 1
 
-            # Allow the UI (including the loading dialog) to repaint
-            QApplication.processEvents()
+    def on_games_loaded(self, count):
+        self.statusBar().removeWidget(self.progress)
+        self.statusBar().showMessage(f"Loaded {count} games", 5000)
 
-            try:
-                sched = self.client.schedule.daily_schedule(date=day_str)
-                self.games.extend(sched.get("games", []))
-            except Exception:
-                pass  # Skip if no games or error
+    def on_load_error(self, error):
+        print(f"Error loading past games: {error}")
+        self.statusBar().removeWidget(self.progress)
+        self.statusBar().showMessage(f"Loading stopped after {self.model.rowCount()} games: {error}")
 
-            current_date += datetime.timedelta(days=1)
-            day_index += 1
+    def cancel_loading(self):
+        if self.load_job:
+            self.load_job.cancel()
 
-        progress.setValue(total_days)
+    def closeEvent(self, event):
+        self.cancel_loading()
+        event.accept()
 
     def init_ui(self):
         central = QWidget()
@@ -82,17 +125,28 @@ class PastGamesWindow(QMainWindow):
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search...")
-        self.search_bar.textChanged.connect(self.filter_table)
+        # Filter once typing pauses rather than on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.filter_table(self.search_bar.text()))
+        self.search_bar.textChanged.connect(lambda text: self.search_timer.start())
         layout.addWidget(self.search_bar)
 
-        self.table = QTableWidget()
-        self.table.setShowGrid(False)
-        self.table.setColumnCount(6)
-        headers = ["Date", "Matchup", "Score", "Time (EST)", "Venue", "TV"]
+        self.model = GamesModel(("date", "matchup", "score", "time", "venue", "tv"), self)
+        self.proxy = GamesProxy(self)
+        self.proxy.setSourceModel(self.model)
 
-        for col, text in enumerate(headers):
-            self.table.setHorizontalHeaderItem(col, QTableWidgetItem(text))
+        # Facet filters, refreshed as rows arrive
+        self.facet_bar = FacetBar(parent=self)
+        self.facet_bar.filters_changed.connect(self.proxy.set_facet_filters)
+        self.model.rowsInserted.connect(lambda *args: self.facet_bar.set_facets(self.model.facets))
+        self.model.modelReset.connect(lambda: self.facet_bar.set_facets(self.model.facets))
+        layout.addWidget(self.facet_bar)
 
+        self.table = QTableView()
+        self.table.setShowGrid(False)
+        self.table.setModel(self.proxy)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         header = self.table.horizontalHeader()
@@ -100,82 +154,14 @@ class PastGamesWindow(QMainWindow):
         header.sectionClicked.connect(self.handle_header_click)
 
         # Allow opening matchup details from past games
-        self.table.itemClicked.connect(self.handle_item_click)
+        self.table.clicked.connect(self.handle_item_click)
 
-        self.populate_table()
         self.update_sort_indicator()
 
         layout.addWidget(self.table)
 
-    def populate_table(self):
-        self.table.setRowCount(len(self.games))
-
-        for row, game in enumerate(self.games):
-            away = game.get("awayTeam", {}).get("abbrev", "")
-            home = game.get("homeTeam", {}).get("abbrev", "")
-            matchup = f"{away} @ {home}"
-            away_score = game.get("awayTeam", {}).get("score", "")
-            home_score = game.get("homeTeam", {}).get("score", "")
-            score_str = f"{away_score} - {home_score}"
-
-            # Add OT or SO if applicable
-            period_type = game.get("gameOutcome", {}).get("lastPeriodType", "")
-            if period_type == "OT":
-                score_str += " (OT)"
-            elif period_type == "SO":
-                score_str += " (SO)"
-
-            start_time = game.get("startTimeUTC", "")
-            venue = game.get("venue", {}).get("default", "")
-            tv_broadcasts = game.get("tvBroadcasts", [])
-            tv_str = ", ".join(b.get("network", "") for b in tv_broadcasts) if tv_broadcasts else ""
-
-            # Convert time to EST and 12-hour AM/PM, then extract date from EST
-            time_str = ""
-            game_date = ""
-            if start_time:
-                utc_time = datetime.datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                est_time = utc_time - datetime.timedelta(hours=5)
-                time_str = est_time.strftime("%I:%M %p")
-                game_date = est_time.date().isoformat()
-
-            items = [
-                QTableWidgetItem(game_date),
-                QTableWidgetItem(matchup),
-                QTableWidgetItem(score_str),
-                QTableWidgetItem(time_str),
-                QTableWidgetItem(venue),
-                QTableWidgetItem(tv_str),
-            ]
-
-            for col, item in enumerate(items):
-                self.table.setItem(row, col, item)
-
-            matchup_item = items[1]
-            game_id = game.get("id", "")
-            matchup_item.setData(Qt.ItemDataRole.UserRole, game_id)
-            matchup_item.setData(Qt.ItemDataRole.UserRole + 1, row)
-
     def filter_table(self, text):
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
-
-    def get_sort_key(self, col):
-        keys = [
-            lambda g: datetime.datetime.fromisoformat(g.get("startTimeUTC", "").replace("Z", "+00:00")) if g.get("startTimeUTC") else datetime.datetime.min,  # Date
-            lambda g: f"{g.get('awayTeam', {}).get('abbrev', '')} @ {g.get('homeTeam', {}).get('abbrev', '')}",  # Matchup
-            lambda g: (g.get('awayTeam', {}).get('score', 0), g.get('homeTeam', {}).get('score', 0)),  # Score (sort by away then home score)
-            lambda g: datetime.datetime.fromisoformat(g.get("startTimeUTC", "").replace("Z", "+00:00")) if g.get("startTimeUTC") else datetime.datetime.min,  # Time (same as date for precision)
-            lambda g: g.get("venue", {}).get("default", ""),  # Venue
-            lambda g: ", ".join(b.get("network", "") for b in g.get("tvBroadcasts", [])),  # TV
-        ]
-        return keys[col]
+        self.proxy.set_search_text(text)
 
     def handle_header_click(self, col):
         if self.current_sort_col == col:
@@ -184,17 +170,16 @@ class PastGamesWindow(QMainWindow):
             self.current_sort_col = col
             self.current_sort_order = 1  # start ascending
 
-        # Actually sort the data
+        self.apply_sort()
+        self.update_sort_indicator()
+
+    def apply_sort(self):
+        """Sort the table by the current column and direction; new rows keep the order."""
         if self.current_sort_order == 0:
-            self.games = list(self.original_games)
+            self.proxy.sort(-1)
         else:
-            key = self.get_sort_key(col)
-            reverse = (self.current_sort_order == 2)
-            self.games = sorted(self.original_games, key=key, reverse=reverse)
-
-        self.populate_table()
-        self.update_sort_indicator()
-        self.filter_table(self.search_bar.text())
+            order = Qt.SortOrder.AscendingOrder if self.current_sort_order == 1 else Qt.SortOrder.DescendingOrder
+            self.proxy.sort(self.current_sort_col, order)
 
     def update_sort_indicator(self):
         header = self.table.horizontalHeader()
@@ -205,16 +190,13 @@ class PastGamesWindow(QMainWindow):
             header.setSortIndicator(self.current_sort_col, order)
             header.setSortIndicatorShown(True)
 
-    def handle_item_click(self, item):
+    def handle_item_click(self, index):
         """Open matchup details when matchup column is clicked."""
-        if item.column() == 1:
-            game_id = item.data(Qt.ItemDataRole.UserRole)
-            row = item.data(Qt.ItemDataRole.UserRole + 1)
-            if row is not None and 0 <= row < len(self.games):
-                self.open_game_details(self.games[row])
+        if index.column() == self.model.column_of(GamesModel.MATCHUP_KEY):
+            self.open_game_details(index.data(GAME_ROLE))
 
     def open_game_details(self, game):
         """Show the game details window for a past matchup."""
-        self.game_details_window = GameDetailsWindow(game, self.client)
+        self.game_details_window = GameDetailsWindow(game, self.data_service)
         self.game_details_window.show()
 
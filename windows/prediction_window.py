@@ -5,7 +5,6 @@ from functools import partial
 from collections import defaultdict
 
 from PyQt6.QtWidgets import (
-    QApplication,
     QComboBox,
     QDialog,
     QHeaderView,
@@ -24,7 +23,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 
-from nhlpy import NHLClient
+from services import get_data_service, run_job
 from .game_details_window import GameDetailsWindow
 
 
@@ -36,39 +35,91 @@ class PredictionWindow(QMainWindow):
         self.setWindowTitle("Daily NHL Picks")
         self.resize(820, 540)
 
-        self.client = NHLClient()
+        self.data_service = get_data_service()
         self.prediction_date = datetime.date.today().isoformat()
         self.prediction_file = os.path.join(os.path.expanduser("~"), ".nhl_predictions.json")
         self.games = []
         self.predictions = {}
         self.points = 0
+        # Schedules for the other days with saved picks, fetched off the UI thread
+        self.history_schedules = {}
 
-        self.fetch_todays_games_with_loading()
         self.load_predictions()
         self.init_ui()
         self.populate_table()
+        self.fetch_todays_games_with_loading()
+        self.fetch_history_schedules()
 
-    def fetch_todays_games_with_loading(self):
+    def fetch_todays_games_with_loading(self, force=False):
         today = datetime.date.today()
         day_str = today.isoformat()
 
-        dialog = QProgressDialog("Loading today's games...", None, 0, 0, self)
-        dialog.setWindowTitle("Please wait")
-        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        dialog.setAutoClose(True)
-        dialog.setAutoReset(True)
-        dialog.setMinimumDuration(0)
+        self.dialog = QProgressDialog("Loading today's games...", None, 0, 0, self)
+        self.dialog.setWindowTitle("Please wait")
+        self.dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.dialog.setAutoClose(True)
+        self.dialog.setAutoReset(True)
+        self.dialog.setMinimumDuration(0)
+        self.dialog.show()
+        self.refresh_button.setEnabled(False)
+
+        run_job(
+            self.data_service.daily_schedule, day_str, force=force,
+            on_result=self.on_games_loaded,
+            on_error=self.on_games_error,
+            on_finished=self.on_fetch_finished,
+        )
+
+    def on_games_loaded(self, sched):
+        self.games = sched.get("games", [])
+        self.populate_table()
+
+    def on_games_error(self, error):
+        self.games = []
+        self.populate_table()
+
+    def on_fetch_finished(self):
+        self.dialog.close()
+        self.refresh_button.setEnabled(True)
+
+    def fetch_history_schedules(self):
+        """Load the schedule of every past day with saved picks in the background."""
+        self.stats_button.setEnabled(False)
+        dates = [date_str for date_str in self.load_prediction_data() if date_str != self.prediction_date]
+        run_job(
+            self.load_history_schedules, dates,
+            on_result=self.on_history_loaded,
+            on_error=lambda e: print(f"Error loading prediction history: {e}"),
+            on_finished=lambda: self.stats_button.setEnabled(True),
+        )
 
-        dialog.show()
-        QApplication.processEvents()
+    def load_history_schedules(self, dates):
+        """Worker thread: return {date: games} for the given days, skipping failures."""
+        schedules = {}
+        for date_str in dates:
+            try:
+                schedules[date_str] = self.data_service.daily_schedule(date_str).get("games", [])
+            except Exception as e:
+                print(f"Skipping {date_str} in prediction stats: {e}")
+        return schedules
 
+    def on_history_loaded(self, schedules):
+        self.history_schedules = schedules
+        self.update_points_label()
+
+    def load_prediction_data(self):
+        """All saved picks by date, or {} if the file is missing or unreadable."""
         try:
-            sched = self.client.schedule.daily_schedule(date=day_str)
-            self.games = sched.get("games", [])
-        except Exception:
-            self.games = []
+            with open(self.prediction_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        dialog.close()
+    def games_for_date(self, date_str):
+        """Games for a day with picks: today's live list, or the loaded history (None if not loaded)."""
+        if date_str == self.prediction_date:
+            return self.games
+        return self.history_schedules.get(date_str)
 
     def init_ui(self):
         central = QWidget()
@@ -260,12 +311,11 @@ class PredictionWindow(QMainWindow):
             self.open_game_details(self.games[row])
 
     def open_game_details(self, game):
-        self.details_window = GameDetailsWindow(game, self.client)
+        self.details_window = GameDetailsWindow(game, self.data_service)
         self.details_window.show()
 
     def refresh_games(self):
-        self.fetch_todays_games_with_loading()
-        self.populate_table()
+        self.fetch_todays_games_with_loading(force=True)
 
     def load_predictions(self):
         try:
@@ -386,11 +436,8 @@ class PredictionWindow(QMainWindow):
             for date_str, day_data in data.items():
                 predictions = day_data.get("predictions", {})
                 
-                # Load games for this date
-                try:
-                    sched = self.client.schedule.daily_schedule(date=date_str)
-                    games = sched.get("games", [])
-                except Exception:
+                games = self.games_for_date(date_str)
+                if games is None:
                     continue
                 
                 for game in games:
@@ -434,10 +481,8 @@ class PredictionWindow(QMainWindow):
                     
                 predictions = day_data.get("predictions", {})
                 
-                try:
-                    sched = self.client.schedule.daily_schedule(date=date_str)
-                    games = sched.get("games", [])
-                except Exception:
+                games = self.games_for_date(date_str)
+                if games is None:
                     continue
                 
                 for game in games:
@@ -530,10 +575,8 @@ class PredictionWindow(QMainWindow):
             if not include_today and date_str == self.prediction_date:
                 continue
 
-            try:
-                sched = self.client.schedule.daily_schedule(date=date_str)
-                games = sched.get("games", [])
-            except:
+            games = self.games_for_date(date_str)
+            if games is None:
                 continue
 
             for game in games:
@@ -1,11 +1,10 @@
 import datetime
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QPushButton, QAbstractItemView,
-    QProgressDialog, QApplication
+    QTableWidgetItem, QHeaderView, QPushButton, QAbstractItemView
 )
 from PyQt6.QtCore import Qt
-from nhlpy import NHLClient
+from services import get_data_service, run_job
 
 
 class TeamMatchupWindow(QDialog):
@@ -14,12 +13,12 @@ class TeamMatchupWindow(QDialog):
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self.client = NHLClient()
+        self.data_service = get_data_service()
+        self.season_index = self.data_service.season_index
         self.setWindowTitle("Team Matchup Predictor")
         self.resize(920, 640)
 
         self.team_lookup = self.build_team_lookup()
-        self.schedule_cache = {}
         self.stats_definitions = [
             ("Points", "points"),
             ("Point %", "pointPctg"),
@@ -144,7 +143,29 @@ class TeamMatchupWindow(QDialog):
             self.head_to_head_table.setRowCount(0)
             return
 
-        h2h = self.get_head_to_head_games(team1_abbrev, team2_abbrev)
+        # The prediction needs head-to-head results, so both wait for
+        # team 1's season schedule to be indexed, which happens off the UI thread.
+        if self.season_index.has_team_schedule(team1_abbrev):
+            self.on_team_schedule_loaded(team1_abbrev, team2_abbrev)
+            return
+        self.prediction_label.setText(f"Loading schedule for {team1_abbrev}...")
+        self.head_to_head_summary.setText("")
+        self.head_to_head_table.setRowCount(0)
+        run_job(
+            self.get_team_schedule, team1_abbrev,
+            on_result=lambda schedule: self.on_team_schedule_loaded(team1_abbrev, team2_abbrev),
+        )
+
+    def on_team_schedule_loaded(self, team1_abbrev, team2_abbrev):
+        if (team1_abbrev, team2_abbrev) != (self.team1_combo.currentData(), self.team2_combo.currentData()):
+            return  # Selection changed while loading
+        team1 = self.team_lookup.get(team1_abbrev, {})
+        team2 = self.team_lookup.get(team2_abbrev, {})
+        team1_label = self.get_combo_label(team1, team1_abbrev)
+        team2_label = self.get_combo_label(team2, team2_abbrev)
+
+        h2h = self.get_head_to_head_games(
+            team1_abbrev, team2_abbrev, self.season_index.games_between(team1_abbrev, team2_abbrev))
         team1_strength = self.calculate_strength(team1) + (h2h["team1_wins"] * 1.4)
         team2_strength = self.calculate_strength(team2) + (h2h["team2_wins"] * 1.4)
         self.set_prediction_label(team1_label, team2_label, team1_strength, team2_strength)
@@ -225,43 +246,11 @@ class TeamMatchupWindow(QDialog):
         except (TypeError, ValueError):
             return 0.0
 
-    def get_head_to_head_games(self, team1_abbrev, team2_abbrev):
+    def get_head_to_head_games(self, team1_abbrev, team2_abbrev, pair_games):
+        """Summarise completed games between the two teams (from SeasonIndex.games_between)."""
         games = []
-
-        # Show a small loading dialog when pulling a team's season schedule,
-        # since this can take a few seconds the first time.
-        progress = QProgressDialog(
-            f"Loading schedule for {team1_abbrev}...", None, 0, 0, self
-        )
-        progress.setWindowTitle("Please wait")
-        progress.setWindowModality(Qt.WindowModality.ApplicationModal)
-        progress.setAutoClose(True)
-        progress.setAutoReset(True)
-        progress.setMinimumDuration(0)
-        progress.setStyleSheet("QLabel { font-family: Consolas, 'Courier New', monospace; }")
-
-        spinner = "|/-\\"
-        spinner_index = 0
-        spin_char = spinner[spinner_index % len(spinner)]
-        progress.setLabelText(f"{spin_char} Loading schedule for {team1_abbrev}...")
-        progress.show()
-        QApplication.processEvents()
-
-        team_schedule = self.get_team_schedule(team1_abbrev)
-
-        # Nudge the spinner once more so it visually "moves" at least one step
-        spinner_index += 1
-        spin_char = spinner[spinner_index % len(spinner)]
-        progress.setLabelText(f"{spin_char} Loading schedule for {team1_abbrev}...")
-        QApplication.processEvents()
-
-        progress.close()
-        for game in team_schedule:
+        for game in pair_games:
             home = game.get("homeTeam", {}).get("abbrev", "")
-            away = game.get("awayTeam", {}).get("abbrev", "")
-            if {home, away} != {team1_abbrev, team2_abbrev}:
-                continue
-
             home_score = game.get("homeTeam", {}).get("score")
             away_score = game.get("awayTeam", {}).get("score")
             if home_score is None or away_score is None:
@@ -296,16 +285,12 @@ class TeamMatchupWindow(QDialog):
         return {"games": games_sorted, "summary": summary, "team1_wins": team1_wins, "team2_wins": team2_wins}
 
     def get_team_schedule(self, team_abbrev):
-        if team_abbrev in self.schedule_cache:
-            return self.schedule_cache[team_abbrev]
         season = self.get_current_season()
         try:
-            schedule = self.client.schedule.team_season_schedule(team_abbr=team_abbrev, season=season)
-            games = schedule.get("games", [])
+            schedule = self.data_service.team_season_schedule(team_abbrev, season)
+            return schedule.get("games", [])
         except Exception:
-            games = []
-        self.schedule_cache[team_abbrev] = games
-        return games
+            return []
 
     def get_current_season(self):
         today = datetime.date.today()
@@ -3,23 +3,22 @@ import json
 import os
 from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QWidget, QScrollArea, QLabel, 
-    QFrame, QHBoxLayout, QPushButton, QGridLayout, QProgressDialog, QApplication,
-    QSizePolicy
+    QFrame, QHBoxLayout, QPushButton, QGridLayout, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, QUrl, pyqtSignal
-from PyQt6.QtGui import QColor, QPixmap, QFont, QCursor, QPainter, QPainterPath
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
-from nhlpy import NHLClient
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QCursor, QPainter, QPainterPath
+from services import get_data_service, get_logo_service, run_job
+from services.logos import INVALID_IMAGE, logo_url
 from .game_details_window import GameDetailsWindow
 
 class GameCard(QFrame):
     clicked = pyqtSignal(dict)  # Signal emitting the game data when clicked
+    LOGO_SIZE = 60
 
     def __init__(self, game, favorite_teams, parent=None):
         super().__init__(parent)
         self.game = game
         self.favorite_teams = favorite_teams
-        self.network_manager = QNetworkAccessManager()
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self.setObjectName("GameCard")
         
@@ -68,8 +67,8 @@ class GameCard(QFrame):
 
         # Away Team
         self.away_logo = QLabel()
-        self.away_logo.setFixedSize(60, 60)
-        self.away_logo.setScaledContents(True)
+        self.away_logo.setFixedSize(self.LOGO_SIZE, self.LOGO_SIZE)
+        self.away_logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.load_logo(self.away_abbrev, self.away_logo)
         
         away_layout = QVBoxLayout()
@@ -97,8 +96,8 @@ class GameCard(QFrame):
 
         # Home Team
         self.home_logo = QLabel()
-        self.home_logo.setFixedSize(60, 60)
-        self.home_logo.setScaledContents(True)
+        self.home_logo.setFixedSize(self.LOGO_SIZE, self.LOGO_SIZE)
+        self.home_logo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.load_logo(self.home_abbrev, self.home_logo)
 
         home_layout = QVBoxLayout()
@@ -124,47 +123,24 @@ class GameCard(QFrame):
         super().mousePressEvent(event)
 
     def load_logo(self, abbrev, label_widget):
-        # Map NHL API abbreviations (Keys) to ESPN URL codes (Values)
-        espn_mapping = {
-            "LAK": "la",    # Los Angeles Kings
-            "TBL": "tb",    # Tampa Bay Lightning
-            "NJD": "nj",    # New Jersey Devils
-            "SJS": "sj",    # San Jose Sharks
-            "UTA": "utah",  # Utah Hockey Club
-            "VEG": "vgk"    # Vegas sometimes varies
-        }
-
-        if abbrev in espn_mapping:
-            abbrev = espn_mapping[abbrev]
-        
-        url = f"https://assets.espn.go.com/i/teamlogos/nhl/500/{abbrev}.png"
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self.on_logo_loaded(reply, label_widget))
+        get_logo_service().request(abbrev, self.LOGO_SIZE,
+                                   lambda pixmap, error: self.on_logo_loaded(abbrev, label_widget, pixmap, error))
 
-    def on_logo_loaded(self, reply, label_widget):
-        request_url = reply.request().url().toString()
-        
-        if reply.error() == reply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                label_widget.setPixmap(pixmap)
-            else:
-                label_widget.setText(f"BAD IMG\n{request_url}")
-                label_widget.setToolTip(f"Data downloaded but not a valid image.\nURL: {request_url}")
-                label_widget.setStyleSheet("QLabel { color: #ff5555; font-size: 8px; border: 1px solid #ff5555; padding: 2px; }")
-                label_widget.setWordWrap(True)
-                label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    def on_logo_loaded(self, abbrev, label_widget, pixmap, error):
+        request_url = logo_url(abbrev)
+
+        if pixmap is not None:
+            label_widget.setPixmap(pixmap)
+            return
+
+        if error == INVALID_IMAGE:
+            label_widget.setText(f"BAD IMG\n{request_url}")
         else:
             label_widget.setText(f"LINK ERR\n{request_url}")
-            label_widget.setToolTip(f"Failed to fetch image.\nError: {reply.errorString()}\nURL: {request_url}")
-            label_widget.setStyleSheet("QLabel { color: #ff5555; font-size: 8px; border: 1px solid #ff5555; padding: 2px; }")
-            label_widget.setWordWrap(True)
-            label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-        reply.deleteLater()
+        label_widget.setToolTip(f"{error}\nURL: {request_url}")
+        label_widget.setStyleSheet("QLabel { color: #ff5555; font-size: 8px; border: 1px solid #ff5555; padding: 2px; }")
+        label_widget.setWordWrap(True)
+        label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
     def get_game_state(self):
         state = self.game.get("gameState", "")
@@ -239,16 +215,21 @@ class TodaysGamesWindow(QMainWindow):
         self.setWindowTitle("NHL Schedule")
         self.resize(550, 700)
 
-        self.client = NHLClient()
+        self.data_service = get_data_service()
         self.games = []
         self.favorites_file = os.path.join(os.path.expanduser("~"), ".nhl_favorites.json")
         self.favorite_teams = set()
         
         # Track the current date being viewed
         self.current_date = datetime.date.today()
+        self.fetch_job = None
+        self.loading_date = None  # Date whose fetch is still in flight
         
         self.load_favorites()
         self.init_ui()
+
+        # Pick up fresher data fetched by other windows for the same day
+        self.data_service.schedule_updated.connect(self.on_schedule_updated)
         
         # Load games after UI is ready
         QTimer.singleShot(100, self.fetch_games_with_loading)
@@ -361,7 +342,7 @@ class TodaysGamesWindow(QMainWindow):
             QPushButton:hover { background-color: #555; }
             QPushButton:pressed { background-color: #333; }
         """)
-        refresh_btn.clicked.connect(self.fetch_games_with_loading)
+        refresh_btn.clicked.connect(lambda: self.fetch_games_with_loading(force=True))
         main_layout.addWidget(refresh_btn)
 
     def go_prev_day(self):
@@ -378,28 +359,47 @@ class TodaysGamesWindow(QMainWindow):
         # Format: "October 12, 2023"
         self.date_label.setText(self.current_date.strftime('%B %d, %Y'))
 
-    def fetch_games_with_loading(self):
-        # Show loading only if we don't have games yet or switching days
-        dialog = QProgressDialog(f"Loading games for {self.current_date}...", None, 0, 0, self)
-        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        dialog.setMinimumDuration(0)
-        dialog.setStyleSheet("QProgressDialog { background-color: #333; color: white; }")
-        dialog.show()
-        QApplication.processEvents()
-        
+    def on_schedule_updated(self, date, payload):
+        """Repopulate when the day being viewed gets new data."""
+        # Our own fetch for this date repopulates when it finishes
+        if date != self.current_date.isoformat() or date == self.loading_date:
+            return
+        self.games = payload.get("games", [])
+        self.populate_games_list()
+
+    def fetch_games_with_loading(self, force=False):
+        """Fetch the viewed day's games on a worker thread."""
+        if self.fetch_job:
+            self.fetch_job.cancel()
+
+        # Show loading only when switching days; a refresh keeps the cards up
+        if not force:
+            self.show_message(f"Loading games for {self.current_date}...")
+
         target_date = self.current_date.isoformat()
-        try:
-            sched = self.client.schedule.daily_schedule(date=target_date)
-            self.games = sched.get("games", [])
-            self.populate_games_list()
-        except Exception as e:
-            print(f"Error loading games: {e}")
-            self.games = []
-        
-        dialog.close()
+        self.loading_date = target_date
+        self.fetch_job = run_job(
+            self.data_service.daily_schedule, target_date, force=force,
+            on_result=lambda sched: self.on_games_loaded(target_date, sched),
+            on_error=lambda e: self.on_games_error(target_date, e),
+        )
+
+    def on_games_loaded(self, target_date, sched):
+        if target_date != self.current_date.isoformat():
+            return  # The user moved to another day meanwhile
+        self.loading_date = None
+        self.games = sched.get("games", [])
+        self.populate_games_list()
+
+    def on_games_error(self, target_date, error):
+        if target_date != self.current_date.isoformat():
+            return
+        print(f"Error loading games: {error}")
+        self.loading_date = None
+        self.games = []
+        self.populate_games_list()
 
-    def populate_games_list(self):
-        # Clear existing items
+    def clear_games_list(self):
         while self.games_layout.count():
             child = self.games_layout.takeAt(0)
             if child.widget():
@@ -407,19 +407,29 @@ class TodaysGamesWindow(QMainWindow):
             elif child.spacerItem():
                 self.games_layout.removeItem(child)
 
+    def show_message(self, text):
+        """Replace the game cards with a single centered message."""
+        self.clear_games_list()
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("color: #888; font-size: 16px; margin-top: 50px;")
+        self.games_layout.addWidget(label)
+        self.games_layout.addStretch()
+
+    def populate_games_list(self):
         if not self.games:
-            no_games_label = QLabel("No games scheduled.")
-            no_games_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_games_label.setStyleSheet("color: #888; font-size: 16px; margin-top: 50px;")
-            self.games_layout.addWidget(no_games_label)
-        else:
-            for game in self.games:
-                card = GameCard(game, self.favorite_teams)
-                card.clicked.connect(self.open_game_details)
-                self.games_layout.addWidget(card)
-        
+            self.show_message("No games scheduled.")
+            return
+
+        # Clear existing items
+        self.clear_games_list()
+        for game in self.games:
+            card = GameCard(game, self.favorite_teams)
+            card.clicked.connect(self.open_game_details)
+            self.games_layout.addWidget(card)
+
         self.games_layout.addStretch()
 
     def open_game_details(self, game):
-        self.game_details_window = GameDetailsWindow(game, self.client)
+        self.game_details_window = GameDetailsWindow(game, self.data_service)
         self.game_details_window.show()
@@ -1,63 +1,86 @@
 import datetime
 from PyQt6.QtWidgets import (
-    QMainWindow, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
-    QAbstractItemView, QHeaderView, QPushButton, QLineEdit, QHBoxLayout,
-    QProgressDialog, QApplication
+    QMainWindow, QTableView, QVBoxLayout, QWidget, QAbstractItemView,
+    QHeaderView, QPushButton, QLineEdit, QHBoxLayout, QProgressDialog
 )
-from PyQt6.QtCore import Qt
-from nhlpy import NHLClient
+from PyQt6.QtCore import Qt, QTimer
 from delegates import HighlightDelegate
+from facet_bar import FacetBar
+from models import GAME_ROLE, GamesModel, GamesProxy
+from services import get_data_service, run_job
 from .past_games_window import PastGamesWindow
 from .game_details_window import GameDetailsWindow
 
 
 class UpcomingWindow(QMainWindow):
+    SEARCH_DEBOUNCE_MS = 150
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Upcoming NHL Games")
         self.resize(800, 600)
 
-        self.client = NHLClient()
-        self.games = []
-        self.fetch_upcoming_games_with_progress()
-        self.original_games = list(self.games)
+        self.data_service = get_data_service()
+        self.load_job = None
 
         self.current_sort_col = -1
         self.current_sort_order = 0
 
         self.init_ui()
+        self.fetch_upcoming_games_with_progress()
 
     def fetch_upcoming_games_with_progress(self):
         today = datetime.date.today()
 
-        dialog = QProgressDialog("Loading upcoming games...", None, 0, 0, self)
-        dialog.setWindowTitle("Please wait")
-        dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-        dialog.setAutoClose(True)
-        dialog.setAutoReset(True)
-        dialog.setMinimumDuration(0)
-        dialog.setStyleSheet("QLabel { font-family: Consolas, 'Courier New', monospace; }")
+        self.dialog = QProgressDialog("Loading upcoming games...", None, 0, 0, self)
+        self.dialog.setWindowTitle("Please wait")
+        self.dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.dialog.setAutoClose(True)
+        self.dialog.setAutoReset(True)
+        self.dialog.setMinimumDuration(0)
+        self.dialog.setStyleSheet("QLabel { font-family: Consolas, 'Courier New', monospace; }")
+        self.dialog.show()
+        self.spinner_index = 0
+
+        self.load_job = run_job(
+            self.fetch_week_games, today, today + datetime.timedelta(days=7),
+            with_context=True,
+            on_progress=self.on_load_progress,
+            on_result=self.on_games_loaded,
+            on_error=self.on_load_error,
+            on_finished=self.dialog.close,
+        )
+
+    def fetch_week_games(self, context, start_date, end_date):
+        """Worker thread: return every game from start_date up to end_date."""
+        results = self.data_service.schedule_range(
+            start_date, end_date,
+            progress_callback=context.report_progress,
+            is_cancelled=lambda: context.cancelled,
+        )
+        games = []
+        for _, sched in results:
+            games.extend(sched.get("games", []))
+        return games
+
+    def on_load_progress(self, done, total, day_str):
+        spinner = "|/-\\"
+        spin_char = spinner[self.spinner_index % len(spinner)]
+        self.dialog.setLabelText(f"{spin_char} Loading games for {day_str}...")
+        self.spinner_index += 1
+
+    def on_games_loaded(self, games):
+        self.model.clear()
+        self.model.append_games(games)
 
-        dialog.show()
-        QApplication.processEvents()
+    def on_load_error(self, error):
+        print(f"Error loading upcoming games: {error}")
+        self.statusBar().showMessage(f"Could not load upcoming games: {error}")
 
-        spinner = "|/-\\"
-        spinner_index = 0
-
-        for i in range(7):
-            day = today + datetime.timedelta(days=i)
-            day_str = day.isoformat()
-            spin_char = spinner[spinner_index % len(spinner)]
-            dialog.setLabelText(f"{spin_char} Loading games for {day_str}...")
-            QApplication.processEvents()
-            spinner_index += 1
-            try:
-                sched = self.client.schedule.daily_schedule(date=day_str)
-                self.games.extend(sched.get("games", []))
-            except Exception:
-                pass  # Skip if no games or error
-
-        dialog.close()
+    def closeEvent(self, event):
+        if self.load_job:
+            self.load_job.cancel()
+        event.accept()
 
     def init_ui(self):
         central = QWidget()
@@ -67,28 +90,40 @@ class UpcomingWindow(QMainWindow):
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search...")
-        self.search_bar.textChanged.connect(self.filter_table)
+        # Filter once typing pauses rather than on every keystroke
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.filter_table(self.search_bar.text()))
+        self.search_bar.textChanged.connect(lambda text: self.search_timer.start())
         layout.addWidget(self.search_bar)
 
-        self.table = QTableWidget()
-        self.table.setShowGrid(False)
-        self.table.setColumnCount(5)
-        headers = ["Date", "Matchup", "Time (EST)", "Venue", "TV"]
+        # Today's games get a white border
+        self.model = GamesModel(highlight_date=datetime.date.today().isoformat(), parent=self)
+        self.proxy = GamesProxy(self)
+        self.proxy.setSourceModel(self.model)
 
-        for col, text in enumerate(headers):
-            self.table.setHorizontalHeaderItem(col, QTableWidgetItem(text))
+        # Facet filters, refreshed as rows arrive
+        self.facet_bar = FacetBar(("team", "opponent", "side", "venue", "tv", "dates"), self)
+        self.facet_bar.filters_changed.connect(self.proxy.set_facet_filters)
+        self.model.rowsInserted.connect(lambda *args: self.facet_bar.set_facets(self.model.facets))
+        self.model.modelReset.connect(lambda: self.facet_bar.set_facets(self.model.facets))
+        layout.addWidget(self.facet_bar)
 
+        self.table = QTableView()
+        self.table.setShowGrid(False)
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegate(HighlightDelegate(self.table))
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         header.sectionClicked.connect(self.handle_header_click)
 
-        self.populate_table()
         self.update_sort_indicator()
-        
-        # Connect item clicked signal to handle matchup clicks
-        self.table.itemClicked.connect(self.handle_item_click)
+
+        # Connect clicks to handle matchup clicks
+        self.table.clicked.connect(self.handle_item_click)
 
         layout.addWidget(self.table)
 
@@ -126,86 +161,18 @@ class UpcomingWindow(QMainWindow):
         self.past_window = PastGamesWindow()
         self.past_window.show()
     
-    def handle_item_click(self, item):
+    def handle_item_click(self, index):
         """Handle clicks on matchup column"""
-        if item.column() == 1:  # Matchup column
-            game_id = item.data(Qt.ItemDataRole.UserRole)
-            row = item.data(Qt.ItemDataRole.UserRole + 1)
-            if game_id and row is not None and row < len(self.games):
-                game = self.games[row]
-                self.open_game_details(game)
+        if index.column() == self.model.column_of(GamesModel.MATCHUP_KEY):
+            self.open_game_details(index.data(GAME_ROLE))
     
     def open_game_details(self, game):
         """Open game details window"""
-        self.game_details_window = GameDetailsWindow(game, self.client)
+        self.game_details_window = GameDetailsWindow(game, self.data_service)
         self.game_details_window.show()
 
-    def populate_table(self):
-        self.table.setRowCount(len(self.games))
-        today_str = datetime.date.today().isoformat()
-        highlight_rows = set()
-
-        for row, game in enumerate(self.games):
-            away = game.get("awayTeam", {}).get("abbrev", "")
-            home = game.get("homeTeam", {}).get("abbrev", "")
-            matchup = f"{away} @ {home}"
-            start_time = game.get("startTimeUTC", "")
-            venue = game.get("venue", {}).get("default", "")
-            tv_broadcasts = game.get("tvBroadcasts", [])
-            tv_str = ", ".join(b.get("network", "") for b in tv_broadcasts) if tv_broadcasts else ""
-
-            # Convert time to EST and 12-hour AM/PM, then extract date from EST
-            time_str = ""
-            game_date = ""
-            if start_time:
-                utc_time = datetime.datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                est_time = utc_time - datetime.timedelta(hours=5)
-                time_str = est_time.strftime("%I:%M %p")
-                game_date = est_time.date().isoformat()
-
-            items = [
-                QTableWidgetItem(game_date),
-                QTableWidgetItem(matchup),
-                QTableWidgetItem(time_str),
-                QTableWidgetItem(venue),
-                QTableWidgetItem(tv_str),
-            ]
-
-            for col, item in enumerate(items):
-                self.table.setItem(row, col, item)
-            
-            # Store game ID in matchup item for click handling
-            matchup_item = items[1]  # Matchup is column 1
-            game_id = game.get("id", "")
-            matchup_item.setData(Qt.ItemDataRole.UserRole, game_id)
-            matchup_item.setData(Qt.ItemDataRole.UserRole + 1, row)  # Store row index
-
-            if game_date == today_str:
-                highlight_rows.add(row)
-
-        if highlight_rows:
-            delegate = HighlightDelegate(highlight_rows, self.table)
-            self.table.setItemDelegate(delegate)
-
     def filter_table(self, text):
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
-
-    def get_sort_key(self, col):
-        keys = [
-            lambda g: datetime.datetime.fromisoformat(g.get("startTimeUTC", "").replace("Z", "+00:00")) if g.get("startTimeUTC") else datetime.datetime.min,  # Date
-            lambda g: f"{g.get('awayTeam', {}).get('abbrev', '')} @ {g.get('homeTeam', {}).get('abbrev', '')}",  # Matchup
-            lambda g: datetime.datetime.fromisoformat(g.get("startTimeUTC", "").replace("Z", "+00:00")) if g.get("startTimeUTC") else datetime.datetime.min,  # Time
-            lambda g: g.get("venue", {}).get("default", ""),  # Venue
-            lambda g: ", ".join(b.get("network", "") for b in g.get("tvBroadcasts", [])),  # TV
-        ]
-        return keys[col]
+        self.proxy.set_search_text(text)
 
     def handle_header_click(self, col):
         if self.current_sort_col == col:
@@ -214,17 +181,16 @@ class UpcomingWindow(QMainWindow):
             self.current_sort_col = col
             self.current_sort_order = 1  # start ascending
 
-        # Actually sort the data
+        self.apply_sort()
+        self.update_sort_indicator()
+
+    def apply_sort(self):
+        """Sort the table by the current column and direction."""
         if self.current_sort_order == 0:
-            self.games = list(self.original_games)
+            self.proxy.sort(-1)
         else:
-            key = self.get_sort_key(col)
-            reverse = (self.current_sort_order == 2)
-            self.games = sorted(self.original_games, key=key, reverse=reverse)
-
-        self.populate_table()
-        self.update_sort_indicator()
-        self.filter_table(self.search_bar.text())
+            order = Qt.SortOrder.AscendingOrder if self.current_sort_order == 1 else Qt.SortOrder.DescendingOrder
+            self.proxy.sort(self.current_sort_col, order)
 
     def update_sort_indicator(self):
         header = self.table.horizontalHeader()